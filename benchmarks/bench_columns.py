@@ -0,0 +1,99 @@
+"""
+Time to turn a 50k-run sweep into per-field columns.
+
+The baseline dumps every config and flattens the nested dicts into one row
+per run, then builds the columns from the rows (what a pandas
+``json_normalize`` does). ``to_columns`` reads the leaf attributes directly,
+one pass per column, and dictionary-encodes strings and union tags.
+
+Usage:
+    python benchmarks/bench_columns.py
+"""
+
+import time
+from typing import Literal
+
+import numpy as np
+
+from pydantic_config import BaseConfig
+from pydantic_config.columns import to_columns
+
+N_RUNS = 50_000
+
+
+class AdamConfig(BaseConfig):
+    type: Literal["adam"] = "adam"
+    lr: float = 1e-3
+    weight_decay: float = 0.01
+
+
+class SGDConfig(BaseConfig):
+    type: Literal["sgd"] = "sgd"
+    lr: float = 0.1
+    momentum: float = 0.9
+
+
+class DataConfig(BaseConfig):
+    path: str = "/data/train"
+    seq_len: int = 2048
+    batch_size: int = 32
+
+
+class WandbConfig(BaseConfig):
+    project: str = "sweep"
+    entity: str = "team"
+
+
+class RunConfig(BaseConfig):
+    seed: int = 0
+    name: str = "run"
+    optimizer: AdamConfig | SGDConfig = AdamConfig()
+    data: DataConfig = DataConfig()
+    wandb: WandbConfig | None = None
+    max_steps: int | None = None
+
+
+def make_configs() -> list[RunConfig]:
+    return [
+        RunConfig(
+            seed=i,
+            name=f"run-{i % 100}",
+            optimizer=SGDConfig(lr=0.01 * (i % 7)) if i % 3 else AdamConfig(lr=1e-4 * (i % 5)),
+            data=DataConfig(seq_len=[1024, 2048][i % 2]),
+            wandb=WandbConfig() if i % 4 == 0 else None,
+            max_steps=i if i % 2 else None,
+        )
+        for i in range(N_RUNS)
+    ]
+
+
+def flatten(data: dict, prefix: str = "", out: dict | None = None) -> dict:
+    out = {} if out is None else out
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flatten(value, path, out)
+        else:
+            out[path] = value
+    return out
+
+
+def dump_and_flatten(configs: list[RunConfig]) -> dict[str, np.ndarray]:
+    rows = [flatten(config.model_dump()) for config in configs]
+    paths = dict.fromkeys(path for row in rows for path in row)
+    return {path: np.array([row.get(path) for row in rows], dtype=object) for path in paths}
+
+
+def bench(fn, configs: list[RunConfig]) -> float:
+    fn(configs)
+    start = time.perf_counter()
+    fn(configs)
+    return (time.perf_counter() - start) * 1e3
+
+
+if __name__ == "__main__":
+    configs = make_configs()
+    print(f"{N_RUNS} runs")
+    print(f"{'method':<22} {'time (ms)':>10}")
+    for name, fn in (("model_dump + flatten", dump_and_flatten), ("to_columns", to_columns)):
+        print(f"{name:<22} {bench(fn, configs):>10.1f}")
@@ -0,0 +1,114 @@
+"""
+Cost of coercing CLI strings in dict fields with 100k entries.
+
+BaseConfig compiles the coercion of each dict field from its annotation:
+typed values (``dict[str, float]``) are converted by pydantic in its typed
+pass, and only untyped values (``dict[str, Any]``) are guessed. The
+"guess every value" column reproduces the previous behaviour, which ran
+``int()``/``float()`` round trips on every string of every dict field.
+
+Usage:
+    python benchmarks/bench_dict_coercion.py
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from pydantic_config import BaseConfig, cli
+
+N_ENTRIES = 100_000
+REPEATS = 5
+
+
+def guess_str_value(v: str) -> bool | int | float | str:
+    if v.lower() == "true":
+        return True
+    if v.lower() == "false":
+        return False
+    try:
+        int_val = int(v)
+        if str(int_val) == v:
+            return int_val
+    except ValueError:
+        pass
+    try:
+        float_val = float(v)
+        if str(float_val) == v:
+            return float_val
+    except ValueError:
+        pass
+    return v
+
+
+class GuessEveryValue(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _guess(cls, data: dict) -> dict:
+        for name in cls.model_fields:
+            val = data.get(name)
+            if isinstance(val, dict) and val and all(isinstance(v, str) for v in val.values()):
+                data[name] = {k: guess_str_value(v) for k, v in val.items()}
+        return data
+
+
+class Weights(BaseConfig):
+    weights: dict[str, float] = {}
+
+
+class GuessedWeights(GuessEveryValue):
+    weights: dict[str, float] = {}
+
+
+class Kwargs(BaseConfig):
+    kwargs: dict[str, Any] = {}
+
+
+class GuessedKwargs(GuessEveryValue):
+    kwargs: dict[str, Any] = {}
+
+
+def timed(func) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+if __name__ == "__main__":
+    str_weights = {f"class_{i}": str(i / 7) for i in range(N_ENTRIES)}
+    str_kwargs = {f"key_{i}": str(i) if i % 2 else f"{i / 4}" for i in range(N_ENTRIES)}
+    weights_json = json.dumps({f"class_{i}": i / 7 for i in range(N_ENTRIES)})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "weights.json")
+        with open(path, "w") as f:
+            f.write(json.dumps({"weights": json.loads(weights_json)}))
+
+        rows = [
+            (
+                "dict[str, float], CLI strings",
+                lambda: Weights.model_validate({"weights": dict(str_weights)}),
+                lambda: GuessedWeights.model_validate({"weights": dict(str_weights)}),
+            ),
+            (
+                "dict[str, Any], CLI strings",
+                lambda: Kwargs.model_validate({"kwargs": dict(str_kwargs)}),
+                lambda: GuessedKwargs.model_validate({"kwargs": dict(str_kwargs)}),
+            ),
+            ("dict[str, float], --weights '{...}'", lambda: cli(Weights, args=["--weights", weights_json]), None),
+            ("dict[str, float], @ file", lambda: cli(Weights, args=["@", path]), None),
+        ]
+        print(f"{N_ENTRIES} entries, best of {REPEATS}")
+        print(f"{'case':<38} {'compiled (ms)':>14} {'guess every value (ms)':>23}")
+        for name, compiled, guessed in rows:
+            guessed_ms = f"{timed(guessed):>23.1f}" if guessed else f"{'-':>23}"
+            print(f"{name:<38} {timed(compiled):>14.1f} {guessed_ms}")
@@ -0,0 +1,78 @@
+"""
+Memory and validation time of a 10k-config sweep with repeated sub-configs.
+
+Every run of the sweep has its own seed, but only a handful of distinct
+optimizer and data sub-configs. With FrozenConfig sub-configs, each distinct
+sub-config is validated once and stored once; plain BaseConfig sub-configs
+are validated and stored per run.
+
+Usage:
+    python benchmarks/bench_interning.py
+"""
+
+import time
+import tracemalloc
+
+from pydantic_config import BaseConfig, FrozenConfig
+
+N_RUNS = 10_000
+
+
+def make_run_config(base: type[BaseConfig]) -> type[BaseConfig]:
+    class OptimizerConfig(base):
+        name: str = "adamw"
+        lr: float = 1e-3
+        betas: tuple[float, float] = (0.9, 0.999)
+        weight_decay: float = 0.01
+        schedule: list[float] = [0.0, 0.1, 1.0]
+
+    class DataConfig(base):
+        path: str = "/data/train"
+        seq_len: int = 2048
+        batch_size: int = 32
+        mixture: dict[str, float] = {"web": 0.7, "code": 0.2, "books": 0.1}
+
+    class RunConfig(BaseConfig):
+        seed: int = 0
+        optimizer: OptimizerConfig = OptimizerConfig()
+        data: DataConfig = DataConfig()
+
+    return RunConfig
+
+
+def sweep_inputs() -> list[dict]:
+    return [
+        {
+            "seed": i,
+            "optimizer": {"lr": [1e-4, 3e-4, 1e-3][i % 3], "weight_decay": 0.1},
+            "data": {"seq_len": [1024, 2048][i % 2], "mixture": {"web": 0.5, "code": 0.5}},
+        }
+        for i in range(N_RUNS)
+    ]
+
+
+def bench(base: type[BaseConfig]) -> tuple[float, float]:
+    # Fresh classes for each pass, so nothing is interned up front.
+    run_config = make_run_config(base)
+    inputs = sweep_inputs()
+    start = time.perf_counter()
+    configs = [run_config.model_validate(data) for data in inputs]
+    seconds = time.perf_counter() - start
+    del configs
+
+    run_config = make_run_config(base)
+    inputs = sweep_inputs()
+    tracemalloc.start()
+    configs = [run_config.model_validate(data) for data in inputs]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(configs) == N_RUNS
+    return seconds * 1e3, memory / 2**20
+
+
+if __name__ == "__main__":
+    print(f"{N_RUNS} runs")
+    print(f"{'sub-configs':<14} {'validate (ms)':>14} {'memory (MiB)':>13}")
+    for base in (BaseConfig, FrozenConfig):
+        ms, mib = bench(base)
+        print(f"{base.__name__:<14} {ms:>14.1f} {mib:>13.2f}")
@@ -0,0 +1,123 @@
+"""
+Pickle size and time of a large config, compact vs pydantic's default pickling.
+
+The config has a 48-layer model section (one sub-config per layer, each with
+a union-typed attention block) and a 2000-entry list of data sources, close
+to what a DataLoader worker receives. The default pickling writes the class
+and ``__dict__`` of every sub-model; the compact form writes the schema
+fingerprint once and a flat tuple of field values.
+
+Usage:
+    python benchmarks/bench_pickle.py
+"""
+
+import pickle
+import time
+from typing import Literal
+
+from pydantic import BaseModel
+
+from pydantic_config import BaseConfig
+
+N_LAYERS = 48
+N_SOURCES = 2000
+REPEATS = 20
+
+
+class DenseAttention(BaseConfig):
+    type: Literal["dense"] = "dense"
+    n_heads: int = 16
+    head_dim: int = 64
+    dropout: float = 0.0
+    rope_theta: float = 10000.0
+
+
+class SlidingAttention(BaseConfig):
+    type: Literal["sliding"] = "sliding"
+    n_heads: int = 16
+    head_dim: int = 64
+    window: int = 4096
+
+
+class LayerConfig(BaseConfig):
+    hidden: int = 1024
+    ffn_mult: float = 4.0
+    activation: str = "swiglu"
+    norm: str = "rmsnorm"
+    norm_eps: float = 1e-6
+    attention: DenseAttention | SlidingAttention = DenseAttention()
+    checkpoint: bool = False
+
+
+class ModelConfig(BaseConfig):
+    vocab_size: int = 32000
+    layers: list[LayerConfig] = []
+    tie_embeddings: bool = True
+
+
+class SourceConfig(BaseConfig):
+    path: str = "/data/shard"
+    weight: float = 1.0
+    format: str = "parquet"
+    text_column: str = "text"
+    max_len: int | None = None
+
+
+class DataConfig(BaseConfig):
+    sources: list[SourceConfig] = []
+    seq_len: int = 4096
+    shuffle_buffer: int = 10000
+
+
+class RunConfig(BaseConfig):
+    name: str = "run"
+    seed: int = 0
+    model: ModelConfig = ModelConfig()
+    data: DataConfig = DataConfig()
+    tags: list[str] = []
+
+
+def make_config() -> RunConfig:
+    return RunConfig.model_validate(
+        {
+            "name": "large",
+            "model": {
+                "layers": [
+                    {"attention": {"type": "sliding", "window": 1024}} if i % 4 else {"checkpoint": True}
+                    for i in range(N_LAYERS)
+                ]
+            },
+            "data": {"sources": [{"path": f"/data/shard-{i:05d}", "weight": 1 / (1 + i)} for i in range(N_SOURCES)]},
+            "tags": ["bench"],
+        }
+    )
+
+
+def best_ms(fn) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def bench(config: RunConfig) -> tuple[int, float, float]:
+    payload = pickle.dumps(config, pickle.HIGHEST_PROTOCOL)
+    assert pickle.loads(payload) == config
+    dumps = best_ms(lambda: pickle.dumps(config, pickle.HIGHEST_PROTOCOL))
+    loads = best_ms(lambda: pickle.loads(payload))
+    return len(payload), dumps, loads
+
+
+if __name__ == "__main__":
+    config = make_config()
+    print(f"{N_LAYERS} layers, {N_SOURCES} data sources")
+    print(f"{'pickling':<10} {'size (KiB)':>11} {'dumps (ms)':>11} {'loads (ms)':>11}")
+    size, dumps, loads = bench(config)
+    compact = ("compact", size, dumps, loads)
+    # pydantic's own pickling, bypassing BaseConfig.__reduce_ex__
+    BaseConfig.__reduce_ex__ = BaseModel.__reduce_ex__  # type: ignore[method-assign]
+    size, dumps, loads = bench(config)
+    for name, size, dumps, loads in (("default", size, dumps, loads), compact):
+        print(f"{name:<10} {size / 1024:>11.1f} {dumps:>11.2f} {loads:>11.2f}")
@@ -0,0 +1,54 @@
+"""
+Validation cost of ``type``-tagged unions as the number of variants grows.
+
+BaseConfig wires such unions up as pydantic discriminators automatically, so
+the tag is looked up in a table. A plain BaseModel union without a
+discriminator tries the variants one by one.
+
+Usage:
+    python benchmarks/bench_union_dispatch.py
+"""
+
+import time
+from typing import Literal, Union
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+from pydantic_config import BaseConfig
+
+REPEATS = 2000
+
+
+def make_union(base: type[BaseModel], n_variants: int) -> type[BaseModel]:
+    variants = tuple(
+        create_model(
+            f"Variant{i}",
+            __base__=base,
+            type=(Literal[f"v{i}"], f"v{i}"),
+            lr=(float, 1e-3),
+            steps=(int, 10),
+        )
+        for i in range(n_variants)
+    )
+    return create_model("Config", __base__=base, optimizer=(Union[variants], variants[0]()))
+
+
+def bench(config_cls: type[BaseModel], n_variants: int) -> float:
+    # Select the last variant, the worst case for trying variants in order.
+    data = {"optimizer": {"type": f"v{n_variants - 1}", "lr": "0.1", "steps": "5"}}
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        config_cls.model_validate({"optimizer": dict(data["optimizer"])})
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+class PlainModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+if __name__ == "__main__":
+    print(f"{'variants':>8} {'BaseConfig (us)':>16} {'plain union (us)':>17}")
+    for n in (2, 10, 50, 100, 200):
+        tagged = bench(make_union(BaseConfig, n), n)
+        plain = bench(make_union(PlainModel, n), n)
+        print(f"{n:>8} {tagged:>16.1f} {plain:>17.1f}")
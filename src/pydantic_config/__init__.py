@@ -1,5 +1,16 @@
 __version__ = "0.3.0"
 
-from pydantic_config.cli import cli, BaseConfig, ConfigFileError
+from pydantic_config.cli import cli, acli, config_hash, BaseConfig, FrozenConfig, ConfigFileError
+from pydantic_config.provenance import explain
+from pydantic_config.registry import VariantRegistry
 
-__all__ = ["cli", "BaseConfig", "ConfigFileError"]
+__all__ = [
+    "cli",
+    "acli",
+    "config_hash",
+    "explain",
+    "BaseConfig",
+    "FrozenConfig",
+    "ConfigFileError",
+    "VariantRegistry",
+]
@@ -0,0 +1,28 @@
+"""
+Command line tools:
+    python -m pydantic_config validate pkg.module:Config configs/**/*.toml
+    python -m pydantic_config serve [--socket PATH]
+    python -m pydantic_config completion bash train.py pkg.module:Config
+"""
+
+import sys
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    commands = {
+        "validate": "pydantic_config.validate",
+        "serve": "pydantic_config.server",
+        "completion": "pydantic_config.completion",
+    }
+    if not argv or argv[0] not in commands:
+        print(f"usage: python -m pydantic_config {{{','.join(commands)}}} ...", file=sys.stderr)
+        return 2
+
+    import importlib
+
+    return importlib.import_module(commands[argv[0]]).main(argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
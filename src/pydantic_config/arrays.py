@@ -0,0 +1,221 @@
+"""
+NumPy array fields set from .npy/.npz files or compact CLI literals.
+
+Usage:
+    from pydantic_config import BaseConfig
+    from pydantic_config.arrays import NDArray
+
+    class Config(BaseConfig):
+        class_weights: NDArray("float32", shape=(None,)) = "weights.npy"
+        lr_mult: NDArray("float64", shape=(12,)) = "1.0*12"
+
+    python train.py --class-weights runs/weights.npz:class_weights --lr-mult "0.5*4,1.0*8"
+
+A field accepts:
+    - a ``.npy`` path, memory-mapped read-only (no copy, nothing read up front)
+    - ``file.npz:key`` (or ``file.npz`` with a single array), memory-mapped
+      when the archive is uncompressed as written by ``np.savez``
+    - a compact literal: comma or space separated numbers, ``value*count``
+      repeats a value (``"0.5*1000,1.0"``), optional surrounding brackets
+    - a list or an ndarray
+
+Values are checked against ``dtype`` and ``shape`` (``None`` matches any
+length) without converting them to Python lists. File references stay
+strings while config layers are merged, and ``model_dump()`` returns the
+arrays themselves. JSON dumps write file-backed arrays as their file
+reference and other arrays as lists. Configs holding arrays compare equal
+when their arrays have the same shape and values.
+
+Requires numpy (``pip install numpy``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import zipfile
+from typing import TYPE_CHECKING, Annotated, Any
+
+import tyro
+from pydantic import Field
+from pydantic_core import core_schema
+
+from pydantic_config.cli import HASH_CONTEXT_KEY, _IdentityMemo
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy array fields require numpy. Install with: pip install numpy") from None
+    return numpy
+
+
+# File reference of each memory-mapped array, for JSON dumps
+_SOURCES = _IdentityMemo()
+# Content digest of each array dumped for config_hash (arrays are read-only)
+_DIGESTS = _IdentityMemo()
+
+
+def _mmap_npz_member(path: str, key: str | None) -> np.ndarray:
+    """Memory-map one array of an uncompressed .npz archive (loaded in memory otherwise)."""
+    np = _numpy()
+    with zipfile.ZipFile(path) as archive:
+        members = [name[: -len(".npy")] for name in archive.namelist() if name.endswith(".npy")]
+        if key is None:
+            if len(members) != 1:
+                raise ValueError(f"{path} holds {len(members)} arrays, select one with '{path}:<key>' from {members}")
+            key = members[0]
+        if key not in members:
+            raise ValueError(f"{path} has no array {key!r}, expected one of {members}")
+        info = archive.getinfo(f"{key}.npy")
+
+    if info.compress_type == zipfile.ZIP_STORED:
+        with open(path, "rb") as f:
+            f.seek(info.header_offset)
+            name_len, extra_len = struct.unpack("<HH", f.read(_ZIP_LOCAL_HEADER_SIZE)[26:30])
+            f.seek(info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_len + extra_len)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            offset = f.tell()
+        if not dtype.hasobject:
+            order = "F" if fortran_order else "C"
+            return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order)
+
+    with np.load(path) as archive:
+        array = archive[key]
+    array.flags.writeable = False
+    return array
+
+
+def _load_array_file(ref: str) -> np.ndarray:
+    """Memory-map ``file.npy``, ``file.npz`` or ``file.npz:key``."""
+    np = _numpy()
+    path, key = ref, None
+    if ".npz:" in ref:
+        path, _, key = ref.rpartition(":")
+    path = os.path.abspath(path)
+    try:
+        if path.endswith(".npy"):
+            array = np.load(path, mmap_mode="r")
+        else:
+            array = _mmap_npz_member(path, key)
+    except FileNotFoundError:
+        raise ValueError(f"array file not found: {path}") from None
+    _SOURCES.set(array, f"{path}:{key}" if key else path)
+    return array
+
+
+def _is_array_file(text: str) -> bool:
+    return text.endswith((".npy", ".npz")) or ".npz:" in text
+
+
+def _parse_literal(text: str, dtype: Any) -> np.ndarray:
+    """Parse ``"0.1,0.2"``, ``"[1 2 3]"`` or ``"0.5*1000,1.0"`` into a 1-D array."""
+    np = _numpy()
+    text = text.strip()
+    if text.startswith("[") and text.endswith("]"):
+        text = text[1:-1]
+    items = text.replace(",", " ").split()
+    dtype = dtype if dtype is not None else np.float64
+    if not any("*" in item for item in items):
+        return np.array(items, dtype=dtype)
+    values, counts = [], []
+    for item in items:
+        value, _, count = item.partition("*")
+        values.append(value)
+        counts.append(int(count) if count else 1)
+    return np.repeat(np.array(values, dtype=dtype), counts)
+
+
+class _ArraySpec:
+    """Validation of an ``NDArray`` field: source parsing, dtype and shape checks."""
+
+    def __init__(self, dtype: Any = None, shape: tuple[int | None, ...] | None = None):
+        np = _numpy()
+        self.dtype = np.dtype(dtype) if dtype is not None else None
+        self.shape = None if shape is None else tuple(None if d in (None, -1) else d for d in shape)
+
+    def __repr__(self) -> str:
+        return f"NDArray({self.dtype}, shape={self.shape})"
+
+    def _validate(self, value: Any) -> np.ndarray:
+        np = _numpy()
+        if isinstance(value, str):
+            array = _load_array_file(value) if _is_array_file(value) else _parse_literal(value, self.dtype)
+        elif isinstance(value, np.ndarray):
+            array = value
+        elif isinstance(value, (list, tuple)):
+            array = np.asarray(value, dtype=self.dtype)
+        else:
+            raise ValueError(
+                f"expected an array, a .npy/.npz path or a literal like '0.1,0.2', got {type(value).__name__}"
+            )
+
+        if self.dtype is not None and array.dtype != self.dtype:
+            if isinstance(array, np.memmap):
+                raise ValueError(f"expected dtype {self.dtype}, the file holds {array.dtype}")
+            try:
+                array = array.astype(self.dtype, casting="same_kind")
+            except TypeError as e:
+                raise ValueError(str(e)) from None
+        if self.shape is not None and (
+            array.ndim != len(self.shape) or any(d is not None and d != n for d, n in zip(self.shape, array.shape))
+        ):
+            expected = tuple("*" if d is None else d for d in self.shape)
+            raise ValueError(f"expected shape {expected}, got {array.shape}")
+
+        if array.flags.writeable:
+            # A read-only view, so configs stay immutable without copying the data.
+            array = array.view()
+            array.flags.writeable = False
+        return array
+
+    @staticmethod
+    def _serialize(value: np.ndarray, info: core_schema.SerializationInfo) -> Any:
+        if info.mode != "json":
+            return value
+        if info.context and info.context.get(HASH_CONTEXT_KEY):
+            digest = _DIGESTS.get(value)
+            if digest is None:
+                digest = hashlib.sha256(_numpy().ascontiguousarray(value)).hexdigest()
+                _DIGESTS.set(value, digest)
+            return {"dtype": value.dtype.str, "shape": list(value.shape), "sha256": digest}
+        source = _SOURCES.get(value)
+        if source is not None:
+            return source
+        return value.tolist()
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            self._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(self._serialize, info_arg=True),
+        )
+
+    def __get_pydantic_json_schema__(self, schema: core_schema.CoreSchema, handler: Any) -> dict[str, Any]:
+        return {"anyOf": [{"type": "string"}, {"type": "array", "items": {"type": "number"}}]}
+
+
+def NDArray(dtype: Any = None, shape: tuple[int | None, ...] | None = None) -> Any:
+    """Annotation for a NumPy array field with an optional ``dtype`` and ``shape``.
+
+    ``None`` (or -1) in ``shape`` matches any length along that axis. tyro
+    does not build a parser for the field; ``--field VALUE`` on the command
+    line is passed to the validator as is.
+    """
+    np = _numpy()
+    return Annotated[np.ndarray, Field(validate_default=True), tyro.conf.Suppress, _ArraySpec(dtype, shape)]
+
+
+def _is_array_field(metadata: list[Any]) -> bool:
+    """Check if a field's metadata marks it as an NDArray field."""
+    return any(isinstance(m, _ArraySpec) for m in metadata)
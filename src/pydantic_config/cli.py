@@ -23,33 +23,76 @@ Supports loading config files with @ syntax:
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import concurrent.futures
+import contextlib
 import copy
+import dataclasses
+import functools
+import hashlib
+import importlib
 import importlib.util
+import io
 import json
+import multiprocessing
+import operator
 import os
+import pickle
+import re
+import reprlib
+import shlex
 import shutil
+import stat
 import sys
+import threading
 import types
-from typing import TypeVar, Union, get_args, get_origin, overload
+import weakref
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NoReturn,
+    SupportsIndex,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
 
 import tyro
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, create_model, model_validator
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticCustomError, PydanticSerializationError, PydanticUndefined, to_json
+
+from pydantic_config.registry import _is_registry_field
+
+if TYPE_CHECKING:
+    from pydantic_config.provenance import ProvenanceIndex
 
 T = TypeVar("T")
 
 
+_INT_RE = re.compile(r"0|-?[1-9][0-9]*")
+
+
 def _coerce_str_value(v: str) -> bool | int | float | str:
     """Coerce a single string to bool, int, float, or leave as str."""
-    if v.lower() == "true":
+    lowered = v.lower()
+    if lowered == "true":
         return True
-    if v.lower() == "false":
+    if lowered == "false":
         return False
-    try:
-        int_val = int(v)
-        if str(int_val) == v:
-            return int_val
-    except ValueError:
-        pass
+    if _INT_RE.fullmatch(v):
+        return int(v)
     try:
         float_val = float(v)
         if str(float_val) == v:
@@ -59,15 +102,108 @@ def _coerce_str_value(v: str) -> bool | int | float | str:
     return v
 
 
+def _guess_value(v: object) -> object:
+    """Coerce CLI strings inside an untyped value (nested dicts and lists included)."""
+    if isinstance(v, dict):
+        return _coerce_dict_values(v)
+    if isinstance(v, list):
+        return _coerce_list_values(v)
+    return v
+
+
 def _coerce_dict_values(d: dict) -> dict:
-    """Coerce all-string dict values to proper Python types.
+    """Coerce the string values of an untyped dict to proper Python types.
 
-    Only runs when every value is a string (i.e. from CLI parsing).
-    TOML/programmatic dicts already have proper types and pass through unchanged.
+    String values are only coerced when every scalar value of the dict is a
+    string (i.e. from CLI parsing); TOML/programmatic dicts already have
+    proper types and pass through unchanged. Nested dicts and lists are
+    handled the same way.
     """
-    if not d or not all(isinstance(v, str) for v in d.values()):
-        return d
-    return {k: _coerce_str_value(v) for k, v in d.items()}
+    scalars_are_str = False
+    for v in d.values():
+        if isinstance(v, str):
+            scalars_are_str = True
+        elif not isinstance(v, (dict, list)):
+            scalars_are_str = False
+            break
+    if scalars_are_str:
+        return {k: _coerce_str_value(v) if isinstance(v, str) else _guess_value(v) for k, v in d.items()}
+    if any(isinstance(v, (dict, list)) for v in d.values()):
+        return {k: _guess_value(v) for k, v in d.items()}
+    return d
+
+
+def _coerce_list_values(items: list) -> list:
+    """List counterpart of ``_coerce_dict_values``."""
+    if items and all(isinstance(v, str) for v in items):
+        return [_coerce_str_value(v) for v in items]
+    if any(isinstance(v, (dict, list)) for v in items):
+        return [_guess_value(v) for v in items]
+    return items
+
+
+def _map_dict(coerce: Callable[[object], object]) -> Callable[[object], object]:
+    return lambda d: {k: coerce(v) for k, v in d.items()} if isinstance(d, dict) else d
+
+
+def _map_list(coerce: Callable[[object], object]) -> Callable[[object], object]:
+    return lambda items: [coerce(v) for v in items] if isinstance(items, list) else items
+
+
+def _is_untyped(annotation: object) -> bool:
+    """Whether values of ``annotation`` can be anything (``Any``, ``object``, or a union with either)."""
+    if annotation is Any or annotation is object:
+        return True
+    if get_origin(annotation) in (Union, types.UnionType):
+        return any(arg is Any or arg is object for arg in get_args(annotation))
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_coercer(annotation: object) -> Callable[[object], object] | None:
+    """Build the CLI string coercion for values of ``annotation``.
+
+    Returns None when the annotation fixes the value types: pydantic then
+    converts the strings itself in its typed validation pass. Only untyped
+    parts (``Any``, unions with ``Any``, bare ``dict``/``list``) are guessed
+    with ``_coerce_str_value``.
+    """
+    if hasattr(annotation, "__metadata__"):
+        annotation = get_args(annotation)[0]
+    if _is_untyped(annotation):
+        return _guess_value
+    if annotation is dict:
+        return lambda d: _coerce_dict_values(d) if isinstance(d, dict) else d
+    if annotation is list:
+        return lambda items: _coerce_list_values(items) if isinstance(items, list) else items
+    origin = get_origin(annotation)
+    if origin is dict:
+        args = get_args(annotation)
+        value_type = args[1] if len(args) == 2 else Any
+        if _is_untyped(value_type):
+            return lambda d: _coerce_dict_values(d) if isinstance(d, dict) else d
+        inner = _compile_coercer(value_type)
+        return None if inner is None else _map_dict(inner)
+    if origin is list:
+        args = get_args(annotation)
+        item_type = args[0] if args else Any
+        if _is_untyped(item_type):
+            return lambda items: _coerce_list_values(items) if isinstance(items, list) else items
+        inner = _compile_coercer(item_type)
+        return None if inner is None else _map_list(inner)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _dict_field_coercers(cls: type[BaseModel]) -> dict[str, Callable[[object], object]]:
+    """Per-class table of dict fields whose CLI string values need coercing."""
+    coercers = {}
+    for field_name, field_info in cls.model_fields.items():
+        if _is_dict_annotation(field_info.annotation):
+            coerce = _compile_coercer(field_info.annotation)
+            if coerce is not None:
+                coercers[field_name] = coerce
+    return coercers
 
 
 def _is_dict_annotation(annotation: type) -> bool:
@@ -77,11 +213,125 @@ def _is_dict_annotation(annotation: type) -> bool:
     return annotation is dict or get_origin(annotation) is dict
 
 
+def _type_tagged_variants(annotation: type) -> dict[object, type[BaseModel]] | None:
+    """Map ``type`` tags to variants for a union of BaseModels that each declare a distinct
+    ``type: Literal[...]`` field. Returns None for any other annotation."""
+    if not _is_multi_model_union(annotation):
+        return None
+    if hasattr(annotation, "__metadata__"):
+        annotation = get_args(annotation)[0]
+    table: dict[object, type[BaseModel]] = {}
+    for variant in get_args(annotation):
+        if variant is type(None):
+            return None
+        type_field = variant.model_fields.get("type")
+        if type_field is None or get_origin(type_field.annotation) is not Literal:
+            return None
+        for tag in get_args(type_field.annotation):
+            if tag in table:
+                return None
+            table[tag] = variant
+    return table
+
+
 class BaseConfig(BaseModel):
     """Base configuration class with strict validation (extra fields forbidden)."""
 
     model_config = ConfigDict(extra="forbid")
 
+    # field name -> ``type`` tag of the field's default, filled per subclass
+    _discriminator_defaults: ClassVar[dict[str, object]] = {}
+
+    # Share sub-config defaults between instances instead of copying them
+    # per instance; the shared defaults become immutable (see _share_default).
+    share_defaults: ClassVar[bool] = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: object) -> None:
+        """Wire up ``type``-tagged unions as real discriminators and precompute default tags.
+
+        A field annotated with a union of BaseModels that all declare a
+        distinct ``type: Literal[...]``, and whose default carries a tag, gets
+        ``discriminator="type"``, so pydantic dispatches on the tag through a
+        lookup table instead of trying every variant in turn.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._discriminator_defaults = {}
+        for field_name, field_info in cls.model_fields.items():
+            default = field_info.default
+            if isinstance(default, BaseModel) and hasattr(default, "type"):
+                cls._discriminator_defaults[field_name] = default.type
+            elif isinstance(default, dict) and "type" in default and _is_registry_field(field_info.metadata):
+                # VariantRegistry fields declare their default variant as {"type": tag}
+                cls._discriminator_defaults[field_name] = default["type"]
+
+        # Only unions whose default tag is injected into tag-less input get a
+        # discriminator; the others keep smart-mode union validation, which
+        # also picks a variant from input without a tag.
+        rebuild = False
+        for field_name, field_info in cls.model_fields.items():
+            if (
+                field_info.discriminator is None
+                and field_name in cls._discriminator_defaults
+                and _type_tagged_variants(field_info.annotation)
+            ):
+                cls.model_fields[field_name] = FieldInfo.merge_field_infos(field_info, discriminator="type")
+                rebuild = True
+
+        if cls.share_defaults:
+            for field_name, field_info in cls.model_fields.items():
+                default = field_info.default
+                if isinstance(default, BaseConfig) and not _is_shared_default(default):
+                    # Share a copy: the instance written in the class body may
+                    # also be the default of classes that did not opt in.
+                    shared = default if _is_frozen(default) else default.model_copy(deep=True)
+                    _share_default(shared)
+                    cls.model_fields[field_name] = FieldInfo.merge_field_infos(field_info, default=shared)
+                    # pydantic-core decides at schema build whether to copy a
+                    # default (it copies unhashable ones); shared ones now hash.
+                    rebuild = True
+        if rebuild:
+            cls.model_rebuild(force=True)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if _is_shared_default(self):
+            raise ValidationError.from_exception_data(
+                type(self).__name__,
+                [{"type": "frozen_instance", "loc": (name,), "input": value}],
+            )
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BaseModel) or not _holds_arrays(type(self)):
+            return super().__eq__(other)
+        # NDArray fields compare element-wise: pydantic's __dict__ comparison
+        # would have to turn an array of booleans into one.
+        return _values_equal(self, other)
+
+    def __hash__(self) -> int:
+        # Frozen configs and shared defaults hash by content; the others are
+        # mutable and stay unhashable like any pydantic model.
+        if not _is_immutable(self):
+            raise TypeError(f"unhashable type: '{type(self).__name__}'")
+        return int.from_bytes(_config_digest(self)[:8], "little")
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> object:
+        """Pickle as the schema fingerprint plus a flat tuple of field values.
+
+        Sub-models are inlined into the tuple instead of being pickled with
+        their class and ``__dict__`` each. Unpickling checks the fingerprint
+        against the class in the receiving process and rebuilds the tree
+        without re-validating when it matches; otherwise the values are
+        decoded with the pickled field layout and validated. Configs with
+        private attributes or extra fields use pydantic's regular pickling.
+        """
+        if self.__pydantic_private__ is not None or self.__pydantic_extra__:
+            return super().__reduce_ex__(protocol)
+        values: list = []
+        _pickle_fields(self, values)
+        cls = type(self)
+        return _unpickle_config, (cls, _schema_fingerprint(cls), tuple(values), _pickle_schema(cls))
+
     @model_validator(mode="before")
     @classmethod
     def _none_str_to_none(cls, data: dict) -> dict:
@@ -89,7 +339,7 @@ class BaseConfig(BaseModel):
         if not isinstance(data, dict):
             return data
         for key, value in data.items():
-            if value == "None":
+            if isinstance(value, str) and value == "None":
                 data[key] = None
         return data
 
@@ -98,17 +348,17 @@ class BaseConfig(BaseModel):
     def _coerce_dict_str_values(cls, data: dict) -> dict:
         """Coerce string values in dict-typed fields back to proper Python types.
 
-        tyro parses untyped dict values as strings. This detects dict fields
-        whose values are all strings (i.e. from CLI parsing) and converts
-        them back to int/float/bool.
+        tyro parses untyped dict values as strings. The coercion of each dict
+        field is compiled once from its annotation (see ``_compile_coercer``):
+        typed values such as ``dict[str, float]`` are left to pydantic, and
+        only untyped values are converted back to int/float/bool.
         """
         if not isinstance(data, dict):
             return data
-        for field_name, field_info in cls.model_fields.items():
-            if _is_dict_annotation(field_info.annotation) and field_name in data:
-                val = data[field_name]
-                if isinstance(val, dict):
-                    data[field_name] = _coerce_dict_values(val)
+        for field_name, coerce in _dict_field_coercers(cls).items():
+            val = data.get(field_name)
+            if isinstance(val, dict):
+                data[field_name] = coerce(val)
         return data
 
     @model_validator(mode="before")
@@ -117,16 +367,171 @@ class BaseConfig(BaseModel):
         """For discriminated-union fields whose default carries a ``type`` tag, inject it when missing."""
         if not isinstance(data, dict):
             return data
-        for field_name, field_info in cls.model_fields.items():
+        for field_name, tag in cls._discriminator_defaults.items():
             val = data.get(field_name)
             if isinstance(val, dict) and "type" not in val:
-                default = field_info.default
-                if isinstance(default, BaseModel) and hasattr(default, "type"):
-                    val["type"] = default.type
+                val["type"] = tag
         return data
 
+    def with_overrides(self: _ConfigT, overrides: dict[str, object]) -> _ConfigT:
+        """Return a copy with dotted-path overrides applied.
+
+        Only the sub-models along the overridden paths are re-validated; all
+        untouched sub-model instances are shared with ``self``. A path into a
+        dict field sets that key and keeps the others; a path into a list
+        field indexes it (``"layers.0.hidden"``).
+
+        Example:
+            config.with_overrides({"train.lr": 1e-3, "model.encoder.layers": 12})
+        """
+        updates: dict = {}
+        for key_path, value in overrides.items():
+            _merge_into(updates, _nest_config(key_path.replace("-", "_"), value))
+        return _apply_overrides(self, updates)
+
+
+_ConfigT = TypeVar("_ConfigT", bound=BaseConfig)
+
+
+# (class, JSON of a validated input or content digest) -> interned instance
+_INTERNED: weakref.WeakValueDictionary[tuple[type, str | bytes], BaseModel] = weakref.WeakValueDictionary()
+# id(instance) -> (weakref to it, memoized JSON dumps)
+_DUMP_MEMO: dict[int, tuple[weakref.ref, dict]] = {}
+
+
+def _read_only(self: object, *args: object, **kwargs: object) -> NoReturn:
+    raise TypeError("FrozenConfig fields are read-only; use with_overrides() to derive a changed config")
+
+
+class _FrozenList(list):
+    """Read-only list held by FrozenConfig fields (still equal to, and dumped as, a list)."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self) -> tuple:
+        return _FrozenList, (list(self),)
+
+
+class _FrozenDict(dict):
+    """Read-only dict held by FrozenConfig fields (still equal to, and dumped as, a dict)."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    pop = popitem = clear = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple:
+        return _FrozenDict, (dict(self),)
+
+
+class _FrozenSet(set):
+    """Read-only set held by FrozenConfig fields (still equal to, and dumped as, a set)."""
+
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+    add = discard = remove = pop = clear = update = _read_only
+    intersection_update = difference_update = symmetric_difference_update = _read_only
+
+    def __reduce__(self) -> tuple:
+        return _FrozenSet, (set(self),)
+
+
+def _frozen_value(value: object) -> object:
+    """``value`` with its lists, dicts and sets (nested ones included) made read-only."""
+    if isinstance(value, list):
+        return _FrozenList([_frozen_value(item) for item in value])
+    if isinstance(value, dict):
+        return _FrozenDict({key: _frozen_value(item) for key, item in value.items()})
+    if isinstance(value, set):
+        return _FrozenSet(value)
+    if type(value) is tuple:
+        return tuple(_frozen_value(item) for item in value)
+    return value
+
+
+def _freeze_fields(model: BaseModel) -> None:
+    # Interned instances are shared by every caller validating the same
+    # input, so a container field mutated in place would leak into them.
+    fields = model.__dict__
+    for name, value in fields.items():
+        if isinstance(value, (list, dict, set, tuple)):
+            fields[name] = _frozen_value(value)
+
+
+class _InterningMeta(type(BaseModel)):
+    def __call__(cls, /, **data: object) -> BaseModel:
+        # __init__ cannot return another instance; route construction through
+        # model_validate so constructor calls (tyro's included) are interned too.
+        return cls.model_validate(data)
+
+
+class FrozenConfig(BaseConfig, metaclass=_InterningMeta):
+    """Immutable BaseConfig whose instances are interned by content.
+
+    Validating the same input twice returns the same instance without
+    re-validating, and instances with equal content are collapsed into
+    one, so sweeps and long lists that repeat a sub-config hold a single
+    copy of it. List, dict and set fields are read-only (mutating them
+    raises ``TypeError``). Hashes and ``model_dump_json()`` results are
+    computed once per instance; ``model_dump()`` builds a new dict on every
+    call, so callers may mutate it.
+
+    Constructor calls go through ``model_validate`` (a custom ``__init__``
+    is not called). Validators that depend on the validation context should
+    not be used on FrozenConfig subclasses, since a cached instance is
+    returned for a known input whatever the context.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _intern(cls, data: object, handler: Callable[[object], BaseModel]) -> BaseModel:
+        input_key = None
+        if isinstance(data, dict):
+            try:
+                input_key = to_json(data, inf_nan_mode="constants")
+            except PydanticSerializationError:
+                pass
+            else:
+                cached = _INTERNED.get((cls, input_key))
+                if cached is not None:
+                    return cached
+        instance = handler(data)
+        if type(instance) is not cls:
+            return instance
+        _freeze_fields(instance)
+        instance = _INTERNED.setdefault((cls, _config_digest(instance)), instance)
+        if input_key is not None:
+            _INTERNED[(cls, input_key)] = instance
+        return instance
+
+    def _memoized(self, key: tuple, compute: Callable[[], object]) -> object:
+        entry = _DUMP_MEMO.get(id(self))
+        if entry is None or entry[0]() is not self:
+            self_id = id(self)
+            entry = (weakref.ref(self, lambda _ref: _DUMP_MEMO.pop(self_id, None)), {})
+            _DUMP_MEMO[self_id] = entry
+        dumps = entry[1]
+        if key not in dumps:
+            dumps[key] = compute()
+        return dumps[key]
+
+    # model_dump() is not memoized: a shared dict could be mutated by its
+    # callers, and copying one costs more than pydantic's own dump.
+    def model_dump_json(self, **kwargs: object) -> str:  # type: ignore[override]
+        try:
+            key = ("json", *sorted(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return super().model_dump_json(**kwargs)  # type: ignore[arg-type]
+        return self._memoized(key, lambda: super(FrozenConfig, self).model_dump_json(**kwargs))  # type: ignore[return-value]
+
 
 CONFIG_FILE_SIGN = "@"
+RESPONSE_FILE_SIGN = "@@"
+CONFIG_HASH_FLAG = "--config-hash"
+HELP_SECTION_FLAG = "--help-section"
+HELP_SECTIONS_FLAG = "--help-sections"
+DAEMON_SOCKET_ENV = "PYDANTIC_CONFIG_SOCKET"
 
 
 # ANSI color codes
@@ -137,6 +542,11 @@ _DIM = "\033[2m"
 _BRIGHT_RED = "\033[91m"
 
 
+# Lines of validation errors printed in the error box (0 shows every error)
+ERROR_LINE_BUDGET = 40
+ERROR_LINE_BUDGET_ENV = "PYDANTIC_CONFIG_MAX_ERROR_LINES"
+
+
 def _supports_color() -> bool:
     """Check if the terminal supports ANSI colors."""
     if os.environ.get("NO_COLOR"):
@@ -152,23 +562,183 @@ def _supports_color() -> bool:
     return True
 
 
-def _colorize(text: str, *codes: str) -> str:
-    """Apply ANSI color codes to text if colors are supported."""
-    if not _supports_color():
+def _colorize(text: str, *codes: str, enabled: bool = True) -> str:
+    """Apply ANSI color codes to text if ``enabled``."""
+    if not enabled:
         return text
     return "".join(codes) + text + _RESET
 
 
 class ConfigFileError(Exception):
-    """Error loading or parsing a config file."""
+    """Error loading or parsing a config file.
+
+    Validation failures also carry pydantic's structured ``errors`` (as
+    returned by ``ValidationError.errors()``), the ``source`` that was
+    validated and the ``model`` class it was validated against. A report
+    of several problems (``cli(collect_errors=True)``) lists one error per
+    source in ``causes``.
+    """
 
-    def __init__(self, message: str):
+    def __init__(
+        self,
+        message: str,
+        *,
+        errors: list[dict] | None = None,
+        source: str | None = None,
+        model: type[BaseModel] | None = None,
+        causes: list[ConfigFileError] | None = None,
+    ):
         super().__init__(message)
         self.message = message
+        self.errors = errors or []
+        self.source = source
+        self.model = model
+        self.causes = causes or []
 
 
-def _print_config_error_and_exit(error: ConfigFileError) -> None:
-    """Print a config file error in a nice box format and exit."""
+def _split_error_loc(model: type[BaseModel] | None, loc: tuple) -> tuple[str, tuple[str, ...]]:
+    """Split a pydantic error ``loc`` into the dotted field path and the union members it went through.
+
+    Tags of discriminated unions are dropped: they select a single variant,
+    so they are not alternatives that pydantic tried.
+    """
+    path: list[str] = []
+    labels: list[str] = []
+    models: tuple[type[BaseModel], ...] = (model,) if model is not None else ()
+    planned: _PlannedField | None = None
+    for part in loc:
+        if isinstance(part, int):
+            path.append(f"[{part}]")
+            continue
+        fields = [f for m in models for f in _field_plan(m) if f.name == part]
+        if fields:
+            planned = fields[0]
+            path.append(part)
+            models = planned.models
+        elif len(models) > 1:
+            tagged = [m for m in models if getattr(m.model_fields.get("type"), "default", None) == part]
+            if not tagged:
+                labels.append(part)
+            models = tagged or tuple(m for m in models if m.__name__ == part)
+        elif planned is not None and planned.kind == "leaf":
+            # pydantic labels each member of a union it tried (``int``, ``list[int]``, ...)
+            labels.append(part)
+        else:
+            path.append(part)
+            models = ()
+    return ".".join(path).replace(".[", "["), tuple(labels)
+
+
+def _rank_errors(
+    model: type[BaseModel] | None, errors: list[dict]
+) -> list[tuple[str, list[tuple[tuple[str, ...], dict]]]]:
+    """Group ``errors`` by field path, likely root causes first.
+
+    Errors outside unions come first. Among union errors, the ones from the
+    variant with the fewest errors (the closest match) rank higher, since
+    every other variant of the union fails on the same input too.
+    """
+    split = []
+    branch_sizes: dict[tuple, int] = {}
+    for error in errors:
+        loc = tuple(error["loc"])
+        path, labels = _split_error_loc(model, loc)
+        # the loc up to the innermost union member this error came from
+        branch = loc[: loc.index(labels[-1]) + 1] if labels else ()
+        branch_sizes[branch] = branch_sizes.get(branch, 0) + 1
+        split.append((path, labels, branch, error))
+
+    groups: dict[str, list[tuple[tuple[str, ...], dict]]] = {}
+    scores: dict[str, tuple[int, int, int]] = {}
+    for order, (path, labels, branch, error) in enumerate(split):
+        score = (1, branch_sizes[branch], order) if labels else (0, 0, order)
+        groups.setdefault(path, []).append((labels, error))
+        scores[path] = min(scores.get(path, score), score)
+    return sorted(groups.items(), key=lambda item: scores[item[0]])
+
+
+def _error_line_budget() -> int:
+    try:
+        return int(os.environ.get(ERROR_LINE_BUDGET_ENV, ERROR_LINE_BUDGET))
+    except ValueError:
+        return ERROR_LINE_BUDGET
+
+
+_ERROR_INPUT_REPR = reprlib.Repr()
+_ERROR_INPUT_REPR.maxstring = _ERROR_INPUT_REPR.maxother = 40
+
+
+def _config_error_lines(error: ConfigFileError, max_lines: int) -> list[tuple[str | None, tuple[str, ...]]]:
+    """``(text, color codes)`` lines describing ``error``; ``None`` text is a horizontal rule.
+
+    At most ``max_lines`` lines of validation errors are listed (0: no limit).
+    """
+    if error.causes:
+        lines: list[tuple[str | None, tuple[str, ...]]] = [(error.message.split("\n", 1)[0], (_BRIGHT_RED,))]
+        remaining = max_lines
+        for shown, cause in enumerate(error.causes):
+            if max_lines and remaining <= 0:
+                hidden = len(error.causes) - shown
+                lines.append((f"... {hidden} more source{'s' * (hidden != 1)} with errors", (_DIM,)))
+                break
+            cause_lines = _config_error_lines(cause, remaining)
+            lines.append((None, ()))
+            lines.extend(cause_lines)
+            remaining -= len(cause_lines)
+        return lines
+
+    if not error.errors:
+        return [(line, ()) for line in error.message.split("\n") if line.strip()]
+
+    groups = _rank_errors(error.model, error.errors)
+    source = f" from '{error.source}'" if error.source else ""
+    n_errors, n_fields = len(error.errors), len(groups)
+    lines = [
+        (f"Failed to validate config{source}:", ()),
+        (None, ()),
+        (
+            f"{n_errors} validation error{'s' * (n_errors != 1)} in {n_fields} field{'s' * (n_fields != 1)}",
+            (_BRIGHT_RED,),
+        ),
+    ]
+    used = shown_errors = shown_fields = 0
+    for path, entries in groups:
+        # a field header is only worth printing with at least one of its errors
+        if max_lines and used + 2 > max_lines:
+            break
+        lines.append((f"  {path or '(root)'}", (_BOLD,)))
+        used += 1
+        shown_fields += 1
+        for labels, details in entries:
+            if max_lines and used >= max_lines:
+                break
+            prefix = f"{' > '.join(labels)}: " if labels else ""
+            text = f"    {prefix}{details['msg']} [type={details['type']}"
+            if details["type"] != "missing":
+                text += f", input={_ERROR_INPUT_REPR.repr(details.get('input'))}"
+            lines.append((text + "]", (_DIM,)))
+            used += 1
+            shown_errors += 1
+    if shown_errors < n_errors:
+        hidden, hidden_fields = n_errors - shown_errors, n_fields - shown_fields
+        more = f"... {hidden} more error{'s' * (hidden != 1)}"
+        if hidden_fields:
+            more += f" in {hidden_fields} more field{'s' * (hidden_fields != 1)}"
+        lines.append((f"{more} (set {ERROR_LINE_BUDGET_ENV}=0 to show all)", (_DIM,)))
+    return lines
+
+
+def _print_config_error(error: ConfigFileError, max_lines: int | None = None) -> None:
+    """Print a config file error in a nice box format to stderr.
+
+    Validation errors are grouped by field path, likely root causes first,
+    and capped at ``max_lines`` lines (default: ``ERROR_LINE_BUDGET``,
+    overridden by the ``PYDANTIC_CONFIG_MAX_ERROR_LINES`` environment
+    variable; 0 shows everything).
+    """
+    color = _supports_color()
+    if max_lines is None:
+        max_lines = _error_line_budget()
     width = min(80, max(40, shutil.get_terminal_size().columns))
     inner_width = width - 4  # Account for "│ " and " │"
 
@@ -178,82 +748,56 @@ def _print_config_error_and_exit(error: ConfigFileError) -> None:
     horiz, vert = "─", "│"
 
     def wrap_text(text: str, max_width: int) -> list[str]:
-        """Wrap text to fit within max_width."""
+        """Wrap text to fit within max_width, keeping its indentation."""
+        indent = text[: len(text) - len(text.lstrip())]
         words = text.split()
         lines = []
         current_line = ""
         for word in words:
             if not current_line:
-                current_line = word
+                current_line = indent + word
             elif len(current_line) + 1 + len(word) <= max_width:
                 current_line += " " + word
             else:
                 lines.append(current_line)
-                current_line = word
+                current_line = indent + word
         if current_line:
             lines.append(current_line)
         return lines or [""]
 
-    def box_line(content: str) -> str:
+    def box_line(content: str, *codes: str) -> str:
         """Create a line inside the box with proper padding."""
         padding = inner_width - len(content)
-        return f"{_colorize(vert, _RED)} {content}{' ' * padding} {_colorize(vert, _RED)}"
-
-    # Build the error message content
-    lines = []
+        side = _colorize(vert, _RED, enabled=color)
+        return f"{side} {_colorize(content, *codes, enabled=color) if codes else content}{' ' * padding} {side}"
 
     # Title line
     title = "Config file error"
     title_plain_len = 2 + len(title) + 1
-    lines.append(
-        _colorize(top_left, _RED)
-        + f"{horiz} {_colorize(title, _RED, _BOLD)} "
-        + _colorize(horiz * (width - title_plain_len - 2) + top_right, _RED)
-    )
+    lines = [
+        _colorize(top_left, _RED, enabled=color)
+        + f"{horiz} {_colorize(title, _RED, _BOLD, enabled=color)} "
+        + _colorize(horiz * (width - title_plain_len - 2) + top_right, _RED, enabled=color)
+    ]
 
     # Content
-    message = error.message
-    if "Failed to validate config" in message:
-        parts = message.split(": ", 1)
-        if len(parts) == 2:
-            # Source info line
-            for line in wrap_text(parts[0] + ":", inner_width):
-                lines.append(box_line(line))
-
-            # Horizontal rule
-            lines.append(box_line(_colorize(horiz * inner_width, _RED)))
-
-            # Pydantic error details
-            pydantic_lines = parts[1].split("\n")
-            for pydantic_line in pydantic_lines:
-                if not pydantic_line:
-                    continue
-                # First line (validation error count)
-                if "validation error" in pydantic_line:
-                    for wrapped in wrap_text(pydantic_line, inner_width):
-                        lines.append(box_line(_colorize(wrapped, _BRIGHT_RED)))
-                # Field name (not indented)
-                elif pydantic_line and not pydantic_line.startswith(" "):
-                    for wrapped in wrap_text(f"  {pydantic_line}", inner_width):
-                        lines.append(box_line(_colorize(wrapped, _BOLD)))
-                # Error details (indented)
-                elif pydantic_line.startswith("  "):
-                    for wrapped in wrap_text(f"    {pydantic_line.strip()}", inner_width):
-                        lines.append(box_line(_colorize(wrapped, _DIM)))
-        else:
-            for line in wrap_text(message, inner_width):
-                lines.append(box_line(line))
-    else:
-        for line in wrap_text(message, inner_width):
-            lines.append(box_line(line))
+    for text, codes in _config_error_lines(error, max_lines):
+        if text is None:
+            lines.append(box_line(horiz * inner_width, _RED))
+            continue
+        for wrapped in wrap_text(text, inner_width):
+            lines.append(box_line(wrapped, *codes))
 
     # Bottom border
-    lines.append(_colorize(f"{bot_left}{horiz * (width - 2)}{bot_right}", _RED))
+    lines.append(_colorize(f"{bot_left}{horiz * (width - 2)}{bot_right}", _RED, enabled=color))
 
     # Print to stderr
-    for line in lines:
-        print(line, file=sys.stderr)
+    print("\n".join(lines), file=sys.stderr)
+
 
+def _print_config_error_and_exit(error: ConfigFileError) -> None:
+    """Print a config file error in a nice box format and exit."""
+    _print_config_error(error)
     sys.exit(1)
 
 
@@ -304,6 +848,21 @@ def _deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
+def _merge_into(target: dict, override: dict) -> dict:
+    """Deep merge ``override`` into ``target`` in place, without copying.
+
+    Used to accumulate many freshly built override dicts, where copying the
+    accumulated result on every merge (as ``_deep_merge`` does) would be
+    quadratic in the number of overrides.
+    """
+    for key, value in override.items():
+        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+            _merge_into(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
 def _dict_to_instance(cls: type[T], data: dict) -> T:
     """Convert a dictionary to an instance of a Pydantic model."""
     if isinstance(cls, type) and issubclass(cls, BaseModel):
@@ -311,10 +870,95 @@ def _dict_to_instance(cls: type[T], data: dict) -> T:
     raise TypeError(f"Cannot convert dict to {cls}: not a Pydantic BaseModel")
 
 
-def _process_args(args: list[str]) -> tuple[list[str], dict, dict[str, dict]]:
+def _expand_response_files(args: Iterable[str], _open_files: tuple[str, ...] = ()) -> Iterator[str]:
+    """Yield ``args`` with ``@@ file`` response files expanded in place.
+
+    Response files are read lazily, one line at a time; each line is split
+    like a shell command line (quotes and ``#`` comments are supported).
+    They may contain config file references and further response files.
+    """
+    args = iter(args)
+    for arg in args:
+        if arg == RESPONSE_FILE_SIGN:
+            path = next(args, None)
+            if path is None:
+                raise ConfigFileError(f"{RESPONSE_FILE_SIGN} must be followed by a response file path")
+        elif arg.startswith(RESPONSE_FILE_SIGN) and len(arg) > len(RESPONSE_FILE_SIGN):
+            path = arg[len(RESPONSE_FILE_SIGN) :]
+        else:
+            yield arg
+            continue
+
+        if path in _open_files:
+            raise ConfigFileError(f"Response file includes itself: {' -> '.join(_open_files + (path,))}")
+        try:
+            with open(path) as f:
+                lines = (token for line in f for token in shlex.split(line, comments=True))
+                yield from _expand_response_files(lines, _open_files + (path,))
+        except FileNotFoundError:
+            raise ConfigFileError(f"Response file not found: {path}")
+        except ValueError as e:
+            raise ConfigFileError(f"Invalid response file {path}: {e}")
+
+
+class _ArgStream:
+    """Iterator over CLI tokens with one token of lookahead."""
+
+    def __init__(self, tokens: Iterable[str]):
+        self._tokens = iter(tokens)
+        self._peeked: str | None = None
+
+    def peek(self) -> str | None:
+        if self._peeked is None:
+            self._peeked = next(self._tokens, None)
+        return self._peeked
+
+    def next(self) -> str | None:
+        token = self.peek()
+        self._peeked = None
+        return token
+
+
+def _scope_key(key_path: str, select: str) -> tuple[str | None, list[str]]:
+    """Map a nested config key onto the ``select`` sub-tree.
+
+    Returns (relative_key, section): ``relative_key`` is where the file's
+    content goes inside the selected sub-model ("" for its root, None if the
+    file is unrelated to it) and ``section`` is the part of the file to keep.
+    """
+    if key_path == select:
+        return "", []
+    if key_path.startswith(select + "."):
+        return key_path[len(select) + 1 :], []
+    if select.startswith(key_path + "."):
+        return "", select[len(key_path) + 1 :].split(".")
+    return None, []
+
+
+def _config_section(config: dict, section: list[str]) -> dict:
+    """Return the sub-dict of ``config`` at ``section`` (empty if absent)."""
+    value = _lookup_path(config, section)
+    return value if isinstance(value, dict) else {}
+
+
+def _process_args(
+    args: list[str],
+    loader: Callable[[str], dict] = _load_config_file,
+    select: str | None = None,
+    sources: list[tuple[str | None, str]] | None = None,
+) -> tuple[list[str], dict, dict[str, dict]]:
     """
     Process command line args to extract config file references.
 
+    ``loader`` is called for every referenced config file (the watcher uses it
+    to record and cache the files that fed the config). When ``sources`` is
+    given, ``(arg_name, path)`` is appended to it for every referenced file,
+    with ``arg_name`` None for root files.
+
+    With ``select`` (a dotted field path), only the sections of root files
+    under that path are kept, nested keys become relative to it and nested
+    files for unrelated fields are skipped without being loaded.
+
     Returns:
         - remaining_args: args with config file refs removed (for tyro)
         - root_config: merged config from root-level @ files
@@ -324,54 +968,121 @@ def _process_args(args: list[str]) -> tuple[list[str], dict, dict[str, dict]]:
         - `@ config.toml` (with space, root level)
         - `--model @ model.toml` (with space, nested)
         - `--model @model.toml` (without space, nested)
+        - `@@ overrides.txt` / `@@overrides.txt` (response file, expanded in place)
     """
     remaining_args = []
     root_config: dict = {}
     nested_configs: dict[str, dict] = {}
-
-    i = 0
-    while i < len(args):
-        arg = args[i]
-
+    select_parts = select.split(".") if select else []
+
+    def add_nested(arg_name: str, config_path: str) -> None:
+        if not select:
+            if sources is not None:
+                sources.append((arg_name, config_path))
+            nested_configs[arg_name] = loader(config_path)
+            return
+        key, section = _scope_key(arg_name.replace("-", "_"), select)
+        if key is None:
+            return
+        if sources is not None:
+            sources.append((arg_name, config_path))
+        loaded = _config_section(loader(config_path), section)
+        nested_configs[key] = _deep_merge(nested_configs[key], loaded) if key in nested_configs else loaded
+
+    tokens = _ArgStream(_expand_response_files(args))
+    while (arg := tokens.next()) is not None:
         # Root level config: `@ config.toml`
         if arg == CONFIG_FILE_SIGN:
-            if i + 1 >= len(args):
+            config_path = tokens.next()
+            if config_path is None:
                 raise ConfigFileError("@ must be followed by a config file path")
-            config_path = args[i + 1]
-            loaded = _load_config_file(config_path)
+            if sources is not None:
+                sources.append((None, config_path))
+            loaded = loader(config_path)
+            if select:
+                loaded = _config_section(loaded, select_parts)
             root_config = _deep_merge(root_config, loaded)
-            i += 2
             continue
 
         # Handle --arg @ file.toml or --arg @file.toml
         if arg.startswith("--"):
             arg_name = arg[2:]  # Remove --
+            next_arg = tokens.peek()
 
             # Check if next arg is @ (with space)
-            if i + 1 < len(args) and args[i + 1] == CONFIG_FILE_SIGN:
-                if i + 2 >= len(args):
+            if next_arg == CONFIG_FILE_SIGN:
+                tokens.next()
+                config_path = tokens.next()
+                if config_path is None:
                     raise ConfigFileError(f"@ after {arg} must be followed by a config file path")
-                config_path = args[i + 2]
-                loaded = _load_config_file(config_path)
-                nested_configs[arg_name] = loaded
-                i += 3
+                add_nested(arg_name, config_path)
                 continue
 
             # Check if next arg starts with @ (without space): --arg @file.toml
-            if i + 1 < len(args) and args[i + 1].startswith(CONFIG_FILE_SIGN) and len(args[i + 1]) > 1:
-                config_path = args[i + 1][1:]  # Remove @
-                loaded = _load_config_file(config_path)
-                nested_configs[arg_name] = loaded
-                i += 2
+            if next_arg is not None and next_arg.startswith(CONFIG_FILE_SIGN) and len(next_arg) > 1:
+                tokens.next()
+                add_nested(arg_name, next_arg[1:])  # Remove @
                 continue
 
         # Regular arg, keep it
         remaining_args.append(arg)
-        i += 1
 
     return remaining_args, root_config, nested_configs
 
 
+def _select_model(cls: type, select: str, default: object = None) -> tuple[type[BaseModel], BaseModel | None]:
+    """Return the sub-model class at dotted path ``select`` and its default instance, if any.
+
+    The default comes from ``default`` (an instance of ``cls``) when given,
+    otherwise from the field defaults along the path.
+    """
+    for part in select.split("."):
+        fields = getattr(cls, "model_fields", {})
+        if part not in fields:
+            raise ConfigFileError(f"Cannot select '{select}': {getattr(cls, '__name__', cls)} has no field '{part}'")
+        field_info = fields[part]
+        annotation = field_info.annotation
+        if hasattr(annotation, "__metadata__"):
+            annotation = get_args(annotation)[0]
+        if _is_optional_model(annotation):
+            annotation = next(a for a in get_args(annotation) if a is not type(None))
+        if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+            raise ConfigFileError(f"Cannot select '{select}': field '{part}' is not a single BaseModel")
+        if default is not None:
+            default = getattr(default, part)
+        elif field_info.default is not PydanticUndefined:
+            default = field_info.default
+        cls = annotation
+    return cls, default if isinstance(default, BaseModel) else None
+
+
+def _select_cli_args(args: list[str], cls: type, select: str) -> list[str]:
+    """Keep only CLI overrides under ``select``, rewritten relative to it.
+
+    Overrides of other fields of ``cls`` are dropped together with their
+    values; args that are not field paths (e.g. ``--help``) are kept.
+    """
+    depth = select.count(".") + 1
+    fields = getattr(cls, "model_fields", {})
+    remaining: list[str] = []
+    dropping = False
+    for arg in args:
+        if not arg.startswith("--"):
+            if not dropping:
+                remaining.append(arg)
+            continue
+        path, eq, value = arg[2:].partition("=")
+        snake_path = path.replace("-", "_")
+        dropping = False
+        if snake_path.startswith(select + "."):
+            remaining.append("--" + ".".join(path.split(".")[depth:]) + eq + value)
+        elif snake_path.split(".")[0] in fields:
+            dropping = True
+        else:
+            remaining.append(arg)
+    return remaining
+
+
 def _nest_config(key_path: str, config: dict) -> dict:
     """
     Nest a config dict under a dotted key path.
@@ -387,6 +1098,533 @@ def _nest_config(key_path: str, config: dict) -> dict:
     return result
 
 
+def _dict_diff(old: dict, new: dict) -> dict | None:
+    """Return a nested dict of the values in ``new`` that differ from ``old``.
+
+    Sub-dicts whose ``type`` tag changed are returned whole, since they select
+    a different union variant. Returns None when a key present in ``old`` was
+    removed, which cannot be expressed as an override.
+    """
+    if old.keys() - new.keys():
+        return None
+    diff: dict = {}
+    for key, value in new.items():
+        if key not in old:
+            diff[key] = value
+            continue
+        prev = old[key]
+        if isinstance(prev, dict) and isinstance(value, dict) and prev.get("type") == value.get("type"):
+            sub = _dict_diff(prev, value)
+            if sub is None:
+                return None
+            if sub:
+                diff[key] = sub
+        elif not _values_equal(prev, value):
+            diff[key] = value
+    return diff
+
+
+def _values_equal(a: object, b: object) -> bool:
+    """``a == b``, with NumPy arrays compared as a whole, also inside models, dicts, lists and tuples."""
+    np = sys.modules.get("numpy")
+    if np is None:
+        # no array can exist without numpy imported
+        return a == b
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return isinstance(a, np.ndarray) and isinstance(b, np.ndarray) and np.array_equal(a, b)
+    if isinstance(a, BaseModel):
+        return (
+            type(a) is type(b)
+            and a.__pydantic_private__ == b.__pydantic_private__
+            and (a.__pydantic_extra__ or {}) == (b.__pydantic_extra__ or {})
+            and all(_values_equal(a.__dict__.get(name), b.__dict__.get(name)) for name in type(a).model_fields)
+        )
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(_values_equal(v, b[k]) for k, v in a.items())
+    if isinstance(a, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(map(_values_equal, a, b))
+    return a == b
+
+
+def _apply_overrides(model: BaseModel, updates: dict) -> BaseModel:
+    """Return a copy of ``model`` with ``updates`` (a nested dict) applied.
+
+    Only the models along the updated paths are re-validated; every other
+    sub-model instance is passed through as-is and shared with ``model``.
+    A dict update that switches a union variant (different ``type`` tag)
+    replaces the whole sub-model. A dict update of a dict field is merged
+    into its current value, and one keyed by indices (``{"0": ...}``) of a
+    list field updates those entries. Raises pydantic's ValidationError, or
+    ValueError for an index past the end of a list.
+    """
+    data = dict(model.__dict__)
+    for key, value in updates.items():
+        data[key] = _updated_value(data.get(key), value, key)
+    new = type(model).model_validate(data)
+    object.__setattr__(new, "__pydantic_fields_set__", model.__pydantic_fields_set__ | updates.keys())
+    return new
+
+
+def _updated_value(current: object, value: object, path: str) -> object:
+    """``current`` (the value at ``path``) updated with ``value``, for ``_apply_overrides``."""
+    if not isinstance(value, dict):
+        return value
+    if isinstance(current, BaseModel):
+        if value.get("type", getattr(current, "type", None)) != getattr(current, "type", None):
+            return value
+        return _apply_overrides(current, value)
+    if isinstance(current, dict):
+        # a sub-dict with another ``type`` tag is replaced, like a union variant
+        if value.get("type", current.get("type")) != current.get("type"):
+            return value
+        merged = dict(current)
+        for key, sub_value in value.items():
+            merged[key] = _updated_value(current.get(key), sub_value, f"{path}.{key}")
+        return merged
+    if isinstance(current, list) and value and all(isinstance(key, str) and key.isdigit() for key in value):
+        items = list(current)
+        for key, item_value in value.items():
+            index = int(key)
+            if index >= len(items):
+                raise ValueError(f"Cannot override '{path}.{index}': '{path}' has {len(items)} entries")
+            items[index] = _updated_value(items[index], item_value, f"{path}.{index}")
+        return items
+    return value
+
+
+class _IdentityMemo:
+    """Cache keyed by object identity; entries are dropped when the object is garbage collected."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref, object]] = {}
+
+    def get(self, obj: object, default: object = None) -> object:
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        return default
+
+    def set(self, obj: object, value: object) -> None:
+        key = id(obj)
+        entries = self._entries
+        entries[key] = (weakref.ref(obj, lambda _ref: entries.pop(key, None)), value)
+
+
+_DIGEST_MEMO = _IdentityMemo()
+# Sub-config defaults shared between instances (``share_defaults = True``)
+_SHARED_DEFAULTS = _IdentityMemo()
+
+# Serialization context key set while dumping for ``config_hash``; custom
+# serializers (e.g. NDArray fields) may dump a content digest instead.
+HASH_CONTEXT_KEY = "pydantic_config.hash"
+
+
+def _is_frozen(model: BaseModel) -> bool:
+    return bool(model.model_config.get("frozen"))
+
+
+def _is_shared_default(model: BaseModel) -> bool:
+    return _SHARED_DEFAULTS.get(model) is not None
+
+
+def _is_immutable(model: BaseModel) -> bool:
+    return _is_frozen(model) or _is_shared_default(model)
+
+
+def _share_default(model: BaseModel) -> None:
+    """Mark ``model`` and its sub-models as shared defaults, which rejects attribute assignment."""
+    _SHARED_DEFAULTS.set(model, True)
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        values = value if isinstance(value, (list, tuple)) else value.values() if isinstance(value, dict) else [value]
+        for item in values:
+            if isinstance(item, BaseModel) and not _is_shared_default(item):
+                _share_default(item)
+
+
+def _reuse_shared_defaults(model: BaseModel) -> BaseModel:
+    """Put shared default instances back where ``model`` holds an equal copy of them.
+
+    tyro rebuilds every sub-config it parses; this keeps the ones no
+    argument changed pointing at the class's shared default.
+    """
+    updates = {}
+    for name, field_info in type(model).model_fields.items():
+        value = getattr(model, name)
+        if not isinstance(value, BaseModel):
+            continue
+        default = field_info.default
+        if (
+            isinstance(default, BaseModel)
+            and _is_shared_default(default)
+            and value is not default
+            and type(value) is type(default)
+            and _config_digest(value) == _config_digest(default)
+        ):
+            updates[name] = default
+        else:
+            reused = _reuse_shared_defaults(value)
+            if reused is not value:
+                updates[name] = reused
+    return model.model_copy(update=updates) if updates else model
+
+
+def _config_digest(model: BaseModel) -> bytes:
+    """Canonical sha256 digest of a model's content.
+
+    Each sub-model (direct or inside a list/tuple) is digested separately and
+    referenced by its digest, so the digest of a frozen sub-model is computed
+    once and memoized. Leaf fields go through pydantic's JSON-mode dump and
+    ``json.dumps(sort_keys=True)``, which makes the result independent of
+    dict ordering and uses the shortest round-trip float repr.
+    """
+    frozen = _is_immutable(model)
+    if frozen:
+        cached = _DIGEST_MEMO.get(model)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+
+    sub_digests: dict[str, object] = {}
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if isinstance(value, BaseModel):
+            sub_digests[name] = {"__digest__": _config_digest(value).hex()}
+        elif isinstance(value, (list, tuple)) and value and all(isinstance(v, BaseModel) for v in value):
+            sub_digests[name] = [{"__digest__": _config_digest(v).hex()} for v in value]
+
+    data = model.model_dump(mode="json", exclude=set(sub_digests), context={HASH_CONTEXT_KEY: True})
+    for name, value in data.items():
+        data[name] = _sorted_sets(model.__dict__.get(name), value)
+    data.update(sub_digests)
+    blob = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    digest = hashlib.sha256(blob.encode()).digest()
+
+    if frozen:
+        _DIGEST_MEMO.set(model, digest)
+    return digest
+
+
+def _sorted_sets(value: object, dumped: object) -> object:
+    """``dumped`` (the JSON-mode dump of ``value``) with the lists dumped from sets sorted.
+
+    Sets are dumped in iteration order, which depends on the hash seed.
+    """
+    if isinstance(value, (set, frozenset)) and isinstance(dumped, list):
+        return sorted(dumped, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    if isinstance(value, BaseModel) and isinstance(dumped, dict):
+        return {key: _sorted_sets(value.__dict__.get(key), item) for key, item in dumped.items()}
+    if isinstance(value, dict) and isinstance(dumped, dict) and len(value) == len(dumped):
+        return {
+            key: _sorted_sets(item, dumped_item) for (key, dumped_item), item in zip(dumped.items(), value.values())
+        }
+    if isinstance(value, (list, tuple)) and isinstance(dumped, list) and len(value) == len(dumped):
+        return [_sorted_sets(item, dumped_item) for item, dumped_item in zip(value, dumped)]
+    return dumped
+
+
+def config_hash(config: BaseModel) -> str:
+    """Stable, order-independent content hash (hex sha256) of a resolved config.
+
+    Two configs with the same field values hash the same regardless of dict
+    ordering or how they were built. Digests of frozen sub-configs are
+    memoized, so re-hashing configs that share them is cheap.
+    """
+    return _config_digest(config).hex()
+
+
+_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _canonical_repr(value: object) -> str:
+    """``repr`` that does not depend on the hash seed: set elements are sorted by their repr."""
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({{{', '.join(sorted(_canonical_repr(v) for v in value))}}})"
+    if isinstance(value, (tuple, list)):
+        return f"{type(value).__name__}({', '.join(_canonical_repr(v) for v in value)})"
+    if isinstance(value, dict):
+        return f"dict({', '.join(f'{_canonical_repr(k)}: {_canonical_repr(v)}' for k, v in value.items())})"
+    return _ADDRESS_RE.sub("", repr(value))
+
+
+def _code_constants_fingerprint(code: types.CodeType, h: hashlib._Hash) -> None:
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_constants_fingerprint(const, h)
+        else:
+            h.update(_canonical_repr(const).encode())
+
+
+def _code_fingerprint(func: object, h: hashlib._Hash) -> None:
+    """Feed the bytecode and constants of a validator function (and of the code nested in it) into ``h``."""
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        h.update(_ADDRESS_RE.sub("", repr(func)).encode())
+        return
+    _code_constants_fingerprint(code, h)
+
+
+def _model_classes_in(annotation: object) -> list[type[BaseModel]]:
+    """All BaseModel subclasses referenced by an annotation (through unions, lists, Annotated, ...)."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    found: list[type[BaseModel]] = []
+    for arg in get_args(annotation):
+        found.extend(_model_classes_in(arg))
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint(cls: type[BaseModel]) -> str:
+    """Hex digest identifying the schema of ``cls`` and of every model it references.
+
+    Covers class names, field names, annotations, defaults and the bytecode of
+    validators and serializers, so it changes whenever a config that validated
+    before could validate differently.
+    """
+    h = hashlib.sha256()
+    seen: set[type] = set()
+    pending: list[type[BaseModel]] = [cls]
+    while pending:
+        model_cls = pending.pop()
+        if model_cls in seen:
+            continue
+        seen.add(model_cls)
+        header = f"{model_cls.__module__}.{model_cls.__qualname__}({model_cls.model_config!r})"
+        h.update(_ADDRESS_RE.sub("", header).encode())
+        for name, field_info in model_cls.model_fields.items():
+            default = field_info.default
+            if field_info.default_factory is not None:
+                default = getattr(field_info.default_factory, "__qualname__", field_info.default_factory)
+            h.update(_ADDRESS_RE.sub("", f"|{name}:{field_info.annotation!r}={_canonical_repr(default)}").encode())
+            pending.extend(_model_classes_in(field_info.annotation))
+        decorators = model_cls.__pydantic_decorators__
+        for group in ("field_validators", "model_validators", "field_serializers", "model_serializers"):
+            for name, decorator in sorted(getattr(decorators, group).items()):
+                h.update(f"|{group}.{name}".encode())
+                _code_fingerprint(decorator.func, h)
+    return h.hexdigest()
+
+
+# Markers of the compact pickle layout, in place of a sub-model's variant index
+_PICKLED_NONE = -1
+# the next value is the sub-model (or list) itself, pickled on its own
+_PICKLED_OBJECT = -2
+
+# BaseModel slot setters, for building instances without __init__
+_SET_FIELDS_SET = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_SET_EXTRA = BaseModel.__dict__["__pydantic_extra__"].__set__
+_SET_PRIVATE = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+@functools.lru_cache(maxsize=None)
+def _pickle_layout(
+    cls: type[BaseModel],
+) -> tuple[tuple[str, tuple[str, ...], tuple[type[BaseModel], ...], dict[type, int]], ...]:
+    """The fields of ``cls`` in pickle order, as ``(kind, names, models, variant index)`` segments.
+
+    Consecutive leaf fields form one ``"leaves"`` segment, so their values
+    are moved in a single ``map``/``zip``; ``"model"`` and ``"list"``
+    segments hold one sub-model (or list of sub-models) field. The variant
+    index maps the classes that are inlined (all but frozen ones) to their
+    position in ``models``.
+    """
+    kinds = {"model": "model", "optional_model": "model", "union": "model", "model_list": "list"}
+    layout: list[tuple[str, tuple[str, ...], tuple[type[BaseModel], ...], dict[type, int]]] = []
+    for planned in _field_plan(cls):
+        kind = kinds.get(planned.kind, "leaves")
+        if kind == "leaves" and layout and layout[-1][0] == "leaves":
+            layout[-1] = ("leaves", (*layout[-1][1], planned.name), (), {})
+            continue
+        variants = {model: i for i, model in enumerate(planned.models) if not model.model_config.get("frozen")}
+        layout.append((kind, (planned.name,), planned.models, variants))
+    return tuple(layout)
+
+
+@functools.lru_cache(maxsize=None)
+def _pickle_schema(cls: type[BaseModel]) -> tuple[tuple[tuple[str, tuple[str, ...], tuple[int | None, ...]], ...], ...]:
+    """The pickle layout of ``cls`` and of every class inlined under it, ``cls`` first.
+
+    Each class is a tuple of ``(kind, names, variants)`` segments, where
+    ``variants`` holds, per model of the segment, the position of its class
+    in the schema (None for classes that are not inlined). Pickles carry it
+    so a process whose classes changed can still decode the values.
+    """
+    classes = [cls]
+    positions = {cls: 0}
+    schema = []
+    for model_cls in classes:
+        segments = []
+        for kind, names, models, variants in _pickle_layout(model_cls):
+            refs: list[int | None] = []
+            for model in models:
+                if model not in variants:
+                    refs.append(None)
+                    continue
+                if model not in positions:
+                    positions[model] = len(classes)
+                    classes.append(model)
+                refs.append(positions[model])
+            segments.append((kind, names, tuple(refs)))
+        schema.append(tuple(segments))
+    return tuple(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_bits(cls: type[BaseModel]) -> dict[str, int]:
+    return {name: 1 << i for i, name in enumerate(cls.model_fields)}
+
+
+@functools.lru_cache(maxsize=4096)
+def _fields_set_from_bits(cls: type[BaseModel], mask: int) -> frozenset[str]:
+    return frozenset(name for name, bit in _field_bits(cls).items() if mask & bit)
+
+
+def _pickle_fields(model: BaseModel, out: list) -> None:
+    """Append the fields-set mask and the field values of ``model`` to ``out``, sub-models inlined."""
+    cls = type(model)
+    out.append(sum(map(_field_bits(cls).__getitem__, model.__pydantic_fields_set__)))
+    fields = model.__dict__
+    for kind, names, _, variants in _pickle_layout(cls):
+        if kind == "leaves":
+            out.extend(map(fields.__getitem__, names))
+            continue
+        value = fields[names[0]]
+        if kind == "model":
+            _pickle_sub_model(value, variants, out)
+        elif type(value) is list:
+            out.append(len(value))
+            for item in value:
+                _pickle_sub_model(item, variants, out)
+        else:
+            out.append(_PICKLED_OBJECT)
+            out.append(value)
+
+
+def _pickle_sub_model(value: object, variants: dict[type, int], out: list) -> None:
+    index = variants.get(type(value))
+    if (
+        index is not None
+        and value.__pydantic_private__ is None  # type: ignore[attr-defined]
+        and not value.__pydantic_extra__  # type: ignore[attr-defined]
+        and not _is_shared_default(value)  # type: ignore[arg-type]
+    ):
+        out.append(index)
+        _pickle_fields(value, out)  # type: ignore[arg-type]
+    elif value is None:
+        out.append(_PICKLED_NONE)
+    else:
+        # frozen and shared sub-configs stay objects, so the pickle memo keeps them shared
+        out.append(_PICKLED_OBJECT)
+        out.append(value)
+
+
+def _unpickle_fields(cls: type[BaseModel], values: Iterator) -> BaseModel:
+    """Rebuild a ``cls`` instance from the values produced by ``_pickle_fields``, without validation."""
+    mask = next(values)
+    fields: dict[str, object] = {}
+    for kind, names, models, _ in _pickle_layout(cls):
+        if kind == "leaves":
+            # zip stops at the end of ``names`` without drawing from ``values``
+            fields.update(zip(names, values))
+            continue
+        code = next(values)
+        if code == _PICKLED_OBJECT:
+            fields[names[0]] = next(values)
+        elif kind == "model":
+            fields[names[0]] = None if code == _PICKLED_NONE else _unpickle_fields(models[code], values)
+        else:
+            fields[names[0]] = [_unpickle_sub_model(models, values) for _ in range(code)]
+    model = object.__new__(cls)
+    object.__setattr__(model, "__dict__", fields)
+    _SET_FIELDS_SET(model, set(_fields_set_from_bits(cls, mask)))
+    _SET_EXTRA(model, None)
+    _SET_PRIVATE(model, None)
+    return model
+
+
+def _unpickle_sub_model(models: tuple[type[BaseModel], ...], values: Iterator) -> object:
+    code = next(values)
+    if code == _PICKLED_NONE:
+        return None
+    if code == _PICKLED_OBJECT:
+        return next(values)
+    return _unpickle_fields(models[code], values)
+
+
+def _unpickled_data(schema: tuple, position: int, values: Iterator) -> dict:
+    """Decode the values of one class of ``schema`` into a dict, sub-models as nested dicts."""
+    next(values)  # fields-set mask, recomputed by validation
+    data: dict[str, object] = {}
+    for kind, names, variants in schema[position]:
+        if kind == "leaves":
+            data.update(zip(names, values))
+            continue
+        code = next(values)
+        if code == _PICKLED_OBJECT:
+            data[names[0]] = next(values)
+        elif kind == "model":
+            data[names[0]] = None if code == _PICKLED_NONE else _unpickled_data(schema, variants[code], values)
+        else:
+            data[names[0]] = [_unpickled_sub_data(schema, variants, values) for _ in range(code)]
+    return data
+
+
+def _unpickled_sub_data(schema: tuple, variants: tuple[int | None, ...], values: Iterator) -> object:
+    code = next(values)
+    if code == _PICKLED_NONE:
+        return None
+    if code == _PICKLED_OBJECT:
+        return next(values)
+    return _unpickled_data(schema, variants[code], values)
+
+
+def _unpickle_config(cls: type[BaseModel], fingerprint: str, values: tuple, schema: tuple | None = None) -> BaseModel:
+    """Rebuild a config pickled by ``BaseConfig.__reduce_ex__``.
+
+    When the class changed since the config was pickled (another schema
+    fingerprint), the values are decoded with the pickled ``schema`` and
+    validated against the current class instead.
+    """
+    if _schema_fingerprint(cls) != fingerprint:
+        if schema is None:
+            raise pickle.UnpicklingError(
+                f"Cannot unpickle {cls.__name__}: its schema changed since it was pickled (schema fingerprint mismatch)"
+            )
+        try:
+            return cls.model_validate(_unpickled_data(schema, 0, iter(values)))
+        except ValidationError as e:
+            raise pickle.UnpicklingError(
+                f"Cannot unpickle {cls.__name__}: the pickled values do not validate against its current schema\n{e}"
+            ) from e
+    model = _unpickle_fields(cls, iter(values))
+    if isinstance(model, FrozenConfig):
+        _freeze_fields(model)
+    if _is_frozen(model):
+        model = _INTERNED.setdefault((cls, _config_digest(model)), model)
+    return model
+
+
+@functools.lru_cache(maxsize=None)
+def _import_target(target: str) -> type[BaseModel]:
+    """Import a config class from a ``module:Class`` (or ``module.Class``) string."""
+    module_name, sep, qualname = target.partition(":")
+    if not sep:
+        module_name, _, qualname = target.rpartition(".")
+    if not module_name or not qualname:
+        raise ConfigFileError(f"Invalid config class '{target}'. Expected 'package.module:ClassName'")
+    try:
+        obj: object = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as e:
+        raise ConfigFileError(f"Cannot import config class '{target}': {e}") from e
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+        raise ConfigFileError(f"'{target}' is not a Pydantic BaseModel")
+    return obj
+
+
 def _is_optional_model(annotation: type) -> bool:
     """Check if annotation is Optional[SomeBaseModel] (i.e. SomeBaseModel | None)."""
     if hasattr(annotation, "__metadata__"):
@@ -411,25 +1649,6 @@ def _is_multi_model_union(annotation: type) -> bool:
     return len(non_none) > 1 and all(isinstance(a, type) and issubclass(a, BaseModel) for a in non_none)
 
 
-def _find_optional_model_paths(cls: type, prefix: str = "") -> set[str]:
-    """Recursively find all CLI arg paths (kebab-case) that map to Optional[BaseModel] or discriminated union fields."""
-    paths: set[str] = set()
-    if not hasattr(cls, "model_fields"):
-        return paths
-    for field_name, field_info in cls.model_fields.items():
-        field_kebab = field_name.replace("_", "-")
-        full_path = f"{prefix}.{field_kebab}" if prefix else field_kebab
-        annotation = field_info.annotation
-        if _is_optional_model(annotation) or _is_multi_model_union(annotation):
-            paths.add(full_path)
-        inner = annotation
-        if hasattr(inner, "__metadata__"):
-            inner = get_args(inner)[0]
-        if isinstance(inner, type) and issubclass(inner, BaseModel):
-            paths.update(_find_optional_model_paths(inner, prefix=full_path))
-    return paths
-
-
 def _is_dict_field(annotation: type) -> bool:
     """Check if annotation is a dict type (bare ``dict`` or ``dict[str, Any]``)."""
     if hasattr(annotation, "__metadata__"):
@@ -437,23 +1656,152 @@ def _is_dict_field(annotation: type) -> bool:
     return annotation is dict or get_origin(annotation) is dict
 
 
-def _find_dict_field_paths(cls: type, prefix: str = "") -> set[str]:
-    """Recursively find all CLI arg paths (kebab-case) that map to dict fields."""
-    paths: set[str] = set()
-    if not hasattr(cls, "model_fields"):
-        return paths
-    for field_name, field_info in cls.model_fields.items():
-        field_kebab = field_name.replace("_", "-")
-        full_path = f"{prefix}.{field_kebab}" if prefix else field_kebab
+def _is_model_list(annotation: object) -> bool:
+    """Check if annotation is ``list[SomeBaseModel]``."""
+    args = get_args(annotation)
+    return (
+        get_origin(annotation) is list
+        and len(args) == 1
+        and isinstance(args[0], type)
+        and issubclass(args[0], BaseModel)
+    )
+
+
+@dataclass(frozen=True)
+class _PlannedField:
+    """How the pipeline treats one field of a model class."""
+
+    name: str
+    annotation: object
+    # "model", "optional_model", "union", "registry", "array", "model_list", "dict" or "leaf"
+    kind: str
+    # model classes the field can hold (the variants for unions)
+    models: tuple[type[BaseModel], ...] = ()
+
+
+@functools.lru_cache(maxsize=None)
+def _field_plan(cls: type) -> tuple[_PlannedField, ...]:
+    """Classify the direct fields of ``cls`` once per class."""
+    from pydantic_config.arrays import _is_array_field
+
+    plan = []
+    for field_name, field_info in getattr(cls, "model_fields", {}).items():
         annotation = field_info.annotation
-        if _is_dict_field(annotation):
-            paths.add(full_path)
-        inner = annotation
-        if hasattr(inner, "__metadata__"):
-            inner = get_args(inner)[0]
-        if isinstance(inner, type) and issubclass(inner, BaseModel):
-            paths.update(_find_dict_field_paths(inner, prefix=full_path))
-    return paths
+        inner = get_args(annotation)[0] if hasattr(annotation, "__metadata__") else annotation
+        members = tuple(a for a in get_args(inner) if a is not type(None))
+        if _is_registry_field(field_info.metadata):
+            planned = _PlannedField(field_name, inner, "registry")
+        elif _is_array_field(field_info.metadata):
+            planned = _PlannedField(field_name, inner, "array")
+        elif _is_optional_model(annotation):
+            planned = _PlannedField(field_name, inner, "optional_model", members)
+        elif _is_multi_model_union(annotation):
+            planned = _PlannedField(field_name, inner, "union", members)
+        elif isinstance(inner, type) and issubclass(inner, BaseModel):
+            planned = _PlannedField(field_name, inner, "model", (inner,))
+        elif _is_model_list(inner):
+            planned = _PlannedField(field_name, inner, "model_list", get_args(inner))
+        elif _is_dict_field(annotation):
+            planned = _PlannedField(field_name, inner, "dict")
+        else:
+            planned = _PlannedField(field_name, inner, "leaf")
+        plan.append(planned)
+    return tuple(plan)
+
+
+def _walk_plan(cls: type, prefix: str = "", into: tuple[str, ...] = ("model",)) -> Iterator[tuple[str, _PlannedField]]:
+    """Yield (dotted_snake_path, field) for ``cls``, descending into fields whose kind is in ``into``."""
+    for planned in _field_plan(cls):
+        path = f"{prefix}.{planned.name}" if prefix else planned.name
+        yield path, planned
+        if planned.kind in into:
+            for model in planned.models:
+                yield from _walk_plan(model, path, into)
+
+
+def _kebab_path(path: str) -> str:
+    return path.replace("_", "-")
+
+
+@functools.lru_cache(maxsize=None)
+def _find_optional_model_paths(cls: type, prefix: str = "") -> frozenset[str]:
+    """Recursively find all CLI arg paths (kebab-case) that map to Optional[BaseModel] or discriminated union fields."""
+    kinds = ("optional_model", "union", "registry")
+    return frozenset(
+        f"{prefix}.{_kebab_path(path)}" if prefix else _kebab_path(path)
+        for path, planned in _walk_plan(cls)
+        if planned.kind in kinds
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _find_dict_field_paths(cls: type, prefix: str = "") -> frozenset[str]:
+    """Recursively find all CLI arg paths (kebab-case) that map to dict fields."""
+    return frozenset(
+        f"{prefix}.{_kebab_path(path)}" if prefix else _kebab_path(path)
+        for path, planned in _walk_plan(cls)
+        if planned.kind == "dict"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _holds_arrays(cls: type) -> bool:
+    """Whether ``cls`` has an NDArray field, also in sub-models, union variants and lists of models."""
+    into = ("model", "optional_model", "union", "model_list")
+    return any(planned.kind == "array" for _, planned in _walk_plan(cls, into=into))
+
+
+@functools.lru_cache(maxsize=None)
+def _find_array_field_paths(cls: type, prefix: str = "") -> frozenset[str]:
+    """Recursively find all CLI arg paths (kebab-case) that map to NDArray fields."""
+    return frozenset(
+        f"{prefix}.{_kebab_path(path)}" if prefix else _kebab_path(path)
+        for path, planned in _walk_plan(cls)
+        if planned.kind == "array"
+    )
+
+
+def _env_head(env_prefix: str) -> str:
+    """Start of every environment variable name for ``env_prefix`` (``"app"`` and ``"APP_"`` give ``"APP__"``)."""
+    return env_prefix.rstrip("_").upper() + "__"
+
+
+@functools.lru_cache(maxsize=None)
+def _env_index(cls: type, env_prefix: str) -> dict[str, str]:
+    """Map every allowed environment variable name to its dotted field path.
+
+    ``APP__TRAIN__LR`` -> ``train.lr`` for ``env_prefix="APP"``. Fields of
+    Optional[BaseModel] and union sub-models are included; VariantRegistry
+    fields can only be set as a whole (JSON), since listing their sub-fields
+    would import the variants.
+    """
+    head = _env_head(env_prefix)
+    return {
+        head + path.replace(".", "__").upper(): path
+        for path, _ in _walk_plan(cls, into=("model", "optional_model", "union"))
+    }
+
+
+def _parse_cli_value(value: str) -> str | dict | list:
+    """Parse a raw override value: JSON for ``{...}``/``[...]``, otherwise the string (pydantic coerces it)."""
+    if value.startswith(("{", "[")):
+        return json.loads(value)
+    return value
+
+
+def _collect_env_overrides(cls: type, env_prefix: str, environ: Mapping[str, str] | None = None) -> dict:
+    """Build the env var override layer with one lookup per known variable name."""
+    environ = os.environ if environ is None else environ
+    overrides: dict = {}
+    for env_name, path in _env_index(cls, env_prefix).items():
+        value = environ.get(env_name)
+        if value is not None:
+            try:
+                parsed = _parse_cli_value(value)
+            except json.JSONDecodeError as e:
+                raise ConfigFileError(f"Invalid JSON in environment variable {env_name}: {e}")
+            _merge_into(overrides, _nest_config(path, parsed))
+    return overrides
 
 
 def _extract_json_dict_args(args: list[str], dict_paths: set[str]) -> tuple[list[str], dict]:
@@ -477,7 +1825,7 @@ def _extract_json_dict_args(args: list[str], dict_paths: set[str]) -> tuple[list
                 parsed = json.loads(value_str)
                 snake_path = path.replace("-", "_")
                 nested = _nest_config(snake_path, parsed)
-                overrides = _deep_merge(overrides, nested)
+                _merge_into(overrides, nested)
                 i += 2
                 continue
         remaining.append(args[i])
@@ -486,6 +1834,30 @@ def _extract_json_dict_args(args: list[str], dict_paths: set[str]) -> tuple[list
     return remaining, overrides
 
 
+def _extract_array_args(args: list[str], array_paths: set[str]) -> tuple[list[str], dict]:
+    """Intercept CLI args for NDArray fields and keep their values as raw strings.
+
+    The field validator parses them (``.npy``/``.npz`` references or compact
+    literals like ``0.5*1000,1.0``), so nothing is tokenized by tyro.
+
+    Returns (remaining_args, config_overrides_as_nested_dict).
+    """
+    remaining: list[str] = []
+    overrides: dict = {}
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith("--") and arg[2:] in array_paths and i + 1 < len(args):
+            _merge_into(overrides, _nest_config(arg[2:].replace("-", "_"), args[i + 1]))
+            i += 2
+            continue
+        remaining.append(arg)
+        i += 1
+
+    return remaining, overrides
+
+
 def _match_optional_prefix(path: str, optional_paths: set[str]) -> str | None:
     """If ``path`` starts with an optional model path followed by '.', return it."""
     for opt_path in optional_paths:
@@ -523,7 +1895,7 @@ def _expand_bare_optional_flags(
                 if not next_is_value:
                     snake_path = path.replace("-", "_")
                     nested = _nest_config(snake_path, {})
-                    overrides = _deep_merge(overrides, nested)
+                    _merge_into(overrides, nested)
                     i += 1
                     continue
 
@@ -532,17 +1904,15 @@ def _expand_bare_optional_flags(
             if matched is not None:
                 snake_path = path.replace("-", "_")
                 if i + 1 < len(args) and not args[i + 1].startswith("--") and not args[i + 1].startswith("@"):
-                    value: str | dict | list = args[i + 1]
-                    if isinstance(value, str) and value.startswith(("{", "[")):
-                        value = json.loads(value)
+                    value = _parse_cli_value(args[i + 1])
                     nested = _nest_config(snake_path, value)
-                    overrides = _deep_merge(overrides, nested)
+                    _merge_into(overrides, nested)
                     i += 2
                     continue
                 else:
                     # Bare sub-flag (e.g. --wandb.enabled with no value → True)
                     nested = _nest_config(snake_path, True)
-                    overrides = _deep_merge(overrides, nested)
+                    _merge_into(overrides, nested)
                     i += 1
                     continue
 
@@ -552,18 +1922,562 @@ def _expand_bare_optional_flags(
     return remaining, overrides
 
 
-def _build_default_from_config(cls: type[T], config: dict, config_path: str | None = None) -> T | None:
+INTERPOLATION_START = "${"
+# ``$${...}`` is a literal ``${...}``
+ESCAPED_INTERPOLATION_START = "$${"
+_INTERPOLATION_RE = re.compile(r"(?<!\$)\$\{\s*([^}\s]+)\s*\}")
+_ARITHMETIC_TEXT_RE = re.compile(r"[\d\s.+\-*/%()eE]*")
+_ARITHMETIC_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.operator, ast.unaryop)
+_BINARY_OPS: dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_MISSING = object()
+
+
+def _eval_arithmetic(expression: str) -> int | float:
+    """Evaluate a plain arithmetic expression (numbers, + - * / // % ** and parentheses)."""
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ARITHMETIC_NODES) or (
+            isinstance(node, ast.Constant) and type(node.value) not in (int, float)
+        ):
+            raise ValueError(f"unsupported expression: {expression}")
+
+    def _eval(node: ast.AST) -> int | float:
+        if isinstance(node, ast.Expression):
+            return _eval(node.body)
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.UnaryOp):
+            value = _eval(node.operand)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            return _BINARY_OPS[type(node.op)](_eval(node.left), _eval(node.right))
+        raise ValueError(f"unsupported expression: {expression}")
+
+    return _eval(tree)
+
+
+def _parse_scalar(value: str) -> int | float | bool | str:
+    """Parse a raw CLI string as int, float or bool for use in interpolations."""
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _lookup_path(data: object, parts: list[str]) -> object:
+    """Follow ``parts`` through nested dicts and lists. Returns _MISSING if absent."""
+    for part in parts:
+        if isinstance(data, dict) and part in data:
+            data = data[part]
+        elif isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        else:
+            return _MISSING
+    return data
+
+
+def _lookup_default(cls: type, parts: list[str]) -> object:
+    """Look up a field default along ``parts`` of a model class. Returns _MISSING if absent."""
+    value: object = _MISSING
+    for part in parts:
+        if value is _MISSING:
+            fields = getattr(cls, "model_fields", None)
+            if not fields or part not in fields:
+                return _MISSING
+            field_info = fields[part]
+            if field_info.default is not PydanticUndefined:
+                value = field_info.default
+            else:
+                inner = field_info.annotation
+                if hasattr(inner, "__metadata__"):
+                    inner = get_args(inner)[0]
+                if not (isinstance(inner, type) and issubclass(inner, BaseModel)):
+                    return _MISSING
+                cls = inner
+        elif isinstance(value, BaseModel):
+            value = getattr(value, part, _MISSING)
+        elif isinstance(value, dict):
+            value = value.get(part, _MISSING)
+        else:
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+    return value.model_dump() if isinstance(value, BaseModel) else value
+
+
+def _extract_interpolated_args(args: list[str]) -> tuple[list[str], dict, dict[str, str]]:
+    """Pull ``--path value`` args whose value contains ``${...}`` out of the tyro args.
+
+    Returns (remaining_args, overrides_as_nested_dict, raw_cli_values). The
+    raw values of all other ``--path value`` args are returned so that
+    interpolations can refer to values set on the command line.
+    """
+    remaining: list[str] = []
+    overrides: dict = {}
+    cli_values: dict[str, str] = {}
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith("--") and "=" in arg:
+            name, value = arg[2:].split("=", 1)
+            snake_path = name.replace("-", "_")
+            if INTERPOLATION_START in value:
+                _merge_into(overrides, _nest_config(snake_path, value))
+                i += 1
+                continue
+            cli_values[snake_path] = value
+        elif arg.startswith("--") and i + 1 < len(args) and not args[i + 1].startswith("--"):
+            snake_path = arg[2:].replace("-", "_")
+            value = args[i + 1]
+            if INTERPOLATION_START in value:
+                _merge_into(overrides, _nest_config(snake_path, value))
+                i += 2
+                continue
+            cli_values[snake_path] = value
+        remaining.append(arg)
+        i += 1
+
+    return remaining, overrides, cli_values
+
+
+def _interpolation_refs(roots: set[str], template: str) -> list[str]:
+    """The references of ``template``, in order.
+
+    ``${NAME}`` is a reference only when ``NAME`` starts with one of
+    ``roots`` (field names and top-level config keys); anything else
+    (``${HOME}``) is kept as literal text.
+    """
+    refs = (ref.replace("-", "_") for ref in _INTERPOLATION_RE.findall(template))
+    return [ref for ref in refs if ref.split(".", 1)[0] in roots]
+
+
+def _unescape_interpolations(value: str) -> str:
+    return value.replace(ESCAPED_INTERPOLATION_START, INTERPOLATION_START)
+
+
+def _render_interpolation(template: str, refs: list[str], values: list[object]) -> object:
+    """Render one interpolated string from the already-resolved values of its references."""
+    resolved = dict(zip(refs, values))
+
+    def substitute(render: Callable[[object], str]) -> str:
+        def replace(match: re.Match) -> str:
+            ref = match.group(1).replace("-", "_")
+            return render(resolved[ref]) if ref in resolved else match.group(0)
+
+        return _unescape_interpolations(_INTERPOLATION_RE.sub(replace, template))
+
+    match = _INTERPOLATION_RE.fullmatch(template.strip())
+    if match and match.group(1).replace("-", "_") in resolved:
+        value = values[0]
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    literal_text = _INTERPOLATION_RE.sub("", template)
+    numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+    if numeric and _ARITHMETIC_TEXT_RE.fullmatch(literal_text):
+        try:
+            return _eval_arithmetic(substitute(repr))
+        except (ValueError, SyntaxError, ArithmeticError):
+            pass
+
+    return substitute(str)
+
+
+def _resolve_interpolations(cls: type, config: dict, cli_values: dict[str, str] | None = None) -> dict:
+    """Resolve ``${a.b}`` references in the merged config dict, in place.
+
+    References are looked up in CLI args first, then in the merged config,
+    then in the field defaults of ``cls``. A string that is exactly one
+    reference takes the referenced value as-is; numeric references combined
+    with arithmetic (``${train.epochs} * ${data.steps_per_epoch}``) are
+    evaluated; anything else is string interpolation. ``${NAME}`` where
+    ``NAME`` is not a field path is left as-is, and ``$${...}`` is a literal
+    ``${...}``.
+
+    All references are collected in one pass, ordered with a topological
+    sort of their dependency graph and evaluated once each, so the cost is
+    linear in the number of references. Cycles raise ConfigFileError.
+    """
+    cli_values = cli_values or {}
+    roots = {*getattr(cls, "model_fields", {}), *config, *(path.split(".", 1)[0] for path in cli_values)}
+    # path -> (container, key, template, refs)
+    nodes: dict[str, tuple[dict | list, str | int, str, list[str]]] = {}
+    # prefix -> node paths under it, for references to whole sub-trees
+    nodes_under: dict[str, list[str]] = {}
+
+    stack: list[tuple[str, dict | list]] = [("", config)]
+    while stack:
+        prefix, container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if isinstance(value, (dict, list)):
+                stack.append((path, value))
+            elif isinstance(value, str) and INTERPOLATION_START in value:
+                refs = _interpolation_refs(roots, value)
+                if not refs:
+                    container[key] = _unescape_interpolations(value)  # type: ignore[index]
+                    continue
+                nodes[path] = (container, key, value, refs)
+                parts = path.split(".")
+                for depth in range(1, len(parts)):
+                    nodes_under.setdefault(".".join(parts[:depth]), []).append(path)
+
+    if not nodes:
+        return config
+
+    def dependencies(path: str) -> list[str]:
+        deps = []
+        for ref in nodes[path][3]:
+            if ref in nodes:
+                deps.append(ref)
+            deps.extend(nodes_under.get(ref, ()))
+        return deps
+
+    # Iterative depth-first topological sort with cycle detection.
+    order: list[str] = []
+    state: dict[str, int] = {}  # 1 = on the current path, 2 = done
+    for start in nodes:
+        if start in state:
+            continue
+        state[start] = 1
+        trail = [start]
+        pending = [iter(dependencies(start))]
+        while pending:
+            dep = next(pending[-1], None)
+            if dep is None:
+                done = trail.pop()
+                pending.pop()
+                state[done] = 2
+                order.append(done)
+            elif state.get(dep) == 1:
+                cycle = trail[trail.index(dep) :] + [dep]
+                raise ConfigFileError(f"Interpolation cycle: {' -> '.join(cycle)}")
+            elif dep not in state:
+                state[dep] = 1
+                trail.append(dep)
+                pending.append(iter(dependencies(dep)))
+
+    for path in order:
+        container, key, template, refs = nodes[path]
+        values = []
+        for ref in refs:
+            if ref in cli_values:
+                value = _parse_scalar(cli_values[ref])
+            else:
+                parts = ref.split(".")
+                value = _lookup_path(config, parts)
+                if value is _MISSING:
+                    value = _lookup_default(cls, parts)
+            if value is _MISSING:
+                raise ConfigFileError(f"Unresolved interpolation ${{{ref}}} in '{path}'")
+            values.append(value)
+        container[key] = _render_interpolation(template, refs, values)
+
+    return config
+
+
+# list-of-model fields are split into chunks of this many entries for
+# ``validation_jobs``; shorter lists are validated with their parent
+PARALLEL_CHUNK_SIZE = 1024
+
+# model classes validated by pool workers, inherited through fork
+_CHUNK_MODELS: dict[int, type[BaseModel]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _error_dicts(error: ValidationError) -> list[dict]:
+    """Picklable (type, loc, msg, input) summary of each line error."""
+    return [
+        {"type": e["type"], "loc": tuple(e["loc"]), "msg": e["msg"], "input": e["input"]}
+        for e in error.errors(include_url=False)
+    ]
+
+
+def _line_error(error: dict, loc: tuple) -> dict:
+    """Rebuild a line error from ``_error_dicts`` at location ``loc``, keeping its type and message."""
+    return {"type": PydanticCustomError(error["type"], error["msg"]), "loc": loc, "input": error["input"]}
+
+
+def _validate_chunk(model_id: int, chunk: list) -> tuple[list | None, list[dict]]:
+    """Pool worker: validate one chunk of a list-of-model field. Returns (models, errors)."""
+    try:
+        return _list_adapter(_CHUNK_MODELS[model_id]).validate_python(chunk), []
+    except ValidationError as e:
+        return None, _error_dicts(e)
+
+
+def _validate_in_chunks(cls: type[T], config: dict, jobs: int) -> T:
+    """Validate ``config`` with its large list-of-model fields split over ``jobs`` processes.
+
+    Chunks are validated by a batched ``TypeAdapter(list[Model])`` in each
+    worker and reassembled in order; the parent model then receives model
+    instances, which pydantic does not re-validate. Errors keep their full
+    location, list indices included. Workers are forked so that classes
+    need not be importable; without fork, or while other threads run
+    (forking them is unsafe), validation stays in-process.
+    """
+    targets = []
+    for path, planned in _walk_plan(cls):
+        if planned.kind != "model_list":
+            continue
+        value: object = config
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if isinstance(value, list) and len(value) > PARALLEL_CHUNK_SIZE:
+            targets.append((path, planned.models[0], value))
+    if not targets or "fork" not in multiprocessing.get_all_start_methods() or threading.active_count() > 1:
+        return _dict_to_instance(cls, config)
+
+    for _, model, _ in targets:
+        _CHUNK_MODELS[id(model)] = model
+    context = multiprocessing.get_context("fork")
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            futures = [
+                [
+                    executor.submit(_validate_chunk, id(model), items[start : start + PARALLEL_CHUNK_SIZE])
+                    for start in range(0, len(items), PARALLEL_CHUNK_SIZE)
+                ]
+                for _, model, items in targets
+            ]
+            results = [[future.result() for future in chunk_futures] for chunk_futures in futures]
+    finally:
+        for _, model, _ in targets:
+            _CHUNK_MODELS.pop(id(model), None)
+
+    errors: list[dict] = []
+    config = copy.copy(config)
+    for (path, _, _), chunk_results in zip(targets, results):
+        parts = path.split(".")
+        validated: list | None = []
+        for index, (models, chunk_errors) in enumerate(chunk_results):
+            if models is None:
+                validated = None
+            elif validated is not None:
+                validated.extend(models)
+            for error in chunk_errors:
+                position, *rest = error["loc"]
+                errors.append(_line_error(error, (*parts, index * PARALLEL_CHUNK_SIZE + position, *rest)))
+        # Failed lists are replaced by [] so the rest of the config still reports its own errors
+        target = config
+        for part in parts[:-1]:
+            target[part] = target = copy.copy(target[part])
+        target[parts[-1]] = [] if validated is None else validated
+
+    try:
+        instance = _dict_to_instance(cls, config)
+    except ValidationError as e:
+        errors.extend(_line_error(error, error["loc"]) for error in _error_dicts(e))
+    if errors:
+        raise ValidationError.from_exception_data(cls.__name__, errors)
+    return instance
+
+
+def _build_default_from_config(
+    cls: type[T], config: dict, config_path: str | None = None, validation_jobs: int | None = None
+) -> T | None:
     """Build a default instance from config dict for tyro.
 
+    With ``validation_jobs`` > 1, large list-of-model fields are validated
+    in chunks on that many processes (see ``_validate_in_chunks``).
+
     Raises ConfigFileError if the config cannot be validated against the model.
     """
     if not config:
         return None
     try:
+        if validation_jobs is not None and validation_jobs > 1:
+            return _validate_in_chunks(cls, config, validation_jobs)
         return _dict_to_instance(cls, config)
     except Exception as e:
         source = f" from '{config_path}'" if config_path else ""
-        raise ConfigFileError(f"Failed to validate config{source}: {e}") from e
+        raise ConfigFileError(
+            f"Failed to validate config{source}: {e}",
+            errors=e.errors(include_url=False) if isinstance(e, ValidationError) else None,
+            source=config_path,
+            model=cls,
+        ) from e
+
+
+# tyro turns every key of a dict default (and every field of every model in a
+# list default) into its own argument; dicts and lists of models larger than
+# this are kept out of its parser unless the CLI addresses them.
+TYRO_COLLECTION_LIMIT = 64
+
+
+def _large_collections(model: BaseModel, remaining_args: list[str]) -> set[int]:
+    """``id()`` of the dict and list-of-model field values of ``model`` larger than ``TYRO_COLLECTION_LIMIT``.
+
+    Collections addressed by ``remaining_args`` are left out: tyro parses those.
+    """
+    found: set[int] = set()
+    for path, planned in _walk_plan(type(model)):
+        if planned.kind not in ("dict", "model_list"):
+            continue
+        value: object = model
+        for part in path.split("."):
+            value = getattr(value, part, None)
+        if not isinstance(value, (dict, list)) or len(value) <= TYRO_COLLECTION_LIMIT:
+            continue
+        flag = f"--{_kebab_path(path)}"
+        if any(arg.split("=", 1)[0] == flag or arg.startswith(flag + ".") for arg in remaining_args):
+            continue
+        found.add(id(value))
+    return found
+
+
+# A large collection is one opaque tyro argument whose default is passed
+# through untouched, so the model is built (and validated) with the real value.
+_OPAQUE_COLLECTION = tyro.constructors.PrimitiveConstructorSpec(
+    nargs=1,
+    metavar="JSON",
+    instance_from_str=lambda args: json.loads(args[0]),
+    is_instance=lambda value: True,
+    str_from_instance=lambda value: [f"<{len(value)} entries>"],
+)
+
+
+def _tyro_registry(large: set[int]) -> tyro.constructors.ConstructorRegistry:
+    """tyro registry adjusting tyro's own spec of every model.
+
+    Fields whose default is one of the ``large`` collection ids are parsed
+    as a single opaque argument. NDArray fields (suppressed, their CLI value
+    goes to the validator) are typed ``object`` for tyro, whose default
+    type check would warn about every string or list default.
+    """
+    from pydantic_config.arrays import _is_array_field
+
+    registry = tyro.constructors.ConstructorRegistry()
+    building = threading.local()
+
+    def adjust(field: tyro.constructors.StructFieldSpec) -> tyro.constructors.StructFieldSpec:
+        if id(field.default) in large:
+            return dataclasses.replace(field, type=Annotated[field.type, _OPAQUE_COLLECTION])
+        metadata = getattr(field.type, "__metadata__", ())
+        if _is_array_field(list(metadata)):
+            return dataclasses.replace(field, type=Annotated[(object, *metadata)])
+        return field
+
+    @registry.struct_rule
+    def adjusted_model(info: tyro.constructors.StructTypeInfo) -> object:
+        if getattr(building, "active", False):
+            return None
+        if not (isinstance(info.type, type) and issubclass(info.type, BaseModel)):
+            return None
+        # tyro's own rule for the model; this rule steps aside while it runs
+        building.active = True
+        try:
+            spec = tyro.constructors.ConstructorRegistry.get_struct_spec(info)
+        finally:
+            building.active = False
+        if spec is None:
+            return None
+        return dataclasses.replace(spec, fields=tuple(map(adjust, spec.fields)))
+
+    return registry
+
+
+def _daemon_socket_path(default: bool = False) -> str | None:
+    """Socket of the config server (see ``pydantic_config.server``).
+
+    ``$PYDANTIC_CONFIG_SOCKET`` when set (an empty value disables the server),
+    else a per-user socket in ``$XDG_RUNTIME_DIR`` or the temp directory.
+    Unless ``default``, None is returned when there is no socket there that
+    belongs to the current user.
+    """
+    path = os.environ.get(DAEMON_SOCKET_ENV)
+    if path is None:
+        directory = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+        path = os.path.join(directory, f"pydantic_config-{os.getuid()}.sock")
+    if not path or not (default or _is_own_socket(path)):
+        return None
+    return path
+
+
+def _is_own_socket(path: str) -> bool:
+    """Whether ``path`` is a Unix socket owned by the current user.
+
+    The default socket may live in the shared temp directory, where another
+    user could create it first and receive the args and environment sent.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _help_section(args: list[str]) -> str | None:
+    """Return the section requested with ``--help <section>`` or ``--help-section <section>``."""
+    for i, arg in enumerate(args[:-1]):
+        if arg in ("-h", "--help", HELP_SECTION_FLAG):
+            section = args[i + 1]
+            if not section.startswith(("-", CONFIG_FILE_SIGN)):
+                return section.replace("-", "_")
+        elif arg.startswith(HELP_SECTION_FLAG + "="):
+            return arg.split("=", 1)[1].replace("-", "_")
+    return None
+
+
+def _print_section_help(cls: type, section: str, prog: str | None) -> None:
+    """Print tyro's help for one sub-model only, then exit.
+
+    tyro is given a chain of single-field wrapper models down to the
+    section, so flags keep their full ``--a.b.c`` names while parsers for
+    sibling sections are never built.
+    """
+    parts = section.split(".")
+    sub_cls, sub_default = _select_model(cls, section)
+    field_type: type = sub_cls
+    field_default: object = sub_default if sub_default is not None else ...
+    for depth in range(len(parts) - 1, -1, -1):
+        wrapper_name = getattr(cls, "__name__", "Config") if depth == 0 else parts[depth - 1]
+        field_type = create_model(wrapper_name, **{parts[depth]: (field_type, field_default)})
+        field_default = ...
+    tyro.cli(
+        tyro.conf.AvoidSubcommands[field_type],
+        args=["--help"],
+        prog=prog,
+        description=f"Options for the '{section}' section.",
+    )
+
+
+def _print_help_sections(cls: type, prog: str | None) -> None:
+    """Print a one-line summary per top-level field without building any parser, then exit."""
+    prog = prog or os.path.basename(sys.argv[0])
+    rows = []
+    for field_name, field_info in cls.model_fields.items():
+        annotation = field_info.annotation
+        type_name = getattr(annotation, "__name__", None) or repr(annotation).replace("typing.", "")
+        doc = field_info.description or ""
+        if not doc and isinstance(annotation, type) and issubclass(annotation, BaseModel) and annotation.__doc__:
+            doc = annotation.__doc__.strip().splitlines()[0]
+        rows.append((field_name.replace("_", "-"), type_name, doc))
+    name_width = max((len(r[0]) for r in rows), default=0)
+    type_width = max((len(r[1]) for r in rows), default=0)
+    print(f"usage: {prog} [--help SECTION] [OPTIONS]\n")
+    print("sections:")
+    for name, type_name, doc in rows:
+        print(f"  {name:<{name_width}}  {type_name:<{type_width}}  {doc}".rstrip())
+    sys.exit(0)
 
 
 @overload
@@ -589,6 +2503,12 @@ def cli(
     default: T | None = None,
     prog: str | None = None,
     description: str | None = None,
+    select: str | None = None,
+    env_prefix: str | None = None,
+    validation_jobs: int | None = None,
+    collect_errors: bool = False,
+    profile_validation: bool = False,
+    provenance: bool = False,
 ) -> T:
     """
     Parse CLI arguments into a typed config object, with support for config files.
@@ -599,12 +2519,42 @@ def cli(
         - `--model @ model.toml` - Load config nested under 'model'
         - `--model @model.toml` - Same as above (no space)
 
+    `--help <section>` (or `--help-section <section>`) prints help for one
+    sub-model only, and `--help-sections` lists the top-level sections.
+    Passing `--config-hash` prints the canonical hash of the resolved config
+    (see ``config_hash``) and exits without returning.
+
+    When a config server is running (``python -m pydantic_config serve``,
+    see ``pydantic_config.server``), resolution is delegated to it and
+    falls back to in-process resolution when it cannot answer.
+
     Args:
         cls: The type to parse into (Pydantic BaseConfig or BaseModel)
         args: Command line args to parse (defaults to sys.argv[1:])
         default: Default instance to use for missing values
         prog: Program name for help text
         description: Description for help text
+        select: Dotted path of a sub-model (e.g. "data") to resolve on its own.
+            Only that section of config files and the overrides under it are
+            used, and only the sub-model is validated and returned.
+        env_prefix: Read overrides from environment variables named
+            ``<PREFIX>__<FIELD>__<SUBFIELD>`` (e.g. ``APP__TRAIN__LR``). They
+            override config files and are overridden by CLI args.
+        validation_jobs: Validate ``list[Model]`` fields longer than
+            ``PARALLEL_CHUNK_SIZE`` in chunks on this many processes. Pays
+            off when the entries have costly validators; plain fields
+            validate faster in-process than results can be sent back.
+            Validation stays in-process while other threads run.
+        collect_errors: Load every config file and validate each of them
+            (nested files against their field) before merging, and report
+            all missing files, parse errors and validation errors at once,
+            grouped by source file, instead of stopping at the first one.
+        profile_validation: Time every validator and sub-model validation
+            and print the most expensive field paths to stderr (see
+            ``pydantic_config.profile``).
+        provenance: Record which source (default, config file and line,
+            environment variable or command line) set each value, for
+            ``explain(config, "train.lr")``.
 
     Returns:
         Parsed and validated config object
@@ -628,55 +2578,476 @@ def cli(
     if args is None:
         args = sys.argv[1:]
 
+    # `--help <section>` and `--help-sections` only build help for part of the config
     try:
-        # Process args to extract config files
-        remaining_args, root_config, nested_configs = _process_args(args)
-
-        # Merge all configs: root first, then nested configs
-        merged_config = root_config
-        for key_path, config in nested_configs.items():
-            nested = _nest_config(key_path, config)
-            merged_config = _deep_merge(merged_config, nested)
-
-        # Expand bare flags for Optional[BaseModel] fields (e.g. --model.compile)
-        optional_paths = _find_optional_model_paths(cls)
-        if optional_paths:
-            remaining_args, bare_overrides = _expand_bare_optional_flags(remaining_args, optional_paths)
-            if bare_overrides:
-                merged_config = _deep_merge(merged_config, bare_overrides)
-
-        # Extract JSON dict args (e.g. --extra-kwargs '{"key": 123}')
-        dict_paths = _find_dict_field_paths(cls)
-        if dict_paths:
-            remaining_args, dict_overrides = _extract_json_dict_args(remaining_args, dict_paths)
-            if dict_overrides:
-                merged_config = _deep_merge(merged_config, dict_overrides)
-
-        # Build default from merged config
-        config_default = None
-        if merged_config:
-            config_default = _build_default_from_config(cls, merged_config, config_path="merged config")
-
-        # Merge with provided default
-        final_default = default
-        if config_default is not None:
-            final_default = config_default
-
-        # Call tyro with processed args.
-        # AvoidSubcommands prevents tyro from creating subcommands for union
-        # types (e.g. discriminated unions, Optional[BaseModel]). This avoids
-        # tyro errors on dict[str, Any] fields in non-default union variants
-        # and keeps CLI usage simple — variant selection belongs in config files.
-        return tyro.cli(
-            tyro.conf.AvoidSubcommands[cls],
-            args=remaining_args,
-            default=final_default,
-            prog=prog,
-            description=description,
+        if HELP_SECTIONS_FLAG in args:
+            _print_help_sections(cls, prog)
+        section = _help_section(args)
+        if section is not None:
+            _print_section_help(cls, section, prog)
+    except ConfigFileError as e:
+        if use_sys_argv:
+            _print_config_error_and_exit(e)
+        raise
+
+    # `--config-hash` prints the canonical hash of the resolved config and exits
+    print_hash = CONFIG_HASH_FLAG in args
+    if print_hash:
+        args = [arg for arg in args if arg != CONFIG_HASH_FLAG]
+
+    try:
+        config = None
+        use_server = (
+            default is None
+            and not (collect_errors or profile_validation or provenance)
+            and not {"-h", "--help"} & set(args)
         )
+        socket_path = _daemon_socket_path() if use_server else None
+        if socket_path is not None:
+            from pydantic_config.server import resolve_remote
+
+            config = resolve_remote(cls, args, socket_path, select=select, env_prefix=env_prefix)
+        if config is None:
+            with _printed_validation_profile(cls) if profile_validation else contextlib.nullcontext():
+                config = _resolve(
+                    cls,
+                    args,
+                    default=default,
+                    prog=prog,
+                    description=description,
+                    select=select,
+                    env_prefix=env_prefix,
+                    validation_jobs=validation_jobs,
+                    collect_errors=collect_errors,
+                    provenance=provenance,
+                )
+        if print_hash:
+            print(config_hash(config))
+            sys.exit(0)
+        return config
     except ConfigFileError as e:
         # Only print formatted error when running from CLI (sys.argv)
         # When args are explicitly passed, re-raise for programmatic handling
         if use_sys_argv:
             _print_config_error_and_exit(e)
         raise
+
+
+def _collect_config(
+    cls: type,
+    args: list[str],
+    loader: Callable[[str], dict] = _load_config_file,
+    select: str | None = None,
+    env_prefix: str | None = None,
+    environ: Mapping[str, str] | None = None,
+    provenance: ProvenanceIndex | None = None,
+) -> tuple[list[str], dict]:
+    """Merge every dict layer (config files, env vars, bare optional flags, JSON dict args) for ``cls``.
+
+    With ``select``, only the sub-tree at that dotted path is collected and
+    the result is relative to it. ``provenance`` records the source of every
+    leaf value as the layers are merged.
+
+    Returns (remaining_args_for_tyro, merged_config).
+    """
+    # Process args to extract config files
+    files: list[tuple[str | None, str]] | None = None
+    if provenance is not None:
+        files, loaded, file_loader = [], [], loader
+
+        def loader(path: str) -> dict:
+            loaded.append(provenance.load_file(path, file_loader))
+            return loaded[-1]
+
+    remaining_args, root_config, nested_configs = _process_args(args, loader=loader, select=select, sources=files)
+
+    # Environment variables (e.g. APP__TRAIN__LR) sit between config files and CLI args
+    env_overrides = _collect_env_overrides(cls, env_prefix, environ) if env_prefix else {}
+
+    if provenance is not None:
+        _record_file_provenance(provenance, cls, [(*f, d) for f, d in zip(files, loaded)], replace_nested=not select)
+        if env_prefix:
+            provenance.record_env(cls, env_prefix, os.environ if environ is None else environ)
+        if select:
+            provenance.rebase(select)
+
+    if select:
+        remaining_args = _select_cli_args(remaining_args, cls, select)
+        env_overrides = _config_section(env_overrides, select.split("."))
+        cls, _ = _select_model(cls, select)
+
+    # Merge all configs: root first, then nested configs
+    merged_config = root_config
+    for key_path, config in nested_configs.items():
+        nested = _nest_config(key_path, config) if key_path else config
+        merged_config = _deep_merge(merged_config, nested)
+
+    if env_overrides:
+        merged_config = _deep_merge(merged_config, env_overrides)
+
+    # Expand bare flags for Optional[BaseModel] fields (e.g. --model.compile)
+    optional_paths = _find_optional_model_paths(cls)
+    if optional_paths:
+        remaining_args, bare_overrides = _expand_bare_optional_flags(remaining_args, optional_paths)
+        if bare_overrides:
+            merged_config = _deep_merge(merged_config, bare_overrides)
+            if provenance is not None:
+                provenance.record_cli(cls, bare_overrides)
+
+    # Extract JSON dict args (e.g. --extra-kwargs '{"key": 123}')
+    dict_paths = _find_dict_field_paths(cls)
+    if dict_paths:
+        remaining_args, dict_overrides = _extract_json_dict_args(remaining_args, dict_paths)
+        if dict_overrides:
+            merged_config = _deep_merge(merged_config, dict_overrides)
+            if provenance is not None:
+                provenance.record_cli(cls, dict_overrides)
+
+    # Extract NDArray args (e.g. --class-weights weights.npy)
+    array_paths = _find_array_field_paths(cls)
+    if array_paths:
+        remaining_args, array_overrides = _extract_array_args(remaining_args, array_paths)
+        if array_overrides:
+            merged_config = _deep_merge(merged_config, array_overrides)
+            if provenance is not None:
+                provenance.record_cli(cls, array_overrides)
+
+    # Resolve ${a.b} interpolations once every dict layer is merged
+    remaining_args, interpolated_overrides, cli_values = _extract_interpolated_args(remaining_args)
+    if interpolated_overrides:
+        merged_config = _deep_merge(merged_config, interpolated_overrides)
+    if merged_config:
+        merged_config = _resolve_interpolations(cls, merged_config, cli_values)
+
+    if provenance is not None:
+        provenance.record_cli(cls, interpolated_overrides)
+        # the remaining args are parsed by tyro, after every dict layer
+        provenance.record_args(cls, remaining_args)
+    return remaining_args, merged_config
+
+
+def _record_file_provenance(
+    provenance: ProvenanceIndex, cls: type, files: list[tuple[str | None, str, dict]], replace_nested: bool
+) -> None:
+    """Record config files in the order ``_collect_config`` merges them: root files, then nested ones.
+
+    With ``replace_nested``, a nested file replaces an earlier one given for
+    the same field, as in ``_process_args``.
+    """
+    root = [f for f in files if f[0] is None]
+    nested = [f for f in files if f[0] is not None]
+    if replace_nested:
+        nested = list({arg_name: (arg_name, path, data) for arg_name, path, data in nested}.values())
+    provenance.record_files(cls, root + nested)
+
+
+def _layer_errors(cls: type[BaseModel], data: dict, under: tuple[str, ...]) -> list[dict]:
+    """Validation errors of one config layer that no other layer can fix.
+
+    ``data`` is validated against the whole of ``cls``; only errors under the
+    ``under`` field path are kept, and missing fields, model-level errors and
+    values with ``${...}`` interpolations are left to the merged config.
+    """
+    try:
+        cls.model_validate(copy.deepcopy(data))
+    except ValidationError as e:
+        return [
+            error
+            for error in e.errors(include_url=False)
+            if error["loc"]
+            and error["loc"][: len(under)] == under
+            and error["type"] != "missing"
+            and not (isinstance(error["input"], str) and "${" in error["input"])
+        ]
+    return []
+
+
+def _validation_report(model: type[BaseModel], errors: list[dict], source: str) -> ConfigFileError:
+    """ConfigFileError for ``errors`` (from ``errors()``) of validating ``source`` against ``model``."""
+    details = ValidationError.from_exception_data(model.__name__, [_line_error(e, tuple(e["loc"])) for e in errors])
+    return ConfigFileError(
+        f"Failed to validate config from '{source}': {details}", errors=errors, source=source, model=model
+    )
+
+
+def _collect_all_errors(
+    cls: type,
+    args: list[str],
+    loader: Callable[[str], dict] = _load_config_file,
+    select: str | None = None,
+    env_prefix: str | None = None,
+    environ: Mapping[str, str] | None = None,
+) -> Callable[[str], dict]:
+    """Load and validate every config source of ``args``, raising one ConfigFileError for all their problems.
+
+    Every ``@`` file is loaded even after one fails, and validated on its own
+    (a nested file as the field it is given for); the merged config is then
+    validated too. The report lists problems per source file, in argument
+    order, then those of the merged config that no single file explains.
+
+    Returns a loader serving the already loaded files, for the regular
+    resolution that follows when there is no error.
+    """
+    loaded: dict[str, dict] = {}
+    load_errors: dict[str, ConfigFileError] = {}
+
+    def checked_loader(path: str) -> dict:
+        if path not in loaded and path not in load_errors:
+            try:
+                loaded[path] = loader(path)
+            except ConfigFileError as e:
+                load_errors[path] = e
+        return loaded.get(path, {})
+
+    causes: list[ConfigFileError] = []
+    sources: list[tuple[str | None, str]] = []
+    try:
+        _process_args(args, loader=checked_loader, select=select, sources=sources)
+    except ConfigFileError as e:
+        causes.append(e)
+
+    under: tuple[str, ...] = tuple(select.split(".")) if select else ()
+    reported: set[tuple[tuple, str]] = set()
+    for path in dict.fromkeys(source_path for _, source_path in sources):
+        if path in load_errors:
+            causes.append(load_errors[path])
+            continue
+        errors = []
+        for arg_name, source_path in sources:
+            if source_path != path or not loaded[path]:
+                continue
+            key_path = arg_name.replace("-", "_") if arg_name else ""
+            data = _nest_config(key_path, loaded[path]) if key_path else loaded[path]
+            field_path = tuple(key_path.split(".")) if key_path else ()
+            errors.extend(_layer_errors(cls, data, max(field_path, under, key=len)))
+        if errors:
+            reported.update((tuple(error["loc"]), error["type"]) for error in errors)
+            causes.append(_validation_report(cls, errors, path))
+
+    try:
+        _, merged_config = _collect_config(
+            cls, args, loader=checked_loader, select=select, env_prefix=env_prefix, environ=environ
+        )
+        validation_model = _select_model(cls, select)[0] if select else cls
+        _build_default_from_config(validation_model, merged_config, config_path="merged config")
+    except ConfigFileError as e:
+        errors = [
+            error
+            for error in e.errors
+            if ((*under, *error["loc"]), error["type"]) not in reported
+            # a file that failed to load may have set the missing field
+            and not (load_errors and error["type"] == "missing")
+        ]
+        if not e.errors:
+            if e.message not in {cause.message for cause in causes}:
+                causes.append(e)
+        elif errors:
+            causes.append(_validation_report(validation_model, errors, "merged config"))
+
+    if causes:
+        count = sum(len(cause.errors) or 1 for cause in causes)
+        raise ConfigFileError(
+            f"{count} problem{'s' * (count != 1)} in {len(causes)} source{'s' * (len(causes) != 1)}\n"
+            + "\n".join(cause.message for cause in causes),
+            errors=[error for cause in causes for error in cause.errors],
+            causes=causes,
+        )
+    return checked_loader
+
+
+def _resolve(
+    cls: type[T],
+    args: list[str],
+    *,
+    default: T | None = None,
+    prog: str | None = None,
+    description: str | None = None,
+    console_outputs: bool = True,
+    loader: Callable[[str], dict] = _load_config_file,
+    select: str | None = None,
+    env_prefix: str | None = None,
+    environ: Mapping[str, str] | None = None,
+    validation_jobs: int | None = None,
+    collect_errors: bool = False,
+    provenance: bool = False,
+) -> T:
+    """Resolve ``args`` into a config instance. Raises ConfigFileError instead of printing it."""
+    if collect_errors:
+        loader = _collect_all_errors(cls, args, loader=loader, select=select, env_prefix=env_prefix, environ=environ)
+    index = None
+    if provenance:
+        from pydantic_config.provenance import ProvenanceIndex
+
+        index = ProvenanceIndex()
+    remaining_args, merged_config = _collect_config(
+        cls, args, loader=loader, select=select, env_prefix=env_prefix, environ=environ, provenance=index
+    )
+    if select:
+        cls, default = _select_model(cls, select, default)
+
+    # Build default from merged config
+    config_default = None
+    if merged_config:
+        config_default = _build_default_from_config(
+            cls, merged_config, config_path="merged config", validation_jobs=validation_jobs
+        )
+
+    # Merge with provided default
+    final_default = default
+    if config_default is not None:
+        final_default = config_default
+
+    # Large dicts and lists of models would become one tyro argument per entry
+    large = _large_collections(final_default, remaining_args) if isinstance(final_default, BaseModel) else set()
+
+    # Call tyro with processed args.
+    # AvoidSubcommands prevents tyro from creating subcommands for union
+    # types (e.g. discriminated unions, Optional[BaseModel]). This avoids
+    # tyro errors on dict[str, Any] fields in non-default union variants
+    # and keeps CLI usage simple — variant selection belongs in config files.
+    config = tyro.cli(
+        tyro.conf.AvoidSubcommands[cls],
+        args=remaining_args,
+        default=final_default,
+        prog=prog,
+        description=description,
+        console_outputs=console_outputs,
+        registry=_tyro_registry(large),
+    )
+    if isinstance(config, BaseModel):
+        config = _reuse_shared_defaults(config)
+    if index is not None:
+        from pydantic_config.provenance import _PROVENANCE
+
+        _PROVENANCE.set(config, index)
+    return config
+
+
+@contextlib.contextmanager
+def _printed_validation_profile(cls: type[BaseModel]) -> Iterator[None]:
+    """Profile the validation of ``cls`` in the block and print the table to stderr, even on errors."""
+    from pydantic_config.profile import profile_validation
+
+    with profile_validation(cls) as profile:
+        try:
+            yield
+        finally:
+            print(profile.table(), file=sys.stderr)
+
+
+def _resolve_quietly(
+    cls: type[T],
+    args: list[str],
+    default: T | None,
+    prog: str | None,
+    description: str | None,
+) -> T:
+    """Run ``_resolve`` for ``acli``, turning tyro's ``SystemExit`` into a ConfigFileError.
+
+    tyro prints its argument errors instead of raising them, so the output
+    of this thread is captured and put in the error message; other threads
+    keep writing to the real streams.
+    """
+    output = io.StringIO()
+    with _ThreadOutput.capture(output):
+        try:
+            return _resolve(cls, args, default=default, prog=prog, description=description)
+        except SystemExit as e:
+            exit_code = e.code
+    message = _strip_box(output.getvalue())
+    detail = f":\n{message}" if message else f" (exit code {exit_code})"
+    raise ConfigFileError(f"Failed to parse CLI arguments {args!r}{detail}")
+
+
+class _ThreadOutput:
+    """Stand-in for ``sys.stdout``/``sys.stderr`` sending the writes of capturing threads to their buffer.
+
+    It is installed while at least one thread captures, and passes every
+    other thread's writes (and attribute lookups) on to the stream it replaced.
+    """
+
+    _local = threading.local()
+    _lock = threading.Lock()
+    _captures = 0
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    def _target(self) -> Any:
+        buffer = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+    @classmethod
+    @contextlib.contextmanager
+    def capture(cls, buffer: io.StringIO) -> Iterator[None]:
+        """Send what the current thread prints to ``buffer`` while the block runs."""
+        with cls._lock:
+            if cls._captures == 0:
+                sys.stdout, sys.stderr = cls(sys.stdout), cls(sys.stderr)
+            cls._captures += 1
+        cls._local.buffer = buffer
+        try:
+            yield
+        finally:
+            cls._local.buffer = None
+            with cls._lock:
+                cls._captures -= 1
+                if cls._captures == 0:
+                    if isinstance(sys.stdout, cls):
+                        sys.stdout = sys.stdout._stream
+                    if isinstance(sys.stderr, cls):
+                        sys.stderr = sys.stderr._stream
+
+
+_BOX_CHARS = "│╭╮╰╯┃┏┓┗┛ "
+_RULE_RE = re.compile(r"[─━\-]*")
+
+
+def _strip_box(text: str) -> str:
+    """The text of tyro's boxed console output, without borders and rules."""
+    lines = (line.strip(_BOX_CHARS) for line in text.splitlines())
+    return "\n".join(line for line in lines if not _RULE_RE.fullmatch(line))
+
+
+async def acli(
+    cls: type[T],
+    *,
+    args: list[str],
+    default: T | None = None,
+    prog: str | None = None,
+    description: str | None = None,
+    timeout: float | None = None,
+    executor: concurrent.futures.Executor | None = None,
+) -> T:
+    """
+    Async variant of ``cli()`` for use inside asyncio services.
+
+    Config file loading, merging and validation run in ``executor`` (the
+    loop's default thread pool when None), so the event loop is never
+    blocked. Pass a ``ProcessPoolExecutor`` to move CPU-heavy validation off
+    the GIL; ``cls`` must then be importable from the worker processes.
+
+    Unlike ``cli()``, errors are never printed and ``sys.exit`` is never
+    called: invalid configs and invalid CLI arguments both raise
+    ConfigFileError. ``timeout`` raises ``TimeoutError`` and cancelling the
+    awaiting task stops waiting for the result (a thread that is already
+    running cannot be interrupted and finishes in the background).
+
+    Example:
+        config = await acli(Config, args=["@", "run.toml", "--train.lr", "1e-3"], timeout=5)
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_resolve_quietly, cls, list(args), default, prog, description)
+    return await asyncio.wait_for(loop.run_in_executor(executor, call), timeout)
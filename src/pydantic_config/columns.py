@@ -0,0 +1,198 @@
+"""
+Columnar export of many resolved configs, for analysis.
+
+Usage:
+    from pydantic_config.columns import to_columns
+
+    columns = to_columns(configs)           # configs: a list of Config instances
+    columns["train.lr"]                     # float64 array, one value per config
+    columns["train.optimizer"].decode()     # union tag per config
+    df = pandas.DataFrame({path: col.decode() if hasattr(col, "decode") else col for path, col in columns.items()})
+
+Each leaf field becomes one column, keyed by its dotted path:
+    - ``int``, ``float`` and ``bool`` fields: NumPy arrays (int64, float64, bool)
+    - ``str``, ``Literal``, ``Enum`` and ``Path`` fields: ``Categorical``
+      (int32 codes into a list of distinct values)
+    - anything else (lists, dicts, arrays, ...): object arrays
+
+Optional and union sub-models are sparse: the field gets a ``Categorical``
+tag column (the variant's ``type`` tag, or its class name; code -1 for
+None), and the fields of every variant get columns that are masked
+(``numpy.ma.MaskedArray``, code -1 for ``Categorical``) where the config
+holds another variant. Optional leaves (``int | None``) are masked where
+None. Columns are built from the field plan of the class, one pass per
+column, without dumping the configs.
+
+Requires numpy (``pip install numpy``).
+"""
+
+from __future__ import annotations
+
+import enum
+import functools
+import operator
+import pathlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, get_args, get_origin
+
+from pydantic import BaseModel
+
+from pydantic_config.arrays import _numpy
+from pydantic_config.cli import _field_plan
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_NUMERIC_DTYPES = {bool: "bool", int: "int64", float: "float64"}
+# absent because the section holding the field is None or another variant
+_ABSENT = object()
+
+
+@dataclass
+class Categorical:
+    """Dictionary-encoded column: ``categories[codes[i]]`` is the value of config ``i`` (-1: absent)."""
+
+    codes: np.ndarray
+    categories: list
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> np.ndarray:
+        """The values as an object array, None where absent."""
+        np = _numpy()
+        lookup = np.empty(len(self.categories) + 1, dtype=object)
+        lookup[:-1] = self.categories
+        return lookup[self.codes]
+
+
+@dataclass(frozen=True)
+class _Column:
+    path: str
+    # "bool", "int64", "float64", "category", "object" or "tag"
+    kind: str
+    # the field can be None or sits under an optional/union sub-model
+    sparse: bool
+
+
+def _leaf_kind(annotation: object) -> tuple[str, bool]:
+    """Column kind of a leaf annotation, and whether it is optional."""
+    if hasattr(annotation, "__metadata__"):
+        annotation = get_args(annotation)[0]
+    members = [a for a in get_args(annotation) if a is not type(None)]
+    optional = len(members) < len(get_args(annotation))
+    if optional and len(members) == 1:
+        annotation = members[0]
+    if annotation in _NUMERIC_DTYPES:
+        return _NUMERIC_DTYPES[annotation], optional
+    if get_origin(annotation) is Literal or annotation is str:
+        return "category", optional
+    if isinstance(annotation, type) and issubclass(annotation, (enum.Enum, pathlib.PurePath)):
+        return "category", optional
+    return "object", optional
+
+
+@functools.lru_cache(maxsize=None)
+def _column_plan(cls: type[BaseModel], prefix: str = "", sparse: bool = False) -> tuple[_Column, ...]:
+    """Columns of ``cls``; fields of several union variants with one path share a column."""
+    columns: dict[str, _Column] = {}
+
+    def add(column: _Column) -> None:
+        known = columns.get(column.path)
+        if known is None:
+            columns[column.path] = column
+        elif known.kind != column.kind:
+            columns[column.path] = _Column(column.path, "object", True)
+        elif column.sparse and not known.sparse:
+            columns[column.path] = column
+
+    for planned in _field_plan(cls):
+        path = f"{prefix}.{planned.name}" if prefix else planned.name
+        if planned.kind == "model":
+            for column in _column_plan(planned.models[0], path, sparse):
+                add(column)
+        elif planned.kind in ("optional_model", "union"):
+            add(_Column(path, "tag", True))
+            for model in planned.models:
+                for column in _column_plan(model, path, True):
+                    add(column)
+        elif planned.kind == "leaf":
+            kind, optional = _leaf_kind(planned.annotation)
+            add(_Column(path, kind, sparse or optional))
+        else:
+            add(_Column(path, "object", sparse))
+    return tuple(columns.values())
+
+
+def _variant_tag(value: object) -> object:
+    if value is _ABSENT:
+        return _ABSENT
+    tag = value.__dict__.get("type")
+    return tag if isinstance(tag, str) else type(value).__name__
+
+
+def _sections(configs: list[BaseModel], path: str, cache: dict[str, list]) -> list:
+    """The sub-model at ``path`` of every config (``_ABSENT`` where it or a parent is None or another variant)."""
+    sections = cache.get(path)
+    if sections is None:
+        parent, _, name = path.rpartition(".")
+        sections = cache[path] = [
+            _ABSENT if value is None else value
+            for value in _field_values(_sections(configs, parent, cache) if parent else configs, name)
+        ]
+    return sections
+
+
+def _field_values(models: list, name: str) -> list:
+    # fields are read from the instance dict: a missing field (another variant) must not go through __getattr__
+    return [_ABSENT if model is _ABSENT else model.__dict__.get(name, _ABSENT) for model in models]
+
+
+def _values(configs: list[BaseModel], column: _Column, cache: dict[str, list]) -> list:
+    """The column's value for every config (``_ABSENT`` where a section is None or another variant)."""
+    if not column.sparse:
+        return list(map(operator.attrgetter(column.path), configs))
+    if column.kind == "tag":
+        return [_variant_tag(section) for section in _sections(configs, column.path, cache)]
+    parent, _, name = column.path.rpartition(".")
+    return _field_values(_sections(configs, parent, cache) if parent else configs, name)
+
+
+def _encode(values: list, kind: str) -> np.ndarray | np.ma.MaskedArray | Categorical:
+    np = _numpy()
+    n = len(values)
+    if kind in ("category", "tag"):
+        index: dict[object, int] = {}
+        codes = np.fromiter(
+            (-1 if v is _ABSENT or v is None else index.setdefault(v, len(index)) for v in values), np.int32, n
+        )
+        return Categorical(codes, list(index))
+    missing = [v is _ABSENT or v is None for v in values]
+    if kind == "object":
+        array = np.empty(n, dtype=object)
+        array[:] = [None if v is _ABSENT else v for v in values]
+        return np.ma.MaskedArray(array, mask=missing) if any(missing) else array
+    if not any(missing):
+        return np.fromiter(values, kind, n)
+    fill = False if kind == "bool" else 0
+    array = np.fromiter((fill if m else v for v, m in zip(values, missing)), kind, n)
+    return np.ma.MaskedArray(array, mask=missing)
+
+
+def to_columns(configs: Sequence[BaseModel]) -> dict[str, np.ndarray | np.ma.MaskedArray | Categorical]:
+    """Flatten ``configs`` (instances of one config class) into one column per leaf path.
+
+    See the module docstring for the column types.
+    """
+    configs = list(configs)
+    if not configs:
+        return {}
+    cls = type(configs[0])
+    if any(type(config) is not cls for config in configs):
+        raise TypeError(
+            f"to_columns expects instances of a single class, got {sorted({type(c).__name__ for c in configs})}"
+        )
+    # section path -> the sub-model at that path of every config, shared by the sparse columns below it
+    cache: dict[str, list] = {}
+    return {column.path: _encode(_values(configs, column, cache), column.kind) for column in _column_plan(cls)}
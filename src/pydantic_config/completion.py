@@ -0,0 +1,239 @@
+"""
+Shell completion from a static index of a config class.
+
+Usage:
+    # in ~/.bashrc (zsh: run `autoload -U bashcompinit && bashcompinit` first)
+    eval "$(python -m pydantic_config completion bash train.py my_project.config:Config)"
+
+Completing does not start Python or build the tyro parser: the shell function
+reads a tab-separated index of the CLI flags (field paths, value kinds and
+choices) and completes config files after ``@``. The index records the
+schema fingerprint of the class and the source files of its models; when one
+of those files is newer than the index, the shell function runs
+``python -m pydantic_config completion index`` once, which rewrites the index
+only if the schema fingerprint changed.
+
+Index format, one entry per line:
+    #schema <TAB> <fingerprint>
+    #source <TAB> <path of a module defining one of the models>
+    <flag> <TAB> <kind> <TAB> <space separated choices>
+
+``kind`` is ``flag`` (no value), ``choice``, ``path``, ``section`` (takes
+``@ file``) or ``value``.
+"""
+
+from __future__ import annotations
+
+import enum
+import os
+import pathlib
+import re
+import sys
+from typing import Literal, get_args, get_origin
+
+from pydantic import BaseModel
+
+from pydantic_config.cli import (
+    CONFIG_HASH_FLAG,
+    HELP_SECTIONS_FLAG,
+    _import_target,
+    _kebab_path,
+    _schema_fingerprint,
+    _walk_plan,
+)
+
+INDEX_HEADER = "#schema"
+
+
+def default_index_path(prog: str) -> str:
+    """Where the completion index of ``prog`` is stored by default."""
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "pydantic_config", f"{os.path.basename(prog)}.completion")
+
+
+def _value_kind(annotation: object) -> tuple[str, list[str]]:
+    """Completion kind and choices of a leaf field."""
+    if hasattr(annotation, "__metadata__"):
+        annotation = get_args(annotation)[0]
+    members = [a for a in get_args(annotation) if a is not type(None)] or [annotation]
+    if len(members) == 1:
+        annotation = members[0]
+    if annotation is bool:
+        return "flag", []
+    if get_origin(annotation) is Literal:
+        return "choice", [str(v) for v in get_args(annotation)]
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return "choice", [member.name for member in annotation]
+    if isinstance(annotation, type) and issubclass(annotation, pathlib.PurePath):
+        return "path", []
+    return "value", []
+
+
+def _source_files(cls: type[BaseModel]) -> list[str]:
+    """Source files of ``cls`` and of every model it references."""
+    models = {cls} | {
+        m for _, planned in _walk_plan(cls, into=("model", "optional_model", "union")) for m in planned.models
+    }
+    files = set()
+    for model in models:
+        path = getattr(sys.modules.get(model.__module__), "__file__", None)
+        if path:
+            files.add(os.path.abspath(path))
+    return sorted(files)
+
+
+def completion_index(cls: type[BaseModel]) -> str:
+    """Build the completion index text of ``cls`` (see the module docstring)."""
+    lines = [f"{INDEX_HEADER}\t{_schema_fingerprint(cls)}"]
+    lines.extend(f"#source\t{path}" for path in _source_files(cls))
+    entries: dict[str, tuple[str, list[str]]] = {
+        "--help": ("flag", []),
+        HELP_SECTIONS_FLAG: ("flag", []),
+        CONFIG_HASH_FLAG: ("flag", []),
+    }
+    for path, planned in _walk_plan(cls, into=("model", "optional_model", "union")):
+        flag = f"--{_kebab_path(path)}"
+        if planned.kind == "leaf":
+            kind, choices = _value_kind(planned.annotation)
+            entries.setdefault(flag, (kind, choices))
+            if kind == "flag":
+                head, _, name = flag[2:].rpartition(".")
+                entries.setdefault(f"--{head + '.' if head else ''}no-{name}", ("flag", []))
+        elif planned.kind == "dict":
+            entries.setdefault(flag, ("value", []))
+        elif planned.kind == "array":
+            entries.setdefault(flag, ("path", []))
+        else:
+            entries.setdefault(flag, ("section", []))
+    lines.extend(f"{flag}\t{kind}\t{' '.join(choices)}" for flag, (kind, choices) in entries.items())
+    return "\n".join(lines) + "\n"
+
+
+def write_completion_index(cls: type[BaseModel] | str, path: str) -> bool:
+    """Write the completion index of ``cls`` to ``path`` if its schema changed.
+
+    ``cls`` is a config class or a ``module:Class`` import string. When the
+    index at ``path`` already has the current schema fingerprint, it is only
+    touched (so the shell stops checking the sources). Returns True when the
+    index was rewritten.
+    """
+    if isinstance(cls, str):
+        cls = _import_target(cls)
+    try:
+        with open(path) as f:
+            header = f.readline().rstrip("\n")
+    except OSError:
+        header = ""
+    if header == f"{INDEX_HEADER}\t{_schema_fingerprint(cls)}":
+        os.utime(path)
+        return False
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(completion_index(cls))
+    os.replace(tmp_path, path)
+    return True
+
+
+_BASH_TEMPLATE = r"""_pydantic_config_config_files() {{
+    local f
+    for f in $(compgen -f -- "$1"); do
+        if [[ -d "$f" ]]; then
+            echo "$f/"
+        else
+            case "$f" in *.toml|*.yaml|*.yml|*.json) echo "$f" ;; esac
+        fi
+    done
+}}
+
+_pydantic_config_complete_{name}() {{
+    local index={index} cur prev kind choices stale=0 tag src
+    cur="${{COMP_WORDS[COMP_CWORD]}}"
+    prev="${{COMP_WORDS[COMP_CWORD-1]}}"
+
+    if [[ ! -f "$index" ]]; then
+        stale=1
+    else
+        while IFS=$'\t' read -r tag src; do
+            [[ "$tag" == "#"* ]] || break
+            [[ "$tag" == "#source" && "$src" -nt "$index" ]] && {{ stale=1; break; }}
+        done < "$index"
+    fi
+    if (( stale )); then
+        {python} -m pydantic_config completion index {target} -o "$index" >/dev/null 2>&1
+    fi
+
+    if [[ "$prev" == "@" ]]; then
+        COMPREPLY=( $(_pydantic_config_config_files "$cur") )
+        compopt -o nospace 2>/dev/null
+        return
+    fi
+    if [[ "$prev" == "@@" || "$cur" == @@* ]]; then
+        COMPREPLY=( $(compgen -f -- "${{cur#@@}}") )
+        [[ "$cur" == @@* ]] && COMPREPLY=( "${{COMPREPLY[@]/#/@@}}" )
+        return
+    fi
+    if [[ "$cur" == @* ]]; then
+        COMPREPLY=( $(_pydantic_config_config_files "${{cur#@}}") )
+        COMPREPLY=( "${{COMPREPLY[@]/#/@}}" )
+        compopt -o nospace 2>/dev/null
+        return
+    fi
+
+    if [[ "$prev" == --* && "$cur" != -* ]]; then
+        IFS=$'\t' read -r _ kind choices < <(awk -F'\t' -v f="$prev" '$1 == f' "$index" 2>/dev/null)
+        case "$kind" in
+            choice) COMPREPLY=( $(compgen -W "$choices" -- "$cur") ); return ;;
+            path) COMPREPLY=( $(compgen -f -- "$cur") ); return ;;
+            section) COMPREPLY=( $(compgen -W "@" -- "$cur") ); return ;;
+            value) COMPREPLY=(); return ;;
+        esac
+    fi
+
+    COMPREPLY=( $(compgen -W "@ $(awk -F'\t' '$1 !~ /^#/ {{print $1}}' "$index" 2>/dev/null)" -- "$cur") )
+}}
+complete -o default -F _pydantic_config_complete_{name} {prog}
+"""
+
+
+def bash_script(prog: str, target: str, index_path: str | None = None, python: str | None = None) -> str:
+    """Bash completion script for ``prog``, whose config class is ``target`` (``module:Class``)."""
+    import shlex
+
+    return _BASH_TEMPLATE.format(
+        name=re.sub(r"\W", "_", os.path.basename(prog)),
+        index=shlex.quote(index_path or default_index_path(prog)),
+        python=shlex.quote(python or sys.executable),
+        target=shlex.quote(target),
+        prog=shlex.quote(prog),
+    )
+
+
+def main(argv: list[str]) -> int:
+    """Entry point of ``python -m pydantic_config completion``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pydantic_config completion",
+        description="Shell completion for CLIs built with pydantic_config.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    bash = commands.add_parser("bash", help="print a bash completion script to eval")
+    bash.add_argument("prog", help="command to complete, e.g. train.py")
+    bash.add_argument("target", help="config class, e.g. pkg.module:Config")
+    bash.add_argument("-o", "--output", default=None, help="index path (default: in $XDG_CACHE_HOME)")
+    index = commands.add_parser("index", help="write the completion index if the schema changed")
+    index.add_argument("target", help="config class, e.g. pkg.module:Config")
+    index.add_argument("-o", "--output", required=True, help="index path")
+    ns = parser.parse_args(argv)
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    if ns.command == "bash":
+        index_path = os.path.abspath(ns.output or default_index_path(ns.prog))
+        write_completion_index(ns.target, index_path)
+        print(bash_script(ns.prog, ns.target, index_path))
+    else:
+        write_completion_index(ns.target, ns.output)
+    return 0
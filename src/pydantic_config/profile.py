@@ -0,0 +1,252 @@
+"""
+Validation cost profiler: which validators and sub-models make a config slow to validate.
+
+Usage:
+    config = cli(Config, profile_validation=True)  # ranked table on stderr
+
+    from pydantic_config.profile import profile_validation
+
+    with profile_validation(Config) as profile:
+        Config.model_validate(data)
+    print(profile.table())
+
+While profiling, every model class reachable from the profiled class gets an
+extra wrap validator timing its validation, and the user-written
+``field_validator``/``model_validator`` functions (those not defined by
+pydantic_config itself) are wrapped with a timer. The classes are rebuilt on
+entry and rebuilt back on exit, so there is no cost outside the ``with``
+block; the rebuilds are not thread-safe and take a moment on large configs.
+
+Times are attributed to field paths: ``train.optimizer`` for a sub-model,
+``data.path`` for a validator of field ``path`` in ``data``, ``items[]`` for
+the entries of a list of models. "self" time excludes the nested sub-models
+and validators that are timed separately. A sub-model built on its own (tyro
+constructs each section of the CLI separately) is attributed to its path in
+the config when the class appears at a single path, and to ``<ClassName>``
+otherwise.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import time
+from collections.abc import Callable, Iterator
+
+import pydantic
+from pydantic import BaseModel
+
+from pydantic_config.cli import _walk_plan
+
+# pydantic has no public API to wrap the validators of an existing model:
+# the profiler swaps ``__pydantic_decorators__``, built from these internals.
+try:
+    from pydantic._internal._decorators import Decorator, DecoratorInfos, ModelValidatorDecoratorInfo
+except ImportError:
+    Decorator = DecoratorInfos = ModelValidatorDecoratorInfo = None  # type: ignore[assignment,misc]
+
+_DECORATOR_FIELDS = {"cls_ref", "cls_var_name", "func", "shim", "info"}
+_DECORATOR_INFOS_FIELDS = {"field_validators", "model_validators"}
+
+_MODEL_KINDS = ("model", "optional_model", "union", "model_list")
+_PROFILE_VALIDATOR = "__pydantic_config_profile__"
+
+
+@dataclasses.dataclass
+class ProfileRow:
+    """Validation time spent at one field path."""
+
+    path: str
+    # "model" (validation of a sub-model) or "validator"
+    kind: str
+    # model class name, or ``Class.function`` of the validator
+    name: str
+    calls: int
+    total: float
+    self_time: float
+
+
+def _models_bottom_up(cls: type[BaseModel]) -> list[type[BaseModel]]:
+    """``cls`` and the model classes it references, every class after the ones it contains."""
+    order: list[type[BaseModel]] = []
+    seen: set[type] = set()
+
+    def visit(model: type[BaseModel]) -> None:
+        if model in seen:
+            return
+        seen.add(model)
+        for _, planned in _walk_plan(model, into=()):
+            if planned.kind in _MODEL_KINDS:
+                for sub_model in planned.models:
+                    visit(sub_model)
+        order.append(model)
+
+    visit(cls)
+    return order
+
+
+@functools.lru_cache(maxsize=None)
+def _model_list_fields(model: type[BaseModel]) -> frozenset[str]:
+    return frozenset(planned.name for _, planned in _walk_plan(model, into=()) if planned.kind == "model_list")
+
+
+class ValidationProfile:
+    """Timings collected by ``profile_validation``."""
+
+    def __init__(self, cls: type[BaseModel]):
+        # model class -> its path in the config, for classes found at a single path
+        self._class_paths: dict[type, str] = {}
+        ambiguous: set[type] = set()
+
+        def visit(model: type[BaseModel], path: str) -> None:
+            if model in ambiguous:
+                return
+            if model in self._class_paths:
+                del self._class_paths[model]
+                ambiguous.add(model)
+                return
+            self._class_paths[model] = path
+            for _, planned in _walk_plan(model, into=()):
+                if planned.kind in _MODEL_KINDS:
+                    sub_path = f"{path}.{planned.name}" if path else planned.name
+                    for sub_model in planned.models:
+                        visit(sub_model, sub_path + "[]" * (planned.kind == "model_list"))
+
+        visit(cls, "")
+        # (path, kind, name) -> [calls, total, self]
+        self._stats: dict[tuple[str, str, str], list] = {}
+        # validations in progress: [path, model class, time spent in nested frames]
+        self._stack: list[list] = []
+
+    def _timed(self, path: str, model: type[BaseModel], kind: str, name: str, call: Callable[[], object]) -> object:
+        frame = [path, model, 0.0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][2] += elapsed
+            stats = self._stats.setdefault((path, kind, name), [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += elapsed - frame[2]
+
+    def _current_path(self, model: type[BaseModel]) -> str:
+        """Path of the model being validated, for a validator of ``model``."""
+        if self._stack:
+            return self._stack[-1][0]
+        return self._class_paths.get(model, f"<{model.__name__}>")
+
+    def _profile_model(self, model: type[BaseModel]) -> Callable:
+        def validate(data: object, handler: Callable[[object], BaseModel], info: object) -> BaseModel:
+            field_name = getattr(info, "field_name", None)
+            if not self._stack or field_name is None:
+                path = self._class_paths.get(model, f"<{model.__name__}>")
+            else:
+                parent_path, parent_model, _ = self._stack[-1]
+                # entries of a list are validated with the field name of the list
+                if field_name in _model_list_fields(parent_model):
+                    field_name += "[]"
+                path = f"{parent_path}.{field_name}" if parent_path else field_name
+            return self._timed(path, model, "model", model.__name__, lambda: handler(data))
+
+        return validate
+
+    def _profile_validator(self, model: type[BaseModel], decorator: Decorator) -> Callable:
+        fields = getattr(decorator.info, "fields", ("*",))
+        name = f"{model.__name__}.{decorator.cls_var_name}"
+        func = decorator.func
+
+        @functools.wraps(func)
+        def validator(*args: object, **kwargs: object) -> object:
+            model_path = self._current_path(model)
+            if fields == ("*",):
+                path = model_path
+            else:
+                field_path = fields[0] if len(fields) == 1 else "{" + ",".join(fields) + "}"
+                path = f"{model_path}.{field_path}" if model_path else field_path
+            return self._timed(path, model, "validator", name, lambda: func(*args, **kwargs))
+
+        return validator
+
+    def _instrument(self, model: type[BaseModel]) -> object:
+        """Profiled copy of the decorators of ``model``."""
+        decorators = model.__pydantic_decorators__
+        profiled = dataclasses.replace(decorators)
+        for attr in ("field_validators", "model_validators"):
+            profiled_validators = {}
+            for var_name, decorator in getattr(decorators, attr).items():
+                if not getattr(decorator.func, "__module__", "").startswith("pydantic_config."):
+                    decorator = dataclasses.replace(decorator, func=self._profile_validator(model, decorator))
+                profiled_validators[var_name] = decorator
+            setattr(profiled, attr, profiled_validators)
+        # added last, so it wraps the model's own validators too
+        profiled.model_validators[_PROFILE_VALIDATOR] = Decorator(
+            cls_ref=f"{model.__module__}.{model.__qualname__}",
+            cls_var_name=_PROFILE_VALIDATOR,
+            func=self._profile_model(model),
+            shim=None,
+            info=ModelValidatorDecoratorInfo(mode="wrap"),
+        )
+        return profiled
+
+    def rows(self) -> list[ProfileRow]:
+        """Timings per path, highest self time first."""
+        rows = [
+            ProfileRow(path or "(root)", kind, name, calls, total, self_time)
+            for (path, kind, name), (calls, total, self_time) in self._stats.items()
+        ]
+        return sorted(rows, key=lambda row: row.self_time, reverse=True)
+
+    def table(self, limit: int | None = 20) -> str:
+        """The ``limit`` most expensive rows as a text table (times in ms)."""
+        rows = self.rows()
+        total = sum(row.self_time for row in rows)
+        lines = [f"{'self ms':>9} {'total ms':>9} {'calls':>7}  {'path':<32} what"]
+        for row in rows[:limit]:
+            lines.append(
+                f"{row.self_time * 1e3:>9.2f} {row.total * 1e3:>9.2f} {row.calls:>7}  {row.path:<32} {row.kind} {row.name}"
+            )
+        if limit is not None and len(rows) > limit:
+            lines.append(f"... {len(rows) - limit} more rows")
+        lines.append(f"{total * 1e3:>9.2f} ms of validation in total")
+        return "\n".join(lines)
+
+
+def _check_pydantic_internals() -> None:
+    """Fail clearly when this pydantic's decorator internals are not the ones the profiler was written against."""
+    if (
+        Decorator is None
+        or not dataclasses.is_dataclass(Decorator)
+        or not dataclasses.is_dataclass(DecoratorInfos)
+        or not _DECORATOR_FIELDS <= {field.name for field in dataclasses.fields(Decorator)}
+        or not _DECORATOR_INFOS_FIELDS <= {field.name for field in dataclasses.fields(DecoratorInfos)}
+    ):
+        raise ImportError(
+            f"Validation profiling relies on pydantic internals (pydantic._internal._decorators) that pydantic "
+            f"{pydantic.VERSION} does not provide in the expected form; it is tested with pydantic 2.x."
+        )
+
+
+@contextlib.contextmanager
+def profile_validation(cls: type[BaseModel]) -> Iterator[ValidationProfile]:
+    """Time the validators and sub-models of ``cls`` while the block runs (see the module docstring)."""
+    _check_pydantic_internals()
+    profile = ValidationProfile(cls)
+    models = _models_bottom_up(cls)
+    saved: dict[type[BaseModel], object] = {}
+    try:
+        for model in models:
+            saved[model] = model.__pydantic_decorators__
+            model.__pydantic_decorators__ = profile._instrument(model)
+            model.model_rebuild(force=True)
+        yield profile
+    finally:
+        for model in models:
+            if model in saved:
+                model.__pydantic_decorators__ = saved[model]
+                model.model_rebuild(force=True)
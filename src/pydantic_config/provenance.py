@@ -0,0 +1,324 @@
+"""
+Provenance of resolved values: which source set each field.
+
+Usage:
+    from pydantic_config import cli, explain
+
+    config = cli(Config, provenance=True)
+    explain(config, "train.lr")  # ValueSource(path='train.lr', source='configs/train.toml', line=12)
+    print(explain(config, "seed"))  # command line (--seed)
+
+Sources are ``default``, a config file path (with the line of the key for
+TOML, YAML and JSON files), ``environment (NAME)`` for env var overrides and
+``command line`` for CLI arguments (bare optional flags, JSON dict arguments
+and regular flags alike). The index is filled while the layers are merged,
+one entry per leaf path holding a source id and a line number, and is only
+built when ``cli()`` is called with ``provenance=True``. The source of a
+value is decided from the loaded data; line numbers are only looked up in
+the text read when the file was loaded (the YAML node tree, a scan of the
+TOML and JSON text) and left out when the file changed meanwhile.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import json
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from pydantic_config.cli import _IdentityMemo, _env_index, _kebab_path, _nest_config, _parse_cli_value, _walk_plan
+from pydantic_config.watch import _file_stamp
+
+DEFAULT_SOURCE = "default"
+COMMAND_LINE_SOURCE = "command line"
+
+# resolved config -> its ProvenanceIndex
+_PROVENANCE = _IdentityMemo()
+
+
+@dataclass(frozen=True)
+class ValueSource:
+    """Where the value at ``path`` came from.
+
+    For a value inside a dict field, ``path`` is the field that was set.
+    """
+
+    path: str
+    source: str
+    line: int | None = None
+
+    def __str__(self) -> str:
+        if self.line is not None:
+            return f"{self.source}:{self.line}"
+        if self.source == COMMAND_LINE_SOURCE:
+            return f"{self.source} (--{_kebab_path(self.path)})"
+        return self.source
+
+
+@functools.lru_cache(maxsize=None)
+def _section_paths(cls: type) -> frozenset[str]:
+    """Dotted paths of the sub-model fields of ``cls`` (values below them are recorded per leaf)."""
+    kinds = ("model", "optional_model", "union", "registry")
+    return frozenset(
+        path for path, planned in _walk_plan(cls, into=("model", "optional_model", "union")) if planned.kind in kinds
+    )
+
+
+def _leaf_paths(cls: type, data: dict, prefix: str = "") -> list[str]:
+    """Dotted paths of the leaf values of ``data``, a config layer of ``cls``."""
+    sections = _section_paths(cls)
+    paths = []
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict) and value and path in sections:
+            paths.extend(_leaf_paths(cls, value, path))
+        else:
+            paths.append(path)
+    return paths
+
+
+_TOML_TABLE_RE = re.compile(r"^\s*\[\[?\s*([^\]]+?)\s*\]\]?\s*(#.*)?$")
+_TOML_KEY_RE = re.compile(r"""^\s*((?:[\w-]+|"[^"]*"|'[^']*')(?:\s*\.\s*(?:[\w-]+|"[^"]*"|'[^']*'))*)\s*=""")
+_JSON_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|[{}\[\]:,\n]')
+_YAML_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+def _toml_key(text: str) -> str:
+    return ".".join(part.strip().strip("\"'") for part in re.findall(r"""[\w-]+|"[^"]*"|'[^']*'""", text))
+
+
+def _toml_scan(line: str, string: str | None, depth: int) -> tuple[str | None, int]:
+    """Open multi-line string delimiter and bracket depth after ``line``, starting from ``string`` and ``depth``."""
+    i = 0
+    while i < len(line):
+        if string is not None:
+            if string[0] == '"' and line[i] == "\\":
+                i += 2
+            elif line.startswith(string, i):
+                i += len(string)
+                string = None
+            else:
+                i += 1
+            continue
+        char = line[i]
+        if char == "#":
+            break
+        if line.startswith(('"""', "'''"), i):
+            string = line[i : i + 3]
+            i += 3
+            continue
+        if char in "\"'":
+            string = char
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+        i += 1
+    # only triple-quoted strings span lines
+    return (string if string is not None and len(string) == 3 else None), max(depth, 0)
+
+
+def _toml_key_lines(text: str) -> dict[str, int]:
+    lines: dict[str, int] = {}
+    table = ""
+    # lines inside multi-line strings and arrays hold no keys
+    string: str | None = None
+    depth = 0
+    for number, line in enumerate(text.splitlines(), 1):
+        if string is None and depth == 0:
+            if match := _TOML_TABLE_RE.match(line):
+                table = _toml_key(match.group(1))
+                lines.setdefault(table, number)
+            elif match := _TOML_KEY_RE.match(line):
+                key = _toml_key(match.group(1))
+                lines.setdefault(f"{table}.{key}" if table else key, number)
+        string, depth = _toml_scan(line, string, depth)
+    return lines
+
+
+def _yaml_key_lines(text: str) -> dict[str, int]:
+    """Key lines from the YAML node tree: keys merged from an anchor (``<<: *base``) point into the anchor."""
+    if importlib.util.find_spec("yaml") is None:
+        return {}
+    import yaml
+
+    try:
+        root = yaml.compose(text, Loader=yaml.FullLoader)
+    except yaml.YAMLError:
+        return {}
+    lines: dict[str, int] = {}
+    # mappings being visited, against aliases of an enclosing mapping
+    visiting: set[int] = set()
+
+    def visit(node: object, prefix: str) -> None:
+        if not isinstance(node, yaml.MappingNode) or id(node) in visiting:
+            return
+        visiting.add(id(node))
+        merged = []
+        for key, value in node.value:
+            if key.tag == _YAML_MERGE_TAG:
+                merged.extend(value.value if isinstance(value, yaml.SequenceNode) else [value])
+            elif isinstance(key, yaml.ScalarNode):
+                path = f"{prefix}.{key.value}" if prefix else key.value
+                lines.setdefault(path, key.start_mark.line + 1)
+                visit(value, path)
+        # keys written in the mapping win over merged ones
+        for value in merged:
+            visit(value, prefix)
+        visiting.discard(id(node))
+
+    visit(root, "")
+    return lines
+
+
+def _json_key_lines(text: str) -> dict[str, int]:
+    lines: dict[str, int] = {}
+    # one entry per open container: the path of its key (None inside lists), and whether it is an object
+    stack: list[tuple[str | None, bool]] = []
+    pending_key: str | None = None
+    last_string: str | None = None
+    number = 1
+    for match in _JSON_TOKEN_RE.finditer(text):
+        token = match.group()
+        if token == "\n":
+            number += 1
+        elif token.startswith('"'):
+            last_string = json.loads(token)
+        elif token == ":" and stack and stack[-1][1] and stack[-1][0] is not None and last_string is not None:
+            parent = stack[-1][0]
+            pending_key = f"{parent}.{last_string}" if parent else last_string
+            lines.setdefault(pending_key, number)
+        elif token in "{[":
+            # list entries are not field paths
+            path = "" if not stack else pending_key if stack[-1][1] else None
+            stack.append((path, token == "{"))
+            pending_key = None
+        elif token in "}]":
+            if stack:
+                stack.pop()
+        elif token == ",":
+            pending_key = None
+            last_string = None
+    return lines
+
+
+def _key_lines(path: str, text: str) -> dict[str, int]:
+    """Line number of every key path in ``text``, the config file at ``path`` ({} for unknown formats)."""
+    if path.endswith(".toml"):
+        return _toml_key_lines(text)
+    if path.endswith((".yaml", ".yml")):
+        return _yaml_key_lines(text)
+    if path.endswith(".json"):
+        return _json_key_lines(text)
+    return {}
+
+
+class ProvenanceIndex:
+    """Source of each leaf path of a resolved config, recorded layer by layer (later layers win)."""
+
+    def __init__(self) -> None:
+        self._sources: list[str] = []
+        self._source_ids: dict[str, int] = {}
+        # dotted leaf path -> (source id, line number or None)
+        self._entries: dict[str, tuple[int, int | None]] = {}
+        # config file path -> line of each key, from the text read when the file was loaded
+        self._file_lines: dict[str, dict[str, int]] = {}
+
+    def _source_id(self, source: str) -> int:
+        source_id = self._source_ids.get(source)
+        if source_id is None:
+            source_id = self._source_ids[source] = len(self._sources)
+            self._sources.append(source)
+        return source_id
+
+    def record(self, cls: type, data: dict, source: str, lines: Mapping[str, int] | None = None) -> None:
+        """Record ``source`` for every leaf of the config layer ``data``."""
+        source_id = self._source_id(source)
+        for path in _leaf_paths(cls, data):
+            self._entries[path] = (source_id, lines.get(path) if lines else None)
+
+    def record_cli(self, cls: type, data: dict) -> None:
+        """Record a config layer parsed from CLI arguments."""
+        self.record(cls, data, COMMAND_LINE_SOURCE)
+
+    def load_file(self, path: str, loader: Callable[[str], dict]) -> dict:
+        """Load the config file at ``path`` with ``loader``, keeping the line of each of its keys.
+
+        The lines are only used to locate keys ``record_files`` attributes to
+        the file from the loaded data. They are dropped when the file changed
+        while it was loaded, since its text may not hold the loaded data.
+        """
+        stamp = _file_stamp(path)
+        data = loader(path)
+        try:
+            with open(path) as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return data
+        if stamp is not None and _file_stamp(path) == stamp:
+            self._file_lines[path] = _key_lines(path, text)
+        return data
+
+    def record_files(self, cls: type, files: list[tuple[str | None, str, dict]]) -> None:
+        """Record config files loaded for ``(arg_name, path, data)``, in merge order."""
+        for arg_name, path, data in files:
+            key_path = arg_name.replace("-", "_") if arg_name else ""
+            lines = self._file_lines.get(path, {})
+            if key_path:
+                data = _nest_config(key_path, data)
+                lines = {f"{key_path}.{key}": line for key, line in lines.items()}
+            self.record(cls, data, path, lines)
+
+    def record_env(self, cls: type, env_prefix: str, environ: Mapping[str, str]) -> None:
+        """Record the environment variable overrides of ``cls``."""
+        for env_name, path in _env_index(cls, env_prefix).items():
+            value = environ.get(env_name)
+            if value is not None:
+                self.record(cls, _nest_config(path, _parse_cli_value(value)), f"environment ({env_name})")
+
+    def record_args(self, cls: type, args: list[str]) -> None:
+        """Record the fields set by CLI flags in ``args`` (``--a.b value``, ``--a.b=value``, ``--no-flag``)."""
+        source_id = self._source_id(COMMAND_LINE_SOURCE)
+        for arg in args:
+            if not arg.startswith("--"):
+                continue
+            path = arg[2:].split("=", 1)[0].replace("-", "_")
+            head, _, name = path.rpartition(".")
+            if name.startswith("no_"):
+                path = f"{head}.{name[3:]}" if head else name[3:]
+            self._entries[path] = (source_id, None)
+
+    def rebase(self, select: str) -> None:
+        """Keep only the paths under ``select``, relative to it."""
+        prefix = select + "."
+        self._entries = {path[len(prefix) :]: entry for path, entry in self._entries.items() if path.startswith(prefix)}
+
+    def explain(self, cls: type, path: str) -> ValueSource:
+        """Source of the value at ``path`` (dotted, snake or kebab case)."""
+        path = path.replace("-", "_")
+        sections = _section_paths(cls)
+        if path in sections and any(p.startswith(path + ".") for p in self._entries):
+            raise ValueError(f"'{path}' is a section set by several sources; explain one of its fields")
+        # a value inside a dict field was set with the whole field
+        probe = path
+        while probe:
+            entry = self._entries.get(probe)
+            if entry is not None and (probe == path or probe not in sections):
+                return ValueSource(probe, self._sources[entry[0]], entry[1])
+            probe = probe.rpartition(".")[0]
+        return ValueSource(path, DEFAULT_SOURCE)
+
+
+def explain(config: BaseModel, path: str) -> ValueSource:
+    """Where the value at dotted ``path`` of ``config`` came from.
+
+    ``config`` must have been resolved by ``cli(..., provenance=True)``.
+    """
+    index = _PROVENANCE.get(config)
+    if index is None:
+        raise ValueError("No provenance recorded for this config; resolve it with cli(..., provenance=True)")
+    return index.explain(type(config), path)
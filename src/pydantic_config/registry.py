@@ -0,0 +1,136 @@
+"""
+Registry of union variants that are imported only when selected.
+
+Usage:
+    from pydantic_config import BaseConfig, VariantRegistry
+
+    optimizers = VariantRegistry(
+        "optimizer",
+        {"adamw": "my_project.optim.adamw:AdamWConfig", "sgd": "my_project.optim.sgd:SGDConfig"},
+        entry_point_group="my_project.optimizers",
+    )
+
+    class Config(BaseConfig):
+        optimizer: optimizers.field_type = {"type": "adamw"}
+
+A config selects a variant with its ``type`` tag (``[optimizer] type = "sgd"``).
+Only the module of the selected variant is imported, when the config is
+validated; ``--help`` and configs selecting other variants never import it.
+Sub-fields can be overridden on the command line (``--optimizer.lr 1e-3``).
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.metadata
+import threading
+from typing import Annotated, Any
+
+import tyro
+from pydantic import BaseModel, Field
+from pydantic_core import core_schema
+
+
+class VariantRegistry:
+    """Maps ``type`` tags to config classes declared by import path or entry point.
+
+    Variants come from ``variants`` (tag -> ``"module:Class"`` or a class),
+    from ``register()``, and from the package entry points in
+    ``entry_point_group`` (entry point name = tag). Nothing is imported until
+    a tag is loaded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        variants: dict[str, str | type[BaseModel]] | None = None,
+        *,
+        entry_point_group: str | None = None,
+    ):
+        self.name = name
+        self.entry_point_group = entry_point_group
+        self._targets: dict[str, str | type[BaseModel]] = dict(variants or {})
+        self._loaded: dict[str, type[BaseModel]] = {}
+        self._entry_points_scanned = entry_point_group is None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"VariantRegistry({self.name!r}, tags={self.tags()})"
+
+    def register(self, tag: str, target: str | type[BaseModel]) -> None:
+        """Declare variant ``tag`` as a class or a ``"module:Class"`` import path."""
+        self._targets[tag] = target
+        self._loaded.pop(tag, None)
+
+    def _scan_entry_points(self) -> None:
+        # Reading entry point metadata does not import the variant modules.
+        if self._entry_points_scanned:
+            return
+        for entry_point in importlib.metadata.entry_points(group=self.entry_point_group):
+            self._targets.setdefault(entry_point.name, entry_point.value)
+        self._entry_points_scanned = True
+
+    def tags(self) -> list[str]:
+        """All registered tags, without importing any variant."""
+        self._scan_entry_points()
+        return sorted(self._targets)
+
+    def load(self, tag: str) -> type[BaseModel]:
+        """Import (once) and return the variant class for ``tag``."""
+        cls = self._loaded.get(tag)
+        if cls is not None:
+            return cls
+        with self._lock:
+            self._scan_entry_points()
+            if tag not in self._targets:
+                raise ValueError(f"unknown {self.name} type {tag!r}, expected one of {self.tags()}")
+            target = self._targets[tag]
+            if isinstance(target, str):
+                module_name, _, qualname = target.partition(":")
+                obj: Any = importlib.import_module(module_name)
+                for part in qualname.split("."):
+                    obj = getattr(obj, part)
+                target = obj
+            if not (isinstance(target, type) and issubclass(target, BaseModel)):
+                raise TypeError(f"{self.name} variant {tag!r} is not a Pydantic BaseModel: {target!r}")
+            self._loaded[tag] = target
+            return target
+
+    def _validate(self, value: Any) -> BaseModel:
+        if isinstance(value, BaseModel):
+            tag = getattr(value, "type", None)
+            if tag in self._loaded and isinstance(value, self._loaded[tag]):
+                return value
+            value = value.model_dump()
+        if not isinstance(value, dict):
+            raise ValueError(f"{self.name} must be a table with a 'type' key, got {type(value).__name__}")
+        if "type" not in value:
+            raise ValueError(f"{self.name} is missing its 'type' tag, expected one of {self.tags()}")
+        return self.load(value["type"]).model_validate(value)
+
+    @staticmethod
+    def _serialize(value: BaseModel, info: core_schema.SerializationInfo) -> Any:
+        return value.model_dump(mode=info.mode)
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            self._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(self._serialize, info_arg=True),
+        )
+
+    def __get_pydantic_json_schema__(self, schema: core_schema.CoreSchema, handler: Any) -> dict[str, Any]:
+        return {"type": "object", "properties": {"type": {"enum": self.tags()}}, "required": ["type"]}
+
+    @property
+    def field_type(self) -> Any:
+        """Annotation for a field holding one of the registered variants.
+
+        tyro does not build a parser for the field; its sub-fields are
+        overridden through the config dict like Optional[BaseModel] fields.
+        """
+        return Annotated[Any, Field(validate_default=True), tyro.conf.Suppress, self]
+
+
+def _is_registry_field(metadata: list[Any]) -> bool:
+    """Check if a field's metadata marks it as a VariantRegistry field."""
+    return any(isinstance(m, VariantRegistry) for m in metadata)
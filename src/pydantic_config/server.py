@@ -0,0 +1,229 @@
+"""
+Local config server for short-lived processes.
+
+Usage:
+    python -m pydantic_config serve            # in the project directory
+    python train.py @ config.toml --lr 1e-3    # cli() now asks the server
+
+The server listens on a Unix domain socket. It imports each config class
+once, keeps parsed @ files cached (re-parsed when their modification time or
+size changes) and answers "resolve these args for module:Class" requests
+with the validated config, pickled (see ``BaseConfig.__reduce_ex__``): the
+client rebuilds it without running validators again, and secrets and
+excluded fields survive the trip. ``cli()`` sends its request there when
+the socket exists and falls back to resolving in-process when the server is
+not running, does not know the class, or the class changed since the server
+imported it (restart the server to pick up code changes).
+
+The socket path is ``$PYDANTIC_CONFIG_SOCKET`` (set it to an empty string to
+never use a server), by default ``pydantic_config-<uid>.sock`` in
+``$XDG_RUNTIME_DIR`` or the temp directory. Clients only connect to a socket
+owned by their own user.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import io
+import json
+import os
+import pickle
+import socket
+import socketserver
+import sys
+from typing import Any, Mapping, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_config.cli import (
+    ConfigFileError,
+    _daemon_socket_path,
+    _env_head,
+    _import_target,
+    _is_own_socket,
+    _load_config_file,
+    _resolve,
+    _schema_fingerprint,
+    _select_model,
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Connecting to a server that is not running fails immediately; a server that
+# is running answers in milliseconds, so this only bounds a wedged one.
+CLIENT_TIMEOUT = 30.0
+
+
+class _FileCache:
+    """Parsed config files, re-parsed when their (mtime_ns, size) changes."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[tuple[int, int], dict]] = {}
+
+    def load(self, path: str) -> dict:
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return _load_config_file(path)  # raises the usual "not found" error
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        loaded = _load_config_file(path)
+        self._entries[path] = (stamp, loaded)
+        return loaded
+
+
+def _handle_request(request: dict, files: _FileCache) -> dict:
+    """Resolve one request. Returns the response message."""
+    try:
+        cls = _import_target(request["target"])
+    except ConfigFileError:
+        return {"ok": False, "fallback": True}
+    if _schema_fingerprint(cls) != request.get("schema"):
+        return {"ok": False, "fallback": True}
+
+    cwd = os.getcwd()
+    try:
+        os.chdir(request["cwd"])
+        with contextlib.redirect_stderr(io.StringIO()), contextlib.redirect_stdout(io.StringIO()):
+            config = _resolve(
+                cls,
+                request["args"],
+                console_outputs=False,
+                loader=files.load,
+                select=request.get("select"),
+                env_prefix=request.get("env_prefix"),
+                environ=request.get("environ"),
+            )
+    except ConfigFileError as e:
+        if e.errors or e.causes or e.model is not None:
+            # Validation errors are reported by the client's in-process
+            # resolution, which keeps their structure for the error box.
+            return {"ok": False, "fallback": True}
+        return {"ok": False, "error": e.message}
+    except (SystemExit, Exception):
+        # tyro argument errors and anything unexpected are reported by the
+        # client's own in-process resolution.
+        return {"ok": False, "fallback": True}
+    finally:
+        os.chdir(cwd)
+    try:
+        payload = pickle.dumps(config)
+    except Exception:
+        return {"ok": False, "fallback": True}
+    return {"ok": True, "config": base64.b64encode(payload).decode("ascii")}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = _handle_request(request, self.server.files)
+        self.server.requests_handled += 1
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class ConfigServer(socketserver.UnixStreamServer):
+    """Unix socket server resolving configs for ``cli()`` clients.
+
+    Requests are handled one at a time: resolution changes the working
+    directory to the client's, and is CPU bound anyway.
+    """
+
+    def __init__(self, socket_path: str | None = None):
+        socket_path = socket_path or _daemon_socket_path(default=True)
+        if socket_path is None:
+            raise ValueError("no socket path: pass one or unset $PYDANTIC_CONFIG_SOCKET")
+        self.socket_path = socket_path
+        self.files = _FileCache()
+        self.requests_handled = 0
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+        super().__init__(self.socket_path, _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+
+def resolve_remote(
+    cls: type[T],
+    args: list[str],
+    path: str,
+    *,
+    select: str | None = None,
+    env_prefix: str | None = None,
+    environ: Mapping[str, str] | None = None,
+) -> T | None:
+    """Ask the server at ``path`` to resolve ``args`` for ``cls``.
+
+    Returns None when the caller should resolve in-process instead (server
+    not running, unknown or changed class, argument error). Raises
+    ConfigFileError for invalid configs.
+    """
+    if cls.__module__ == "__main__" or "<locals>" in cls.__qualname__:
+        return None
+    environ = os.environ if environ is None else environ
+    request: dict[str, Any] = {
+        "target": f"{cls.__module__}:{cls.__qualname__}",
+        "schema": _schema_fingerprint(cls),
+        "args": list(args),
+        "cwd": os.getcwd(),
+        "select": select,
+        "env_prefix": env_prefix,
+        "environ": {k: v for k, v in environ.items() if k.startswith(_env_head(env_prefix))} if env_prefix else None,
+    }
+    if not _is_own_socket(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(path)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                response = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+
+    if response.get("error") is not None:
+        raise ConfigFileError(response["error"])
+    if not response.get("ok"):
+        return None
+    target_cls = _select_model(cls, select)[0] if select else cls
+    try:
+        # the socket belongs to this user (checked above), so does the server
+        config = pickle.loads(base64.b64decode(response["config"]))
+    except Exception:
+        return None
+    return config if isinstance(config, target_cls) else None
+
+
+def main(argv: list[str]) -> int:
+    """Entry point of ``python -m pydantic_config serve``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pydantic_config serve",
+        description="Serve config resolution to cli() over a Unix socket.",
+    )
+    parser.add_argument(
+        "--socket", default=None, help="socket path (default: $PYDANTIC_CONFIG_SOCKET or per-user path)"
+    )
+    ns = parser.parse_args(argv)
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    with ConfigServer(ns.socket) as server:
+        print(f"pydantic_config: serving on {server.socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
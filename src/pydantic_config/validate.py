@@ -0,0 +1,203 @@
+"""
+Batch validation of config files against a BaseConfig class.
+
+Usage:
+    python -m pydantic_config validate pkg.module:Config configs/**/*.toml
+
+Every file is loaded with the same loaders as the @ syntax and validated on a
+process pool. Files that validated before are skipped as long as neither
+their content nor the schema of the config class changed (see
+``_schema_fingerprint``). Results are cached in ``.pydantic_config_cache.json``.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+from pydantic_config.cli import (
+    ConfigFileError,
+    _build_default_from_config,
+    _import_target,
+    _load_config_file,
+    _print_config_error,
+    _resolve_interpolations,
+    _schema_fingerprint,
+)
+
+DEFAULT_CACHE_PATH = ".pydantic_config_cache.json"
+CONFIG_FILE_EXTENSIONS = (".toml", ".yaml", ".yml", ".json")
+
+
+def _file_digest(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _expand_paths(patterns: list[str]) -> list[str]:
+    """Expand globs (including ``**``) and directories into a sorted list of config files."""
+    paths: set[str] = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                paths.update(os.path.join(root, f) for f in files if f.endswith(CONFIG_FILE_EXTENSIONS))
+        elif glob.has_magic(pattern):
+            paths.update(glob.glob(pattern, recursive=True))
+        else:
+            paths.add(pattern)
+    return sorted(paths)
+
+
+def _validate_file(cls: type[BaseModel] | str, path: str) -> str | None:
+    """Validate one config file. Returns the error message, or None if it is valid."""
+    try:
+        if isinstance(cls, str):
+            cls = _import_target(cls)
+        config = _load_config_file(path) or {}
+        if config:
+            _build_default_from_config(cls, _resolve_interpolations(cls, config), config_path=path)
+        else:
+            cls.model_validate({})
+    except ConfigFileError as e:
+        return e.message
+    except Exception as e:
+        return f"Failed to validate config from '{path}': {e}"
+    return None
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of ``validate_files``."""
+
+    checked: int = 0
+    cached: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def summary(self) -> str:
+        rate = self.checked / self.seconds if self.seconds > 0 else float("inf")
+        return (
+            f"Validated {self.checked} files ({self.cached} cached, {len(self.errors)} failed) "
+            f"in {self.seconds:.2f}s ({rate:.0f} files/s)"
+        )
+
+
+def _read_cache(cache_path: str | None) -> dict:
+    if cache_path is None:
+        return {}
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache_path: str | None, cache: dict) -> None:
+    if cache_path is None:
+        return
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, cache_path)
+
+
+def validate_files(
+    cls: type[BaseModel] | str,
+    patterns: list[str],
+    *,
+    jobs: int | None = None,
+    cache_path: str | None = DEFAULT_CACHE_PATH,
+) -> ValidationReport:
+    """Validate every config file matched by ``patterns`` against ``cls``.
+
+    ``cls`` is a config class or a ``module:Class`` import string (workers
+    import it themselves). Work is spread over ``jobs`` processes (all CPUs
+    when None, in-process when 1). Files whose content hash and schema
+    fingerprint match a previous successful run are skipped; pass
+    ``cache_path=None`` to disable the cache.
+    """
+    start = time.perf_counter()
+    model_cls = _import_target(cls) if isinstance(cls, str) else cls
+    fingerprint = _schema_fingerprint(model_cls)
+    paths = _expand_paths(patterns)
+
+    cache = _read_cache(cache_path)
+    if cache.get("schema") != fingerprint:
+        cache = {"schema": fingerprint, "files": {}}
+    valid_files: dict[str, str] = cache["files"]
+
+    report = ValidationReport(checked=len(paths))
+    digests = {path: _file_digest(path) for path in paths}
+    todo = []
+    for path in paths:
+        key = os.path.abspath(path)
+        if digests[path] is not None and valid_files.get(key) == digests[path]:
+            report.cached += 1
+        else:
+            todo.append(path)
+
+    worker = functools.partial(_validate_file, cls)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(todo) <= 1:
+        results = [worker(path) for path in todo]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as executor:
+            results = list(executor.map(worker, todo, chunksize=max(1, len(todo) // (jobs * 4))))
+
+    for path, error in zip(todo, results):
+        key = os.path.abspath(path)
+        if error is None:
+            if digests[path] is not None:
+                valid_files[key] = digests[path]
+        else:
+            valid_files.pop(key, None)
+            report.errors[path] = error
+
+    _write_cache(cache_path, cache)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv: list[str]) -> int:
+    """Entry point of ``python -m pydantic_config validate``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pydantic_config validate",
+        description="Validate config files against a BaseConfig class.",
+    )
+    parser.add_argument("target", help="config class, e.g. pkg.module:Config")
+    parser.add_argument("paths", nargs="+", help="config files, directories or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="validate every file and do not write the cache")
+    ns = parser.parse_args(argv)
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    try:
+        report = validate_files(ns.target, ns.paths, jobs=ns.jobs, cache_path=None if ns.no_cache else ns.cache)
+    except ConfigFileError as e:
+        _print_config_error(e)
+        return 1
+
+    for message in report.errors.values():
+        _print_config_error(ConfigFileError(message))
+    print(report.summary(), file=sys.stderr)
+    return 0 if report.ok else 1
@@ -0,0 +1,249 @@
+"""
+Hot-reload of configs built with the @ file syntax.
+
+Usage:
+    from pydantic_config.watch import watch
+
+    def on_change(config, diff):
+        print("reloaded:", diff)  # {"train.lr": (0.001, 0.0003)}
+
+    watcher = watch(Config, args=["@", "serve.toml"], callback=on_change)
+    config = watcher.config
+    ...
+    watcher.stop()
+
+The watcher records every file that fed the resolved config and polls their
+modification time and size. When one changes, only the changed files are
+parsed again, and only the sub-models along the changed paths are
+re-validated. Every other sub-model instance is shared with the previous config.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from pydantic_config.cli import (
+    ConfigFileError,
+    _apply_overrides,
+    _collect_config,
+    _dict_diff,
+    _load_config_file,
+    _resolve,
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for ``path``, or None if it no longer exists."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cli_paths(remaining_args: list[str]) -> set[str]:
+    """Dotted snake_case field paths set by the args left for tyro (e.g. ``--train.lr``)."""
+    return {arg[2:].split("=", 1)[0].replace("-", "_") for arg in remaining_args if arg.startswith("--")}
+
+
+def _flatten(diff: dict, prefix: str = "") -> list[str]:
+    """List the dotted leaf paths of a nested diff."""
+    paths = []
+    for key, value in diff.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict) and value:
+            paths.extend(_flatten(value, path))
+        else:
+            paths.append(path)
+    return paths
+
+
+def _drop_cli_paths(diff: dict, cli_paths: set[str], prefix: str = "") -> dict | None:
+    """Remove diff entries that CLI args override anyway.
+
+    Returns None when a replaced subtree contains a CLI-set path, which
+    needs a full resolve to keep the CLI value.
+    """
+    kept: dict = {}
+    for key, value in diff.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if path in cli_paths:
+            continue
+        if isinstance(value, dict) and value:
+            if "type" in value and any(p.startswith(path + ".") for p in cli_paths):
+                return None
+            sub = _drop_cli_paths(value, cli_paths, path)
+            if sub is None:
+                return None
+            if sub:
+                kept[key] = sub
+        else:
+            kept[key] = value
+    return kept
+
+
+def _get_path(obj: Any, path: str) -> Any:
+    for part in path.split("."):
+        if isinstance(obj, dict):
+            obj = obj.get(part)
+        else:
+            obj = getattr(obj, part, None)
+    return obj
+
+
+class ConfigWatcher(Generic[T]):
+    """Keep a config resolved from ``args`` up to date with its @ files.
+
+    Call ``check()`` to poll once, or ``start()`` to poll from a daemon
+    thread every ``interval`` seconds. Callbacks registered with
+    ``on_change`` receive ``(new_config, diff)`` where ``diff`` maps dotted
+    field paths to ``(old_value, new_value)``. Reload failures keep the
+    previous config and are passed to ``on_error`` callbacks (printed to
+    stderr when none are registered).
+    """
+
+    def __init__(self, cls: type[T], args: list[str] | None = None, *, interval: float = 1.0):
+        self.cls = cls
+        self.args = list(sys.argv[1:] if args is None else args)
+        self.interval = interval
+        self._parsed: dict[str, dict] = {}
+        self._stamps: dict[str, tuple[int, int] | None] = {}
+        self._callbacks: list[Callable[[T, dict[str, tuple[Any, Any]]], None]] = []
+        self._error_callbacks: list[Callable[[Exception], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._remaining_args, self._merged = _collect_config(cls, self.args, loader=self._load)
+        self._config: T = _resolve(cls, self.args, loader=self._load)
+
+    @property
+    def config(self) -> T:
+        """The most recently resolved config."""
+        return self._config
+
+    @property
+    def files(self) -> list[str]:
+        """Config files that fed the resolved config."""
+        return list(self._stamps)
+
+    def _load(self, path: str) -> dict:
+        """Load ``path``, re-parsing it only if it changed since the last load."""
+        stamp = _file_stamp(path)
+        if path in self._parsed and stamp is not None and self._stamps.get(path) == stamp:
+            return self._parsed[path]
+        loaded = _load_config_file(path)
+        self._parsed[path] = loaded
+        self._stamps[path] = stamp
+        return loaded
+
+    def on_change(self, callback: Callable[[T, dict[str, tuple[Any, Any]]], None]) -> None:
+        """Register ``callback(new_config, diff)``, called after each successful reload."""
+        self._callbacks.append(callback)
+
+    def on_error(self, callback: Callable[[Exception], None]) -> None:
+        """Register ``callback(error)``, called when a reload fails."""
+        self._error_callbacks.append(callback)
+
+    def check(self) -> bool:
+        """Poll the watched files once and reload if any changed. Returns True on reload.
+
+        A failed reload is reported once: the stamps of the changed files
+        (None for a deleted file) are recorded, so the same state is not
+        reloaded again on the next poll.
+        """
+        with self._lock:
+            stamps = {path: _file_stamp(path) for path in self._stamps}
+            if stamps == self._stamps:
+                return False
+        try:
+            self.reload()
+        except (ConfigFileError, ValidationError) as e:
+            with self._lock:
+                for path, stamp in stamps.items():
+                    if self._stamps.get(path) != stamp:
+                        self._stamps[path] = stamp
+                        # re-parse on the next change instead of reusing the old content
+                        self._parsed.pop(path, None)
+            if not self._error_callbacks:
+                print(f"pydantic_config: config reload failed: {e}", file=sys.stderr)
+            for callback in self._error_callbacks:
+                callback(e)
+            return False
+        return True
+
+    def reload(self) -> T:
+        """Re-parse changed files and rebuild the config, re-validating only what changed."""
+        with self._lock:
+            old = self._config
+            remaining_args, merged = _collect_config(self.cls, self.args, loader=self._load)
+            diff = _dict_diff(self._merged, merged)
+            if diff is not None:
+                diff = _drop_cli_paths(diff, _cli_paths(remaining_args))
+
+            if diff is None:
+                # A key was removed or a replaced subtree hides a CLI override:
+                # fall back to a full resolve and diff the dumps.
+                new = _resolve(self.cls, self.args, loader=self._load)
+                changed = _flatten(_dict_diff(old.model_dump(), new.model_dump()) or {})
+            elif diff:
+                new = _apply_overrides(old, diff)
+                changed = _flatten(diff)
+            else:
+                new, changed = old, []
+
+            self._merged = merged
+            self._remaining_args = remaining_args
+            self._config = new
+
+        if changed:
+            changes = {path: (_get_path(old, path), _get_path(new, path)) for path in changed}
+            for callback in self._callbacks:
+                callback(new, changes)
+        return new
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> ConfigWatcher[T]:
+        """Start polling from a daemon thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pydantic-config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> ConfigWatcher[T]:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def watch(
+    cls: type[T],
+    args: list[str] | None = None,
+    *,
+    callback: Callable[[T, dict[str, tuple[Any, Any]]], None] | None = None,
+    interval: float = 1.0,
+) -> ConfigWatcher[T]:
+    """Resolve ``cls`` from ``args`` like ``cli()`` and start watching its @ files for changes."""
+    watcher = ConfigWatcher(cls, args, interval=interval)
+    if callback is not None:
+        watcher.on_change(callback)
+    return watcher.start()
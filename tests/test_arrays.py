@@ -0,0 +1,147 @@
+"""Tests for NumPy array fields."""
+
+import json
+import os
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pydantic import ValidationError  # noqa: E402
+
+from pydantic_config import BaseConfig, cli, config_hash  # noqa: E402
+from pydantic_config.arrays import NDArray  # noqa: E402
+from pydantic_config.watch import ConfigWatcher  # noqa: E402
+
+
+class LossConfig(BaseConfig):
+    class_weights: NDArray("float32", shape=(None,)) = "1.0*4"
+
+
+class ArrayConfig(BaseConfig):
+    loss: LossConfig = LossConfig()
+    lr_mult: NDArray("float64", shape=(3,)) = [1.0, 1.0, 1.0]
+
+
+def test_npy_file_is_memory_mapped(tmp_path):
+    path = tmp_path / "weights.npy"
+    np.save(path, np.arange(1000, dtype=np.float32))
+    config = LossConfig(class_weights=str(path))
+    assert isinstance(config.class_weights, np.memmap)
+    assert not config.class_weights.flags.writeable
+    assert config.class_weights[999] == 999
+
+
+def test_npz_member_is_memory_mapped(tmp_path):
+    path = tmp_path / "arrays.npz"
+    np.savez(path, class_weights=np.full(10, 0.5, dtype=np.float32), other=np.zeros(2))
+    config = LossConfig(class_weights=f"{path}:class_weights")
+    assert isinstance(config.class_weights, np.memmap)
+    np.testing.assert_array_equal(config.class_weights, np.full(10, 0.5))
+
+
+def test_compressed_npz_is_loaded(tmp_path):
+    path = tmp_path / "arrays.npz"
+    np.savez_compressed(path, w=np.ones(5, dtype=np.float32))
+    config = LossConfig(class_weights=str(path))
+    np.testing.assert_array_equal(config.class_weights, np.ones(5))
+
+
+def test_npz_requires_key_with_several_arrays(tmp_path):
+    path = tmp_path / "arrays.npz"
+    np.savez(path, a=np.ones(2, dtype=np.float32), b=np.ones(2, dtype=np.float32))
+    with pytest.raises(ValidationError, match="select one"):
+        LossConfig(class_weights=str(path))
+
+
+@pytest.mark.parametrize(
+    "literal,expected",
+    [
+        ("0.5,1.5", [0.5, 1.5]),
+        ("[1 2 3]", [1, 2, 3]),
+        ("0.5*3,1.0", [0.5, 0.5, 0.5, 1.0]),
+    ],
+)
+def test_literals(literal, expected):
+    config = LossConfig(class_weights=literal)
+    assert config.class_weights.dtype == np.float32
+    np.testing.assert_array_equal(config.class_weights, expected)
+
+
+def test_dtype_and_shape_checks(tmp_path):
+    with pytest.raises(ValidationError, match="expected shape"):
+        ArrayConfig(lr_mult="1,2")
+    path = tmp_path / "weights.npy"
+    np.save(path, np.arange(3, dtype=np.int64))
+    with pytest.raises(ValidationError, match="expected dtype float32"):
+        LossConfig(class_weights=str(path))
+
+
+def test_in_memory_arrays_are_not_copied():
+    weights = np.arange(4, dtype=np.float32)
+    config = LossConfig(class_weights=weights)
+    assert np.shares_memory(config.class_weights, weights)
+    assert not config.class_weights.flags.writeable
+    assert weights.flags.writeable
+
+
+def test_cli_file_and_literal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    np.save("weights.npy", np.arange(100, dtype=np.float32))
+    (tmp_path / "run.json").write_text(json.dumps({"loss": {"class_weights": "weights.npy"}}))
+
+    config = cli(ArrayConfig, args=["@", "run.json", "--lr-mult", "0.1,0.2,0.3"])
+    assert isinstance(config.loss.class_weights, np.memmap)
+    assert config.loss.class_weights.shape == (100,)
+    np.testing.assert_array_equal(config.lr_mult, [0.1, 0.2, 0.3])
+
+    config = cli(ArrayConfig, args=["--loss.class-weights", "2.0*8"])
+    np.testing.assert_array_equal(config.loss.class_weights, np.full(8, 2.0))
+
+
+def test_dumps(tmp_path):
+    path = tmp_path / "weights.npy"
+    np.save(path, np.arange(5, dtype=np.float32))
+    config = ArrayConfig(loss=LossConfig(class_weights=str(path)))
+    assert config.model_dump()["loss"]["class_weights"] is config.loss.class_weights
+    dumped = config.model_dump(mode="json")
+    assert dumped["loss"]["class_weights"] == str(path)
+    assert dumped["lr_mult"] == [1.0, 1.0, 1.0]
+    assert ArrayConfig.model_validate_json(config.model_dump_json()).loss.class_weights.shape == (5,)
+
+
+def test_config_hash_uses_array_content(tmp_path):
+    a, b = tmp_path / "a.npy", tmp_path / "b.npy"
+    np.save(a, np.arange(5, dtype=np.float32))
+    np.save(b, np.arange(5, dtype=np.float32))
+    assert config_hash(LossConfig(class_weights=str(a))) == config_hash(LossConfig(class_weights=str(b)))
+    assert config_hash(LossConfig(class_weights=str(a))) != config_hash(LossConfig(class_weights="0,1,2,3,5"))
+
+
+def test_cli_string_and_list_defaults_do_not_warn():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        config = cli(ArrayConfig, args=[])
+    np.testing.assert_array_equal(config.loss.class_weights, np.ones(4))
+
+
+def test_equality_compares_arrays():
+    assert cli(ArrayConfig, args=[]) == cli(ArrayConfig, args=[])
+    assert cli(ArrayConfig, args=[]) != cli(ArrayConfig, args=["--lr-mult", "1,1,2"])
+    assert LossConfig(class_weights="1,2") != LossConfig(class_weights="1,2,3")
+
+
+def test_watcher_full_resolve_diff_with_arrays(tmp_path):
+    root = tmp_path / "root.json"
+    root.write_text(json.dumps({"loss": {"class_weights": "1,2"}, "lr_mult": "1,1,2"}))
+    watcher = ConfigWatcher(ArrayConfig, ["@", str(root)])
+    changes = []
+    watcher.on_change(lambda config, diff: changes.append(diff))
+
+    # a removed key cannot be applied as an override, so the watcher diffs two full resolves
+    root.write_text(json.dumps({"loss": {"class_weights": "1,2"}}))
+    os.utime(root, ns=(2_000_000_000, 2_000_000_000))
+    assert watcher.check() is True
+    assert [list(diff) for diff in changes] == [["lr_mult"]]
+    np.testing.assert_array_equal(watcher.config.lr_mult, np.ones(3))
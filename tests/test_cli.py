@@ -1,15 +1,23 @@
 """Tests for the cli module."""
 
+import io
+import json
 import os
+import pickle
+import sys
+from typing import Any, Literal
 
 import pytest
+from pydantic import BaseModel, PrivateAttr, model_validator
 
-from pydantic_config import cli, BaseConfig, ConfigFileError
+from pydantic_config import cli, BaseConfig, ConfigFileError, FrozenConfig
 from pydantic_config.cli import (
     _deep_merge,
     _load_config_file,
     _nest_config,
+    _print_config_error,
     _process_args,
+    _unpickle_config,
 )
 
 
@@ -428,6 +436,102 @@ def test_cli_discriminated_union_switch_variant_via_cli():
     assert config.name == "world"
 
 
+def test_config_error_carries_structured_errors(tmp_json_file):
+    write_file(tmp_json_file, json.dumps({"count": "x", "extra": 1}))
+    with pytest.raises(ConfigFileError) as exc_info:
+        cli(SimpleConfig, args=["@", tmp_json_file])
+    error = exc_info.value
+    assert error.model is SimpleConfig
+    assert error.source == "merged config"
+    assert {(e["loc"], e["type"]) for e in error.errors} == {
+        (("count",), "int_parsing"),
+        (("extra",), "extra_forbidden"),
+    }
+
+
+class UnionMemberA(BaseConfig):
+    a: int = 0
+
+
+class UnionMemberB(BaseConfig):
+    x: str
+    y: str
+
+
+class UnionErrorsConfig(BaseConfig):
+    member: UnionMemberA | UnionMemberB = UnionMemberA()
+    items: list[UnionMemberA] = []
+    seed: int = 0
+
+
+def test_config_error_rendering_ranks_and_groups(tmp_json_file, capsys, monkeypatch):
+    monkeypatch.setenv("NO_COLOR", "1")
+    write_file(tmp_json_file, json.dumps({"member": {"a": "x"}, "items": [{}, {"a": "y"}], "seed": "z"}))
+    with pytest.raises(ConfigFileError) as exc_info:
+        cli(UnionErrorsConfig, args=["@", tmp_json_file])
+    _print_config_error(exc_info.value, max_lines=0)
+    lines = capsys.readouterr().err.splitlines()
+    fields = [line.strip("│ ") for line in lines if line.startswith("│   ") and not line.startswith("│    ")]
+    # errors outside unions first, then the closest union member (A, one error) before B (three)
+    assert fields == ["items[1].a", "seed", "member.a", "member.x", "member.y"]
+
+
+def test_config_error_rendering_budget(tmp_json_file, capsys, monkeypatch):
+    monkeypatch.setenv("NO_COLOR", "1")
+    write_file(tmp_json_file, json.dumps({"items": [{"a": "x"}] * 500}))
+    with pytest.raises(ConfigFileError) as exc_info:
+        cli(UnionErrorsConfig, args=["@", tmp_json_file])
+    assert len(exc_info.value.errors) == 500
+
+    monkeypatch.setenv("PYDANTIC_CONFIG_MAX_ERROR_LINES", "10")
+    _print_config_error(exc_info.value)
+    err = capsys.readouterr().err
+    assert "500 validation errors in 500 fields" in err
+    assert "items[4].a" in err and "items[5].a" not in err
+    assert "495 more errors in 495 more fields" in err
+
+
+# Tests: collect_errors
+
+
+def test_collect_errors_reports_every_source(tmp_path):
+    root, nested, broken = tmp_path / "root.toml", tmp_path / "train.json", tmp_path / "broken.toml"
+    write_file(root, '[train]\nlr = "fast"')
+    write_file(nested, json.dumps({"batch_size": "x"}))
+    write_file(broken, "bad = [")
+    missing = str(tmp_path / "missing.toml")
+    args = ["@", str(root), "--train", "@", str(nested), "@", str(broken), "@", missing]
+
+    with pytest.raises(ConfigFileError, match="Invalid TOML"):
+        cli(NestedConfig, args=args)
+    with pytest.raises(ConfigFileError) as exc_info:
+        cli(NestedConfig, args=args, collect_errors=True)
+    report = exc_info.value
+    assert report.message.startswith("4 problems in 4 sources")
+    assert [cause.source for cause in report.causes] == [str(root), str(nested), None, None]
+    assert [e["loc"] for e in report.causes[0].errors] == [("train", "lr")]
+    assert [e["loc"] for e in report.causes[1].errors] == [("train", "batch_size")]
+    assert "Invalid TOML" in report.causes[2].message
+    assert "not found" in report.causes[3].message
+
+
+def test_collect_errors_merged_config_and_success(tmp_path):
+    class Required(BaseConfig):
+        name: str
+        count: int = 0
+
+    path = tmp_path / "run.toml"
+    write_file(path, "count = 3")
+    with pytest.raises(ConfigFileError) as exc_info:
+        cli(Required, args=["@", str(path)], collect_errors=True)
+    (cause,) = exc_info.value.causes
+    assert cause.source == "merged config"
+    assert [(e["loc"], e["type"]) for e in cause.errors] == [(("name",), "missing")]
+
+    write_file(path, 'name = "run"\ncount = 3')
+    assert cli(Required, args=["@", str(path), "--count", "4"], collect_errors=True) == Required(name="run", count=4)
+
+
 # Tests: BaseConfig validators
 
 
@@ -1004,6 +1108,22 @@ def test_dict_coercion_annotated_bare_dict():
     assert config.args["verbose"] is False
 
 
+def test_dict_coercion_optional_any_values():
+    """Unions with ``Any`` (``Optional[Any]``, ``Any | None``) are untyped too."""
+    from typing import Optional
+
+    class Config(BaseConfig):
+        args: dict[str, Optional[Any]] = {}
+        kwargs: dict[str, Any | None] = {}
+        nested: dict[str, list[Optional[Any]]] = {}
+
+    config = Config.model_validate({"args": {"port": "8080"}, "kwargs": {"debug": "true"}, "nested": {"x": ["1.5"]}})
+    assert config.args == {"port": 8080}
+    assert config.kwargs == {"debug": True}
+    assert config.nested == {"x": [1.5]}
+    assert cli(Config, args=["--args", '{"port": "8080"}']).args == {"port": 8080}
+
+
 def test_dict_coercion_via_cli():
     """End-to-end: dict values from CLI args should be properly typed."""
     from typing import Any
@@ -1092,3 +1212,1103 @@ def test_dict_coercion_leading_zeros_stay_string():
     config = Config.model_validate({"args": {"code": "007"}})
     assert config.args["code"] == "007"
     assert isinstance(config.args["code"], str)
+
+
+def test_dict_coercion_typed_values_left_to_pydantic():
+    """Typed dict values are converted by pydantic, not guessed (``"1"`` stays a str)."""
+
+    class Config(BaseConfig):
+        names: dict[str, str] = {}
+        weights: dict[str, float] = {}
+
+    config = Config.model_validate({"names": {"a": "1", "b": "true"}, "weights": {"a": "1", "b": "0.5"}})
+    assert config.names == {"a": "1", "b": "true"}
+    assert config.weights == {"a": 1.0, "b": 0.5}
+    assert isinstance(config.weights["a"], float)
+
+
+def test_dict_coercion_nested_untyped_values():
+    """Nested dicts and lists of CLI strings are coerced in untyped dict fields."""
+    from typing import Any
+
+    class Config(BaseConfig):
+        args: dict[str, Any] = {}
+        groups: dict[str, dict[str, Any]] = {}
+        lists: dict[str, list] = {}
+
+    config = Config.model_validate(
+        {
+            "args": {"width": "800", "sub": {"depth": "3", "name": "x"}},
+            "groups": {"a": {"lr": "0.5", "on": "false"}},
+            "lists": {"a": ["1", "2"], "b": [1, "2"]},
+        }
+    )
+    assert config.args == {"width": 800, "sub": {"depth": 3, "name": "x"}}
+    assert config.groups == {"a": {"lr": 0.5, "on": False}}
+    assert config.lists == {"a": [1, 2], "b": [1, "2"]}
+
+
+def test_dict_coercion_negative_zero_stays_string():
+    from typing import Any
+
+    class Config(BaseConfig):
+        args: dict[str, Any] = {}
+
+    assert Config.model_validate({"args": {"x": "-0"}}).args == {"x": "-0"}
+
+
+def test_large_dict_field_kept_out_of_tyro(tmp_json_file):
+    """Dicts larger than TYRO_COLLECTION_LIMIT bypass tyro and come back unchanged."""
+
+    class Inner(BaseConfig):
+        weights: dict[str, float] = {}
+
+    class Config(BaseConfig):
+        inner: Inner = Inner()
+        seed: int = 0
+
+    weights = {f"class_{i}": i / 7 for i in range(1000)}
+    write_file(tmp_json_file, json.dumps({"inner": {"weights": weights}}))
+    config = cli(Config, args=["@", tmp_json_file, "--seed", "3"])
+    assert config.inner.weights == weights
+    assert config.seed == 3
+
+
+def test_large_dict_field_seen_by_model_validator(tmp_json_file):
+    class Config(BaseConfig):
+        weights: dict[str, float] = {}
+        total: float = 0.0
+
+        @model_validator(mode="after")
+        def sum_weights(self):
+            if not self.weights:
+                raise ValueError("weights must not be empty")
+            self.total = sum(self.weights.values())
+            return self
+
+    write_file(tmp_json_file, json.dumps({"weights": {f"class_{i}": 1.0 for i in range(100)}}))
+    config = cli(Config, args=["@", tmp_json_file])
+    assert len(config.weights) == 100
+    assert config.total == 100.0
+
+
+# Tests: large list-of-model fields
+
+
+class DatasetConfig(BaseConfig):
+    name: str
+    weight: float = 1.0
+
+
+class DatasetsConfig(BaseConfig):
+    datasets: list[DatasetConfig] = []
+    seed: int = 0
+
+
+def write_datasets(path: str, n: int, bad: tuple[int, ...] = (), seed: object = 0):
+    datasets = [{"name": f"d{i}", "weight": "heavy" if i in bad else i / 3} for i in range(n)]
+    write_file(path, json.dumps({"datasets": datasets, "seed": seed}))
+
+
+def test_large_model_list_kept_out_of_tyro(tmp_json_file):
+    write_datasets(tmp_json_file, 500)
+    config = cli(DatasetsConfig, args=["@", tmp_json_file, "--seed", "1"])
+    assert len(config.datasets) == 500
+    assert config.datasets[499] == DatasetConfig(name="d499", weight=499 / 3)
+    assert config.seed == 1
+
+
+def test_large_model_list_seen_by_model_validator(tmp_json_file):
+    class Config(DatasetsConfig):
+        @model_validator(mode="after")
+        def seed_from_datasets(self):
+            if not self.datasets:
+                raise ValueError("datasets must not be empty")
+            self.seed = len(self.datasets)
+            return self
+
+    write_datasets(tmp_json_file, 100)
+    config = cli(Config, args=["@", tmp_json_file])
+    assert config.seed == 100
+
+
+def test_validation_jobs_chunks_model_lists(tmp_json_file, monkeypatch):
+    monkeypatch.setattr(sys.modules["pydantic_config.cli"], "PARALLEL_CHUNK_SIZE", 16)
+    write_datasets(tmp_json_file, 100)
+    config = cli(DatasetsConfig, args=["@", tmp_json_file], validation_jobs=2)
+    assert config == cli(DatasetsConfig, args=["@", tmp_json_file])
+    assert [d.name for d in config.datasets] == [f"d{i}" for i in range(100)]
+
+
+def test_validation_jobs_releases_models_and_skips_fork_with_threads(tmp_json_file, monkeypatch):
+    import concurrent.futures
+    import threading
+
+    from pydantic_config.cli import _CHUNK_MODELS
+
+    monkeypatch.setattr(sys.modules["pydantic_config.cli"], "PARALLEL_CHUNK_SIZE", 16)
+    write_datasets(tmp_json_file, 100)
+    expected = cli(DatasetsConfig, args=["@", tmp_json_file])
+    assert cli(DatasetsConfig, args=["@", tmp_json_file], validation_jobs=2) == expected
+    assert _CHUNK_MODELS == {}
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("forked a process pool while other threads run")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+    release = threading.Event()
+    thread = threading.Thread(target=release.wait)
+    thread.start()
+    try:
+        assert cli(DatasetsConfig, args=["@", tmp_json_file], validation_jobs=2) == expected
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_validation_jobs_error_indices(tmp_json_file, monkeypatch):
+    monkeypatch.setattr(sys.modules["pydantic_config.cli"], "PARALLEL_CHUNK_SIZE", 16)
+    write_datasets(tmp_json_file, 100, bad=(3, 37), seed="x")
+    with pytest.raises(ConfigFileError) as exc_info:
+        cli(DatasetsConfig, args=["@", tmp_json_file], validation_jobs=2)
+    message = exc_info.value.message
+    assert "3 validation errors for DatasetsConfig" in message
+    assert "datasets.3.weight" in message
+    assert "datasets.37.weight" in message
+    assert "seed" in message
+
+
+# Tests: acli (async API)
+
+
+def test_acli_with_config_file(tmp_toml_file):
+    import asyncio
+
+    from pydantic_config import acli
+
+    write_file(tmp_toml_file, "[train]\nlr = 0.01")
+    config = asyncio.run(acli(NestedConfig, args=["@", tmp_toml_file, "--seed", "7"]))
+    assert config.train.lr == 0.01
+    assert config.seed == 7
+
+
+def test_acli_raises_instead_of_exiting(tmp_toml_file):
+    import asyncio
+
+    from pydantic_config import acli
+
+    write_file(tmp_toml_file, 'count = "not a number"')
+    with pytest.raises(ConfigFileError, match="Failed to validate"):
+        asyncio.run(acli(SimpleConfig, args=["@", tmp_toml_file]))
+
+
+def test_acli_invalid_cli_args_raise_config_error():
+    import asyncio
+
+    from pydantic_config import acli
+
+    with pytest.raises(ConfigFileError, match="Failed to parse CLI arguments"):
+        asyncio.run(acli(SimpleConfig, args=["--count", "abc"]))
+    with pytest.raises(ConfigFileError, match="Unrecognized options: --foo"):
+        asyncio.run(acli(SimpleConfig, args=["--foo"]))
+
+
+def test_acli_timeout():
+    import asyncio
+    import time
+
+    from pydantic import field_validator
+
+    from pydantic_config import acli
+
+    class SlowConfig(BaseConfig):
+        name: str = "x"
+
+        @field_validator("name")
+        @classmethod
+        def _slow(cls, v: str) -> str:
+            time.sleep(0.5)
+            return v
+
+    with pytest.raises((asyncio.TimeoutError, TimeoutError)):
+        asyncio.run(acli(SlowConfig, args=["--name", "y"], timeout=0.05))
+
+
+def test_acli_calls_run_concurrently_and_keep_other_output(capsys):
+    import asyncio
+    import time
+
+    from pydantic import field_validator
+
+    from pydantic_config import acli
+
+    class SlowConfig(BaseConfig):
+        name: str = "x"
+
+        @field_validator("name")
+        @classmethod
+        def _slow(cls, v: str) -> str:
+            time.sleep(0.3)
+            return v
+
+    async def main():
+        calls = [acli(SlowConfig, args=["--name", f"n{i}"]) for i in range(4)]
+        tasks = asyncio.gather(*calls)
+        await asyncio.sleep(0.1)
+        print("event loop still logging", file=sys.stderr)
+        return await tasks
+
+    start = time.perf_counter()
+    configs = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    assert [c.name for c in configs] == ["n0", "n1", "n2", "n3"]
+    single = time.perf_counter()
+    asyncio.run(acli(SlowConfig, args=["--name", "y"]))
+    single = time.perf_counter() - single
+    assert elapsed < 2.5 * single
+    assert "event loop still logging" in capsys.readouterr().err
+    assert sys.stderr is not None and type(sys.stderr).__name__ != "_ThreadOutput"
+
+
+# Tests: BaseConfig.with_overrides
+
+
+def test_with_overrides_dotted_paths():
+    config = DeepNestedConfig()
+    new = config.with_overrides({"train.lr": 1e-3, "model.encoder.num_layers": 12})
+    assert new.train.lr == 1e-3
+    assert new.model.encoder.num_layers == 12
+    assert config.train.lr == 1e-4
+    assert config.model.encoder.num_layers == 4
+
+
+def test_with_overrides_shares_untouched_sub_models():
+    config = DeepNestedConfig()
+    new = config.with_overrides({"model.encoder.hidden_size": 64})
+    assert new.train is config.train
+    assert new.model.decoder is config.model.decoder
+    assert new.model.encoder is not config.model.encoder
+
+
+def test_with_overrides_validates_values():
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        NestedConfig().with_overrides({"train.lr": "fast"})
+    with pytest.raises(ValidationError):
+        NestedConfig().with_overrides({"train.unknown": 1})
+
+
+def test_with_overrides_merges_into_dict_fields():
+    class Model(BaseConfig):
+        kwargs: dict[str, Any] = {"dropout": 0.0, "heads": 8}
+
+    class Config(BaseConfig):
+        model: Model = Model()
+
+    new = Config().with_overrides({"model.kwargs.dropout": 0.1})
+    assert new.model.kwargs == {"dropout": 0.1, "heads": 8}
+
+
+def test_with_overrides_indexes_lists():
+    class Layer(BaseConfig):
+        hidden: int = 8
+        act: str = "gelu"
+
+    class Config(BaseConfig):
+        layers: list[Layer] = [Layer(), Layer()]
+
+    config = Config()
+    new = config.with_overrides({"layers.1.hidden": 16})
+    assert [layer.hidden for layer in new.layers] == [8, 16]
+    assert new.layers[0] is config.layers[0]
+    with pytest.raises(ValueError, match="'layers' has 2 entries"):
+        config.with_overrides({"layers.2.hidden": 16})
+
+
+def test_with_overrides_coerces_strings():
+    new = NestedConfig().with_overrides({"train.batch_size": "64", "seed": "1"})
+    assert new.train.batch_size == 64
+    assert new.seed == 1
+
+
+def test_with_overrides_switches_union_variant():
+    from typing import Annotated, Literal
+
+    from pydantic import Field
+
+    class DataConfigA(BaseConfig):
+        type: Literal["a"] = "a"
+        value: int = 1
+
+    class DataConfigB(BaseConfig):
+        type: Literal["b"] = "b"
+        value: int = 2
+
+    class ConfigWithUnion(BaseConfig):
+        data: Annotated[DataConfigA | DataConfigB, Field(discriminator="type")] = DataConfigA()
+
+    new = ConfigWithUnion().with_overrides({"data": {"type": "b", "value": 5}})
+    assert isinstance(new.data, DataConfigB)
+    assert new.data.value == 5
+    assert ConfigWithUnion().with_overrides({"data.value": 7}).data.value == 7
+
+
+def test_with_overrides_tracks_fields_set():
+    new = NestedConfig().with_overrides({"train.lr": 0.5})
+    assert new.model_dump(exclude_unset=True) == {"train": {"lr": 0.5}}
+
+
+# Tests: interpolation
+
+
+class InterpTrain(BaseConfig):
+    epochs: int = 10
+    name: str = "run"
+
+
+class InterpData(BaseConfig):
+    steps_per_epoch: int = 100
+
+
+class InterpScheduler(BaseConfig):
+    total_steps: int = 0
+    label: str = ""
+
+
+class InterpConfig(BaseConfig):
+    train: InterpTrain = InterpTrain()
+    data: InterpData = InterpData()
+    scheduler: InterpScheduler = InterpScheduler()
+
+
+def test_interpolation_arithmetic_from_file(tmp_toml_file):
+    write_file(
+        tmp_toml_file,
+        "[train]\nepochs = 3\n[data]\nsteps_per_epoch = 50\n"
+        '[scheduler]\ntotal_steps = "${train.epochs} * ${data.steps_per_epoch}"',
+    )
+    config = cli(InterpConfig, args=["@", tmp_toml_file])
+    assert config.scheduler.total_steps == 150
+
+
+def test_interpolation_uses_class_defaults(tmp_toml_file):
+    write_file(tmp_toml_file, '[scheduler]\ntotal_steps = "${train.epochs} * ${data.steps_per_epoch}"')
+    config = cli(InterpConfig, args=["@", tmp_toml_file])
+    assert config.scheduler.total_steps == 1000
+
+
+def test_interpolation_string_and_chained(tmp_toml_file):
+    write_file(
+        tmp_toml_file,
+        '[train]\nname = "exp-${train.epochs}"\n[scheduler]\nlabel = "${train.name}/final"',
+    )
+    config = cli(InterpConfig, args=["@", tmp_toml_file])
+    assert config.train.name == "exp-10"
+    assert config.scheduler.label == "exp-10/final"
+
+
+def test_interpolation_sees_cli_values(tmp_toml_file):
+    write_file(tmp_toml_file, '[scheduler]\ntotal_steps = "${train.epochs} * 2"')
+    config = cli(InterpConfig, args=["@", tmp_toml_file, "--train.epochs", "7"])
+    assert config.train.epochs == 7
+    assert config.scheduler.total_steps == 14
+
+
+def test_interpolation_in_cli_override():
+    config = cli(InterpConfig, args=["--scheduler.total-steps", "${train.epochs} + 1"])
+    assert config.scheduler.total_steps == 11
+
+
+def test_interpolation_in_cli_override_with_equals():
+    config = cli(InterpConfig, args=["--scheduler.total-steps=${train.epochs} * 3", "--train.epochs=4"])
+    assert config.scheduler.total_steps == 12
+
+
+def test_interpolation_keeps_non_field_references_and_escapes(tmp_toml_file):
+    write_file(
+        tmp_toml_file,
+        '[train]\nname = "echo ${HOME} $${train.epochs}"\n[scheduler]\nlabel = "${train.epochs}-$${USER}"',
+    )
+    config = cli(InterpConfig, args=["@", tmp_toml_file])
+    assert config.train.name == "echo ${HOME} ${train.epochs}"
+    assert config.scheduler.label == "10-${USER}"
+
+
+def test_interpolation_cycle_raises(tmp_toml_file):
+    write_file(
+        tmp_toml_file,
+        '[train]\nepochs = "${scheduler.total_steps}"\n[scheduler]\ntotal_steps = "${train.epochs}"',
+    )
+    with pytest.raises(ConfigFileError, match="Interpolation cycle"):
+        cli(InterpConfig, args=["@", tmp_toml_file])
+
+
+def test_interpolation_unknown_reference_raises(tmp_toml_file):
+    write_file(tmp_toml_file, '[scheduler]\ntotal_steps = "${train.missing}"')
+    with pytest.raises(ConfigFileError, match="Unresolved interpolation"):
+        cli(InterpConfig, args=["@", tmp_toml_file])
+
+
+def test_interpolation_many_references_resolve_in_order():
+    from pydantic_config.cli import _resolve_interpolations
+
+    n = 5000
+    config = {"v0": 1}
+    for i in range(1, n):
+        config[f"v{i}"] = f"${{v{i - 1}}} + 1"
+    result = _resolve_interpolations(BaseConfig, config)
+    assert result[f"v{n - 1}"] == n
+
+
+# Tests: config_hash
+
+
+def test_config_hash_stable_and_content_based():
+    from pydantic_config import config_hash
+
+    a = DeepNestedConfig()
+    b = DeepNestedConfig.model_validate({"name": "experiment", "train": {"batch_size": 32, "lr": 1e-4}})
+    assert config_hash(a) == config_hash(b)
+    assert config_hash(a) != config_hash(a.with_overrides({"train.lr": 2e-4}))
+    assert len(config_hash(a)) == 64
+
+
+def test_config_hash_dict_order_independent():
+    from typing import Any
+
+    from pydantic_config import config_hash
+
+    class Config(BaseConfig):
+        kwargs: dict[str, Any] = {}
+
+    a = Config(kwargs={"x": 1, "y": {"b": 2.5, "a": [1, 2]}})
+    b = Config(kwargs={"y": {"a": [1, 2], "b": 2.5}, "x": 1})
+    assert config_hash(a) == config_hash(b)
+
+
+def test_config_hash_independent_of_hash_seed(tmp_path):
+    import subprocess
+
+    (tmp_path / "seeded_hash_config.py").write_text(
+        "from pydantic_config import BaseConfig\n\n"
+        "class SeededConfig(BaseConfig):\n"
+        '    tags: set[str] = {"alpha", "beta", "gamma", "delta", "epsilon"}\n'
+        '    groups: dict[str, frozenset[str]] = {"a": frozenset({"x", "y", "z", "w"})}\n'
+    )
+    script = (
+        "from seeded_hash_config import SeededConfig\n"
+        "from pydantic_config import config_hash\n"
+        "print(config_hash(SeededConfig()))"
+    )
+    hashes = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=tmp_path,
+            env={**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": str(tmp_path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(hashes) == 1
+
+
+def test_config_hash_memoized_for_frozen_sub_configs():
+    from pydantic import ConfigDict
+
+    from pydantic_config import config_hash
+    from pydantic_config.cli import _DIGEST_MEMO
+
+    class Frozen(BaseConfig):
+        model_config = ConfigDict(frozen=True)
+        x: int = 1
+
+    class Config(BaseConfig):
+        inner: Frozen = Frozen()
+        seed: int = 0
+
+    config = Config()
+    config_hash(config)
+    assert _DIGEST_MEMO.get(config.inner) is not None
+    assert _DIGEST_MEMO.get(config) is None
+    assert config_hash(config) != config_hash(Config(seed=1))
+
+
+def test_config_hash_cli_flag(capsys):
+    from pydantic_config import config_hash
+
+    with pytest.raises(SystemExit) as exc:
+        cli(NestedConfig, args=["--seed", "3", "--config-hash"])
+    assert exc.value.code == 0
+    assert capsys.readouterr().out.strip() == config_hash(NestedConfig(seed=3))
+
+
+# Tests: FrozenConfig interning
+
+
+def test_frozen_config_interned_by_input_and_content():
+    from pydantic_config import FrozenConfig
+
+    class Optimizer(FrozenConfig):
+        lr: float = 1e-3
+        schedule: list[float] = [0.0, 1.0]
+
+    class Run(BaseConfig):
+        seed: int = 0
+        optimizer: Optimizer = Optimizer()
+
+    runs = [Run.model_validate({"seed": i, "optimizer": {"lr": 0.1}}) for i in range(3)]
+    assert runs[0].optimizer is runs[1].optimizer is runs[2].optimizer
+    # Different input, same validated content
+    assert Optimizer(lr="0.1") is runs[0].optimizer
+    assert Optimizer() is Run().optimizer
+    assert Optimizer(lr=0.2) is not runs[0].optimizer
+    assert cli(Run, args=["--optimizer.lr", "0.1"]).optimizer is runs[0].optimizer
+
+
+def test_frozen_config_hash_and_memoized_dumps():
+    from pydantic import ValidationError
+
+    from pydantic_config import FrozenConfig
+
+    class Data(FrozenConfig):
+        mixture: dict[str, float] = {"web": 1.0}
+
+    data = Data()
+    assert {data: 1}[Data()] == 1
+    assert data.model_dump_json() is data.model_dump_json()
+    assert data.model_dump_json() == '{"mixture":{"web":1.0}}'
+    dumped = data.model_dump()
+    dumped["mixture"]["web"] = 0.0
+    assert data.model_dump() == {"mixture": {"web": 1.0}}
+    assert data.model_dump(exclude={"mixture"}) == {}
+    with pytest.raises(ValidationError):
+        data.mixture = {}
+
+
+def test_frozen_config_container_fields_are_read_only():
+    from pydantic_config import FrozenConfig, config_hash
+
+    class Frozen(FrozenConfig):
+        a: int = 1
+        items: list[int] = []
+        groups: dict[str, list[int]] = {}
+        tags: set[str] = set()
+
+    frozen = Frozen(a=2, items=[1], groups={"x": [1]}, tags={"q"})
+    digest, dumped = config_hash(frozen), frozen.model_dump_json()
+    for mutate in (
+        lambda: frozen.items.append(5),
+        lambda: frozen.groups.update(y=[2]),
+        lambda: frozen.groups["x"].append(2),
+        lambda: frozen.tags.add("z"),
+    ):
+        with pytest.raises(TypeError, match="read-only"):
+            mutate()
+    again = Frozen(a=2, items=[1], groups={"x": [1]}, tags={"q"})
+    assert again is frozen
+    assert again.items == [1] and again.groups == {"x": [1]} and again.tags == {"q"}
+    assert config_hash(again) == digest and again.model_dump_json() == dumped
+    assert frozen.with_overrides({"groups.y": [2]}).groups == {"x": [1], "y": [2]}
+    dumped_items = frozen.model_dump()["items"]
+    dumped_items.append(3)
+    assert frozen.items == [1]
+
+
+# Tests: shared default sub-configs
+
+
+def test_shared_defaults_are_not_copied():
+    from pydantic import ValidationError
+
+    class Optimizer(BaseConfig):
+        lr: float = 1e-3
+
+    class Data(BaseConfig):
+        path: str = "data"
+
+    class Run(BaseConfig):
+        share_defaults = True
+        seed: int = 0
+        optimizer: Optimizer = Optimizer()
+        data: Data = Data()
+
+    default = Run.model_fields["optimizer"].default
+    assert Run().optimizer is Run(seed=1).optimizer is default
+    assert Run(optimizer={"lr": 0.1}).optimizer.lr == 0.1
+    assert Run().with_overrides({"data.path": "x"}).optimizer is default
+    with pytest.raises(ValidationError):
+        default.lr = 0.1
+    # Assigning a new sub-config to a regular instance still works
+    run = Run()
+    run.optimizer = Optimizer(lr=0.5)
+    run.optimizer.lr = 0.2
+    assert run.optimizer.lr == 0.2
+    assert hash(default) == hash(Run().optimizer)
+    with pytest.raises(TypeError):
+        hash(run.optimizer)
+
+
+def test_shared_defaults_kept_by_cli():
+    class Optimizer(BaseConfig):
+        lr: float = 1e-3
+
+    class Data(BaseConfig):
+        path: str = "data"
+
+    class Run(BaseConfig):
+        share_defaults = True
+        optimizer: Optimizer = Optimizer()
+        data: Data = Data()
+
+    config = cli(Run, args=["--data.path", "other"])
+    assert config.optimizer is Run.model_fields["optimizer"].default
+    assert config.data.path == "other"
+    assert config.data is not Run.model_fields["data"].default
+
+
+def test_defaults_copied_without_share_defaults():
+    class Optimizer(BaseConfig):
+        lr: float = 1e-3
+
+    class Run(BaseConfig):
+        optimizer: Optimizer = Optimizer()
+
+    assert Run().optimizer is not Run().optimizer
+    Run().optimizer.lr = 0.1
+    assert Run().optimizer.lr == 1e-3
+
+
+def test_share_defaults_leaves_the_class_body_instance_mutable():
+    from pydantic import ValidationError
+
+    class Optimizer(BaseConfig):
+        lr: float = 1e-3
+
+    class Train(BaseConfig):
+        optimizer: Optimizer = Optimizer()
+
+    default = Train()
+
+    class Shared(BaseConfig):
+        share_defaults = True
+        train: Train = default
+
+    class Plain(BaseConfig):
+        train: Train = default
+
+    assert Shared().train is Shared().train
+    with pytest.raises(ValidationError):
+        Shared().train.optimizer.lr = 2.0
+    plain = Plain()
+    plain.train.optimizer.lr = 2.0
+    assert plain.train.optimizer.lr == 2.0
+    default.optimizer.lr = 3.0
+    assert Shared().train.optimizer.lr == 1e-3
+
+
+# Tests: compact pickling
+
+# Pickled classes must be importable, so they live at module level.
+VALIDATIONS = []
+
+
+class PickledAdam(BaseConfig):
+    type: Literal["adam"] = "adam"
+    lr: float = 1e-3
+
+
+class PickledSGD(BaseConfig):
+    type: Literal["sgd"] = "sgd"
+    momentum: float = 0.9
+
+
+class PickledLayer(BaseConfig):
+    hidden: int = 8
+    act: str = "gelu"
+
+
+class PickledRun(BaseConfig):
+    seed: int = 0
+    optimizer: PickledAdam | PickledSGD = PickledAdam()
+    layers: list[PickledLayer] = []
+    wandb: PickledLayer | None = None
+    kwargs: dict[str, object] = {}
+
+    @model_validator(mode="after")
+    def _count(self):
+        VALIDATIONS.append(self)
+        return self
+
+
+class PickledFrozen(FrozenConfig):
+    lr: float = 1e-3
+    milestones: list[int] = []
+
+
+class PickledShared(BaseConfig):
+    share_defaults = True
+    layer: PickledLayer = PickledLayer()
+    frozen: PickledFrozen = PickledFrozen()
+
+
+class PickledPrivate(BaseConfig):
+    _cache: dict = PrivateAttr(default_factory=dict)
+    n: int = 0
+
+
+def test_pickle_roundtrip_without_validation():
+    config = PickledRun(seed=3, optimizer={"type": "sgd"}, layers=[{"hidden": i} for i in range(50)], kwargs={"a": [1]})
+    payload = pickle.dumps(config)
+    VALIDATIONS.clear()
+    restored = pickle.loads(payload)
+    assert VALIDATIONS == []
+    assert restored == config
+    assert isinstance(restored.optimizer, PickledSGD) and restored.wandb is None
+    assert restored.model_fields_set == {"seed", "optimizer", "layers", "kwargs"}
+    assert restored.layers[1].model_fields_set == {"hidden"}
+    restored.layers[0].hidden = 1
+    assert config.layers[0].hidden == 0
+    assert restored.with_overrides({"layers": []}).layers == []
+
+    # smaller than pydantic's own pickling
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer)
+    pickler.dispatch_table = {
+        cls: lambda obj: BaseModel.__reduce_ex__(obj, pickle.DEFAULT_PROTOCOL)
+        for cls in (PickledRun, PickledAdam, PickledSGD, PickledLayer)
+    }
+    pickler.dump(config)
+    assert len(payload) < len(buffer.getvalue()) / 2
+
+
+def test_pickle_keeps_frozen_and_shared_sub_configs_shared():
+    runs = [PickledShared() for _ in range(3)]
+    restored = pickle.loads(pickle.dumps(runs))
+    assert restored[0].layer is restored[1].layer is restored[2].layer
+    assert pickle.loads(pickle.dumps(PickledFrozen(lr=0.5))) is PickledFrozen(lr=0.5)
+    assert restored[0].frozen is PickledFrozen()
+    unpickled = pickle.loads(pickle.dumps(PickledFrozen(milestones=[10, 20])))
+    with pytest.raises(TypeError, match="read-only"):
+        unpickled.milestones.append(30)
+
+
+def test_pickle_fallbacks():
+    private = PickledPrivate(n=1)
+    private._cache["k"] = 1
+    restored = pickle.loads(pickle.dumps(private))
+    assert restored._cache == {"k": 1} and restored.n == 1
+    _, args = PickledRun().__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+    with pytest.raises(pickle.UnpicklingError, match="schema changed"):
+        _unpickle_config(PickledRun, "0" * 64, args[2])
+
+
+def test_unpickle_validates_when_schema_changed():
+    class ChangedRun(PickledRun):
+        dropout: float = 0.1
+
+    config = PickledRun(seed=3, optimizer={"type": "sgd"}, layers=[{"hidden": 4}], wandb={"act": "relu"})
+    _, (_, fingerprint, values, schema) = config.__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+    del VALIDATIONS[:]
+    restored = _unpickle_config(ChangedRun, fingerprint, values, schema)
+    assert isinstance(restored, ChangedRun) and len(VALIDATIONS) == 1
+    assert restored.model_dump() == {**config.model_dump(), "dropout": 0.1}
+
+    class RemovedField(BaseConfig):
+        seed: int = 0
+
+    _, (_, fingerprint, values, schema) = PickledRun().__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+    with pytest.raises(pickle.UnpicklingError, match="do not validate"):
+        _unpickle_config(RemovedField, fingerprint, values, schema)
+
+
+# Tests: select (resolve a single sub-tree)
+
+
+def test_select_returns_sub_model(tmp_toml_file):
+    write_file(tmp_toml_file, "[train]\nlr = 0.01\n[model.encoder]\nhidden_size = 64")
+    config = cli(DeepNestedConfig, args=["@", tmp_toml_file], select="train")
+    assert isinstance(config, NestedInner)
+    assert config.lr == 0.01
+
+
+def test_select_ignores_unrelated_sections(tmp_toml_file):
+    write_file(tmp_toml_file, '[train]\nlr = 0.01\n[model.encoder]\nhidden_size = "not an int"\nbogus = 1')
+    config = cli(DeepNestedConfig, args=["@", tmp_toml_file], select="train")
+    assert config.lr == 0.01
+
+
+def test_select_skips_unrelated_nested_files():
+    config = cli(
+        DeepNestedConfig,
+        args=["--model", "@", "/nonexistent/model.toml", "--train.batch-size", "8"],
+        select="train",
+    )
+    assert config.batch_size == 8
+
+
+def test_select_applies_only_overrides_under_prefix():
+    config = cli(
+        DeepNestedConfig,
+        args=["--model.encoder.num-layers", "2", "--name", "x", "--train.lr", "0.5"],
+        select="model.encoder",
+    )
+    assert isinstance(config, DeepNestedInner)
+    assert config.num_layers == 2
+
+
+def test_select_nested_files_relative_to_prefix(tmp_path):
+    model_file = os.path.join(tmp_path, "model.toml")
+    encoder_file = os.path.join(tmp_path, "encoder.toml")
+    write_file(model_file, "[encoder]\nhidden_size = 128\n[decoder]\nhidden_size = 1")
+    write_file(encoder_file, "num_layers = 9")
+    config = cli(
+        DeepNestedConfig,
+        args=["--model", "@", model_file, "--model.encoder", "@", encoder_file],
+        select="model.encoder",
+    )
+    assert config.hidden_size == 128
+    assert config.num_layers == 9
+
+
+def test_select_uses_field_default():
+    class DataConfig(BaseConfig):
+        path: str = "default"
+        workers: int = 1
+
+    class Config(BaseConfig):
+        data: DataConfig = DataConfig(path="from-parent")
+        seed: int
+
+    config = cli(Config, args=["--data.workers", "4"], select="data")
+    assert config.path == "from-parent"
+    assert config.workers == 4
+
+
+def test_select_unknown_path_raises():
+    with pytest.raises(ConfigFileError, match="has no field 'nope'"):
+        cli(DeepNestedConfig, args=[], select="model.nope")
+
+
+# Tests: automatic discriminators for type-tagged unions
+
+
+class OptimAdam(BaseConfig):
+    type: Literal["adam"] = "adam"
+    lr: float = 1e-3
+
+
+class OptimSGD(BaseConfig):
+    type: Literal["sgd"] = "sgd"
+    lr: float = 1e-2
+    momentum: float = 0.9
+
+
+class OptimConfig(BaseConfig):
+    optimizer: OptimAdam | OptimSGD = OptimAdam()
+
+
+def test_type_tagged_union_gets_discriminator():
+    assert OptimConfig.model_fields["optimizer"].discriminator == "type"
+
+
+def test_type_tagged_union_dispatches_on_tag():
+    from pydantic import ValidationError
+
+    config = OptimConfig.model_validate({"optimizer": {"type": "sgd", "momentum": "0.5"}})
+    assert isinstance(config.optimizer, OptimSGD)
+    assert config.optimizer.momentum == 0.5
+
+    with pytest.raises(ValidationError) as exc:
+        OptimConfig.model_validate({"optimizer": {"type": "sgd", "momentum": "fast"}})
+    assert [e["loc"] for e in exc.value.errors()] == [("optimizer", "sgd", "momentum")]
+
+
+def test_type_tagged_union_default_tag_injected(tmp_toml_file):
+    write_file(tmp_toml_file, "[optimizer]\nlr = 0.5")
+    config = cli(OptimConfig, args=["@", tmp_toml_file])
+    assert isinstance(config.optimizer, OptimAdam)
+    assert config.optimizer.lr == 0.5
+
+
+def test_untagged_union_left_alone():
+    class A(BaseConfig):
+        a: int = 1
+
+    class B(BaseConfig):
+        b: int = 1
+
+    class Config(BaseConfig):
+        value: A | B = A()
+
+    assert Config.model_fields["value"].discriminator is None
+    assert isinstance(Config.model_validate({"value": {"b": 2}}).value, B)
+
+
+def test_required_tagged_union_accepts_tagless_input():
+    class Config(BaseConfig):
+        optimizer: OptimAdam | OptimSGD
+
+    assert Config.model_fields["optimizer"].discriminator is None
+    assert isinstance(Config.model_validate({"optimizer": {"momentum": 0.5}}).optimizer, OptimSGD)
+    assert isinstance(Config.model_validate({"optimizer": {"type": "sgd"}}).optimizer, OptimSGD)
+
+
+# Tests: scoped help
+
+
+def test_help_section_only_renders_section(capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli(DeepNestedConfig, args=["--help", "model.encoder"])
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert "--model.encoder.num-layers" in out
+    assert "--model.decoder" not in out
+    assert "--train.lr" not in out
+
+
+def test_help_section_flag_uses_parent_default(capsys):
+    class DataConfig(BaseConfig):
+        path: str = "default"
+
+    class Config(BaseConfig):
+        data: DataConfig = DataConfig(path="from-parent")
+        seed: int = 0
+
+    with pytest.raises(SystemExit):
+        cli(Config, args=["--help-section", "data"])
+    out = capsys.readouterr().out
+    assert "from-parent" in out
+    assert "--seed" not in out
+
+
+def test_help_sections_summary(capsys):
+    class TrainSection(BaseConfig):
+        """Training loop settings."""
+
+        lr: float = 1e-3
+
+    class Config(BaseConfig):
+        train: TrainSection = TrainSection()
+        seed_value: int = 0
+
+    with pytest.raises(SystemExit) as exc:
+        cli(Config, args=["--help-sections"], prog="train.py")
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert "train       TrainSection  Training loop settings." in out
+    assert "seed-value  int" in out
+    assert "--train.lr" not in out
+
+
+def test_help_unknown_section_raises():
+    with pytest.raises(ConfigFileError, match="has no field 'nope'"):
+        cli(DeepNestedConfig, args=["--help", "nope"])
+
+
+# Tests: @@ response files
+
+
+def test_response_file_overrides(tmp_path):
+    overrides = os.path.join(tmp_path, "overrides.txt")
+    write_file(overrides, "# sweep 12\n--train.lr 0.5\n--seed 7\n")
+    config = cli(NestedConfig, args=["@@", overrides])
+    assert config.train.lr == 0.5
+    assert config.seed == 7
+
+
+def test_response_file_without_space_and_quoting(tmp_path):
+    overrides = os.path.join(tmp_path, "overrides.txt")
+    write_file(overrides, "--name 'hello world'  # quoted value\n")
+    config = cli(SimpleConfig, args=[f"@@{overrides}", "--count", "2"])
+    assert config.name == "hello world"
+    assert config.count == 2
+
+
+def test_response_file_with_config_references(tmp_path):
+    train_file = os.path.join(tmp_path, "train.toml")
+    nested_overrides = os.path.join(tmp_path, "nested.txt")
+    overrides = os.path.join(tmp_path, "overrides.txt")
+    write_file(train_file, "lr = 0.25\nbatch_size = 8")
+    write_file(nested_overrides, "--seed 11")
+    write_file(overrides, f"--train @ {train_file}\n@@ {nested_overrides}\n")
+    config = cli(NestedConfig, args=["@@", overrides, "--train.batch-size", "16"])
+    assert config.train.lr == 0.25
+    assert config.train.batch_size == 16
+    assert config.seed == 11
+
+
+def test_response_file_many_overrides(tmp_path):
+    from pydantic_config.cli import _process_args
+
+    overrides = os.path.join(tmp_path, "overrides.txt")
+    write_file(overrides, "".join(f"--opt.k{i} {i}\n" for i in range(20000)))
+    remaining, _, _ = _process_args(["@@", overrides])
+    assert len(remaining) == 40000
+    assert remaining[-2:] == ["--opt.k19999", "19999"]
+
+
+def test_response_file_errors(tmp_path):
+    with pytest.raises(ConfigFileError, match="Response file not found"):
+        cli(SimpleConfig, args=["@@", "/nonexistent/overrides.txt"])
+
+    looping = os.path.join(tmp_path, "loop.txt")
+    write_file(looping, f"@@ {looping}")
+    with pytest.raises(ConfigFileError, match="includes itself"):
+        cli(SimpleConfig, args=["@@", looping])
+
+
+# Tests: environment variable layer
+
+
+def test_env_overrides_nested_fields(monkeypatch):
+    monkeypatch.setenv("APP__TRAIN__LR", "0.5")
+    monkeypatch.setenv("APP__SEED", "3")
+    monkeypatch.setenv("OTHER__SEED", "99")
+    config = cli(NestedConfig, args=[], env_prefix="APP")
+    assert config.train.lr == 0.5
+    assert config.seed == 3
+
+
+def test_env_between_files_and_cli(monkeypatch, tmp_toml_file):
+    write_file(tmp_toml_file, "seed = 1\n[train]\nlr = 0.1\nbatch_size = 4")
+    monkeypatch.setenv("APP__TRAIN__LR", "0.2")
+    monkeypatch.setenv("APP__SEED", "2")
+    config = cli(NestedConfig, args=["@", tmp_toml_file, "--seed", "3"], env_prefix="APP")
+    assert config.train.lr == 0.2
+    assert config.train.batch_size == 4
+    assert config.seed == 3
+
+
+def test_env_json_values_and_optional_models(monkeypatch):
+    from typing import Any, Optional
+
+    class WandbConfig(BaseConfig):
+        project: str = "default"
+
+    class Config(BaseConfig):
+        wandb: Optional[WandbConfig] = None
+        kwargs: dict[str, Any] = {}
+
+    monkeypatch.setenv("APP__WANDB__PROJECT", "from-env")
+    monkeypatch.setenv("APP__KWARGS", '{"a": 1}')
+    config = cli(Config, args=[], env_prefix="APP")
+    assert config.wandb.project == "from-env"
+    assert config.kwargs == {"a": 1}
+
+
+def test_env_index_precomputed():
+    from pydantic_config.cli import _env_index
+
+    index = _env_index(DeepNestedConfig, "APP")
+    assert index["APP__MODEL__ENCODER__HIDDEN_SIZE"] == "model.encoder.hidden_size"
+    assert index["APP__NAME"] == "name"
+    assert _env_index(DeepNestedConfig, "APP") is index
+
+
+def test_env_invalid_value_reports_error(monkeypatch):
+    monkeypatch.setenv("APP__SEED", "not-a-number")
+    with pytest.raises(ConfigFileError, match="Failed to validate"):
+        cli(NestedConfig, args=[], env_prefix="APP")
@@ -0,0 +1,99 @@
+"""Tests for the columnar export of configs."""
+
+import enum
+from pathlib import Path
+from typing import Literal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pydantic_config import BaseConfig  # noqa: E402
+from pydantic_config.columns import Categorical, to_columns  # noqa: E402
+
+
+class Precision(enum.Enum):
+    fp32 = "fp32"
+    bf16 = "bf16"
+
+
+class AdamConfig(BaseConfig):
+    type: Literal["adam"] = "adam"
+    lr: float = 1e-3
+    betas: tuple[float, float] = (0.9, 0.999)
+
+
+class SGDConfig(BaseConfig):
+    type: Literal["sgd"] = "sgd"
+    lr: float = 0.1
+    momentum: float = 0.9
+
+
+class WandbConfig(BaseConfig):
+    project: str = "default"
+
+
+class TrainConfig(BaseConfig):
+    steps: int = 100
+    compile: bool = False
+    optimizer: AdamConfig | SGDConfig = AdamConfig()
+
+
+class RunConfig(BaseConfig):
+    seed: int = 0
+    name: str = "run"
+    out: Path = Path("out")
+    precision: Precision = Precision.fp32
+    train: TrainConfig = TrainConfig()
+    wandb: WandbConfig | None = None
+    max_steps: int | None = None
+    tags: list[str] = []
+
+
+def make_configs() -> list[RunConfig]:
+    return [
+        RunConfig(
+            seed=i,
+            name=f"run-{i % 2}",
+            precision=Precision.bf16 if i % 2 else Precision.fp32,
+            train={"steps": 10 * i, "optimizer": {"type": "sgd", "momentum": 0.5} if i % 2 else {"type": "adam"}},
+            wandb={"project": "p"} if i == 0 else None,
+            max_steps=i if i % 2 else None,
+            tags=["a"] * i,
+        )
+        for i in range(4)
+    ]
+
+
+def test_dense_columns():
+    columns = to_columns(make_configs())
+    assert columns["seed"].dtype == np.int64 and columns["seed"].tolist() == [0, 1, 2, 3]
+    assert columns["train.steps"].tolist() == [0, 10, 20, 30]
+    assert columns["train.compile"].dtype == np.bool_
+    assert columns["train.optimizer.lr"].dtype == np.float64
+    assert columns["train.optimizer.lr"].tolist() == [1e-3, 0.1, 1e-3, 0.1]
+    name = columns["name"]
+    assert isinstance(name, Categorical) and name.categories == ["run-0", "run-1"]
+    assert name.codes.tolist() == [0, 1, 0, 1]
+    assert columns["precision"].decode().tolist() == [Precision.fp32, Precision.bf16] * 2
+    assert columns["out"].categories == [Path("out")]
+    assert columns["tags"].dtype == object and columns["tags"][3] == ["a"] * 3
+
+
+def test_sparse_columns():
+    columns = to_columns(make_configs())
+    assert columns["train.optimizer"].decode().tolist() == ["adam", "sgd"] * 2
+    momentum = columns["train.optimizer.momentum"]
+    assert isinstance(momentum, np.ma.MaskedArray)
+    assert momentum.mask.tolist() == [True, False, True, False]
+    assert momentum.compressed().tolist() == [0.5, 0.5]
+    assert columns["train.optimizer.betas"].mask.tolist() == [False, True, False, True]
+    assert columns["wandb"].codes.tolist() == [0, -1, -1, -1]
+    assert columns["wandb.project"].decode().tolist() == ["p", None, None, None]
+    assert columns["max_steps"].mask.tolist() == [True, False, True, False]
+
+
+def test_to_columns_rejects_mixed_classes():
+    assert to_columns([]) == {}
+    with pytest.raises(TypeError, match="single class"):
+        to_columns([RunConfig(), TrainConfig()])
@@ -0,0 +1,103 @@
+"""Tests for the shell completion index."""
+
+import enum
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Literal
+
+import pytest
+
+from pydantic_config import BaseConfig
+from pydantic_config.completion import bash_script, completion_index, write_completion_index
+
+
+class Precision(enum.Enum):
+    fp32 = "fp32"
+    bf16 = "bf16"
+
+
+class TrainConfig(BaseConfig):
+    lr: float = 1e-4
+    precision: Precision = Precision.bf16
+    compile: bool = False
+
+
+class WandbConfig(BaseConfig):
+    project: str = "default"
+
+
+class CompletionConfig(BaseConfig):
+    train: TrainConfig = TrainConfig()
+    wandb: WandbConfig | None = None
+    mode: Literal["train", "eval"] = "train"
+    output_dir: Path = Path("out")
+    extra_kwargs: dict = {}
+
+
+def parse_index(text: str) -> dict[str, tuple[str, str]]:
+    entries = {}
+    for line in text.splitlines():
+        if not line.startswith("#"):
+            flag, kind, choices = line.split("\t")
+            entries[flag] = (kind, choices)
+    return entries
+
+
+def test_completion_index_entries():
+    entries = parse_index(completion_index(CompletionConfig))
+    assert entries["--train"] == ("section", "")
+    assert entries["--train.lr"] == ("value", "")
+    assert entries["--train.precision"] == ("choice", "fp32 bf16")
+    assert entries["--train.compile"] == ("flag", "")
+    assert entries["--train.no-compile"] == ("flag", "")
+    assert entries["--wandb"] == ("section", "")
+    assert entries["--wandb.project"] == ("value", "")
+    assert entries["--mode"] == ("choice", "train eval")
+    assert entries["--output-dir"] == ("path", "")
+    assert entries["--extra-kwargs"] == ("value", "")
+    assert "--help" in entries
+
+
+def test_completion_index_records_schema_and_sources():
+    lines = completion_index(CompletionConfig).splitlines()
+    assert lines[0].startswith("#schema\t")
+    assert f"#source\t{os.path.abspath(__file__)}" in lines
+
+
+def test_write_completion_index_only_rewrites_on_schema_change(tmp_path):
+    path = str(tmp_path / "cache" / "train.completion")
+    assert write_completion_index(CompletionConfig, path) is True
+    assert write_completion_index(CompletionConfig, path) is False
+
+    class OtherConfig(BaseConfig):
+        seed: int = 0
+
+    assert write_completion_index(OtherConfig, path) is True
+    assert "--seed" in parse_index(open(path).read())
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+@pytest.mark.parametrize(
+    "words,expected",
+    [
+        (["train.py", "--train.pre"], ["--train.precision"]),
+        (["train.py", "--train.precision", ""], ["fp32", "bf16"]),
+        (["train.py", "--mode", "e"], ["eval"]),
+        (["train.py", "--train", ""], ["@"]),
+        (["train.py", "@", "con"], ["configs/"]),
+        (["train.py", "@", "configs/"], ["configs/run.toml"]),
+    ],
+)
+def test_bash_completion(tmp_path, words, expected):
+    index = str(tmp_path / "train.completion")
+    write_completion_index(CompletionConfig, index)
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "configs" / "run.toml").write_text("")
+    (tmp_path / "configs" / "notes.txt").write_text("")
+    script = bash_script("train.py", f"{__name__}:CompletionConfig", index, python="false")
+    quoted = " ".join(f"'{w}'" for w in words)
+    driver = f'{script}\nCOMP_WORDS=({quoted})\nCOMP_CWORD={len(words) - 1}\n_pydantic_config_complete_train_py\nprintf "%s\\n" "${{COMPREPLY[@]}}"\n'
+    result = subprocess.run(["bash", "-c", driver], cwd=tmp_path, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == expected
@@ -0,0 +1,75 @@
+"""Tests for the validation profiler."""
+
+import time
+
+import pytest
+from pydantic import field_validator, model_validator
+
+from pydantic_config import BaseConfig, cli
+from pydantic_config.profile import profile_validation
+
+
+class DataConfig(BaseConfig):
+    path: str = "data"
+
+    @field_validator("path")
+    @classmethod
+    def check_path(cls, value: str) -> str:
+        time.sleep(0.02)
+        return value
+
+
+class ItemConfig(BaseConfig):
+    n: int = 0
+
+
+class ProfiledConfig(BaseConfig):
+    data: DataConfig = DataConfig()
+    items: list[ItemConfig] = []
+    seed: int = 0
+
+    @model_validator(mode="after")
+    def check(self) -> "ProfiledConfig":
+        return self
+
+
+def test_profile_attributes_time_to_paths():
+    with profile_validation(ProfiledConfig) as profile:
+        ProfiledConfig.model_validate({"data": {"path": "x"}, "items": [{"n": 1}] * 10})
+    rows = {(row.path, row.kind, row.name): row for row in profile.rows()}
+
+    slowest = profile.rows()[0]
+    assert (slowest.path, slowest.kind, slowest.name) == ("data.path", "validator", "DataConfig.check_path")
+    assert slowest.self_time >= 0.02
+    assert rows[("items[]", "model", "ItemConfig")].calls == 10
+    assert ("(root)", "validator", "ProfiledConfig.check") in rows
+    data = rows[("data", "model", "DataConfig")]
+    assert data.total >= slowest.total > data.self_time
+    assert "data.path" in profile.table(limit=1)
+
+
+def test_profile_is_removed_after_the_block():
+    with profile_validation(ProfiledConfig):
+        pass
+    for model in (ProfiledConfig, DataConfig, ItemConfig):
+        assert "__pydantic_config_profile__" not in model.__pydantic_decorators__.model_validators
+    assert not hasattr(DataConfig.__pydantic_decorators__.field_validators["check_path"].func, "__wrapped__")
+    assert ProfiledConfig(data={"path": "y"}).data.path == "y"
+
+
+def test_cli_prints_profile(capsys):
+    config = cli(ProfiledConfig, args=["--data.path", "other"], profile_validation=True)
+    assert config.data.path == "other"
+    err = capsys.readouterr().err
+    assert "validator DataConfig.check_path" in err
+    assert "ms of validation in total" in err
+
+
+def test_profile_fails_clearly_without_pydantic_internals(monkeypatch):
+    from pydantic_config import profile
+
+    monkeypatch.setattr(profile, "Decorator", None)
+    with pytest.raises(ImportError, match="pydantic internals"):
+        with profile_validation(ProfiledConfig):
+            pass
+    assert "__pydantic_config_profile__" not in ProfiledConfig.__pydantic_decorators__.model_validators
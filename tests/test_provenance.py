@@ -0,0 +1,112 @@
+"""Tests for the provenance index."""
+
+import json
+import os
+from typing import Any
+
+import pytest
+
+from pydantic_config import BaseConfig, cli, explain
+from pydantic_config.provenance import (
+    ProvenanceIndex,
+    ValueSource,
+    _json_key_lines,
+    _toml_key_lines,
+    _yaml_key_lines,
+)
+
+
+class TrainConfig(BaseConfig):
+    lr: float = 1e-3
+    batch_size: int = 8
+    tags: list[str] = []
+
+
+class WandbConfig(BaseConfig):
+    project: str = "default"
+
+
+class RunConfig(BaseConfig):
+    train: TrainConfig = TrainConfig()
+    wandb: WandbConfig | None = None
+    seed: int = 0
+    name: str = "run"
+    kwargs: dict[str, Any] = {}
+
+
+def test_explain_every_source(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "run.toml").write_text('seed = 1\nname = "file"\n\n[train]\nlr = 0.5\nbatch_size = 16\n')
+    (tmp_path / "train.json").write_text(json.dumps({"lr": 0.25, "tags": ["a"]}, indent=2))
+    monkeypatch.setenv("APP__SEED", "5")
+
+    args = ["@", "run.toml", "--train", "@", "train.json", "--wandb", "--kwargs", '{"a": 1}', "--train.batch-size=4"]
+    config = cli(RunConfig, args=args, env_prefix="APP", provenance=True)
+
+    assert str(explain(config, "train.lr")) == "train.json:2"
+    assert str(explain(config, "train.tags")) == "train.json:3"
+    assert str(explain(config, "name")) == "run.toml:2"
+    assert str(explain(config, "seed")) == "environment (APP__SEED)"
+    assert str(explain(config, "train.batch-size")) == "command line (--train.batch-size)"
+    assert str(explain(config, "wandb")) == "command line (--wandb)"
+    assert explain(config, "wandb.project").source == "default"
+    assert str(explain(config, "kwargs.a")) == "command line (--kwargs)"
+    with pytest.raises(ValueError, match="section"):
+        explain(config, "train")
+
+
+def test_explain_with_select(tmp_path):
+    path = tmp_path / "run.toml"
+    path.write_text("seed = 1\n[train]\nlr = 0.5\n")
+    config = cli(RunConfig, args=["@", str(path), "--batch-size", "2"], select="train", provenance=True)
+    assert explain(config, "lr").line == 3
+    assert explain(config, "batch_size").source == "command line"
+    assert explain(config, "tags").source == "default"
+
+
+def test_explain_requires_provenance():
+    with pytest.raises(ValueError, match="provenance=True"):
+        explain(cli(RunConfig, args=[]), "seed")
+
+
+def test_key_lines():
+    assert _toml_key_lines('a = 1\n[b.c]\nd = 2\n"e".f = 3\n') == {"a": 1, "b.c": 2, "b.c.d": 3, "b.c.e.f": 4}
+    assert _yaml_key_lines("a: 1\nb:\n  c: 2\n  d:\n    - x\ne: 3\n") == {"a": 1, "b": 2, "b.c": 3, "b.d": 4, "e": 6}
+    text = '{\n  "a": {"b": 1,\n    "c": [{"d": 2}]},\n  "e": 3\n}'
+    assert _json_key_lines(text) == {"a": 2, "a.b": 2, "a.c": 3, "e": 4}
+
+
+def test_toml_key_lines_skip_multiline_strings_and_arrays():
+    text = 'notes = """\nlr = 5\n"""\ntags = [\n  "seed = 1",\n]\nlr = 0.5\n[t]\nx = \'\'\'a\n[u]\n\'\'\'\ny = 1\n'
+    assert _toml_key_lines(text) == {"notes": 1, "tags": 4, "lr": 7, "t": 8, "t.x": 9, "t.y": 12}
+
+
+def test_explain_yaml_merge_keys(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "run.yaml"
+    path.write_text("base: &base\n  lr: 0.5\n  batch_size: 4\ntrain:\n  <<: *base\n  batch_size: 16\n")
+
+    class Config(BaseConfig):
+        base: dict[str, Any] = {}
+        train: TrainConfig = TrainConfig()
+
+    config = cli(Config, args=["@", str(path)], provenance=True)
+    assert config.train.lr == 0.5
+    assert explain(config, "train.lr").line == 2
+    assert explain(config, "train.batch_size").line == 6
+
+
+def test_lines_dropped_for_file_edited_while_loading(tmp_path):
+    path = tmp_path / "run.json"
+    path.write_text('{"seed": 1}')
+    index = ProvenanceIndex()
+
+    def loader(file: str) -> dict:
+        data = json.loads(path.read_text())
+        path.write_text('{\n\n"name": "x", "seed": 1}')
+        os.utime(path, ns=(5_000_000_000, 5_000_000_000))
+        return data
+
+    data = index.load_file(str(path), loader)
+    index.record_files(RunConfig, [(None, str(path), data)])
+    assert index.explain(RunConfig, "seed") == ValueSource("seed", str(path), None)
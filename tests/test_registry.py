@@ -0,0 +1,132 @@
+"""Tests for the registry module (lazily imported union variants)."""
+
+import importlib.metadata
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_config import BaseConfig, ConfigFileError, VariantRegistry, cli
+
+
+def write_file(path: str, content: str):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+VARIANT_MODULES = {
+    "heavy_adam_variant": """
+from typing import Literal
+from pydantic_config import BaseConfig
+
+class AdamConfig(BaseConfig):
+    type: Literal["adam"] = "adam"
+    lr: float = 1e-3
+""",
+    "heavy_sgd_variant": """
+from typing import Literal
+from pydantic_config import BaseConfig
+
+class SGDConfig(BaseConfig):
+    type: Literal["sgd"] = "sgd"
+    lr: float = 1e-2
+    momentum: float = 0.9
+""",
+}
+
+
+@pytest.fixture
+def variant_modules(tmp_path, monkeypatch):
+    for name, source in VARIANT_MODULES.items():
+        write_file(str(tmp_path / f"{name}.py"), source)
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in VARIANT_MODULES:
+        sys.modules.pop(name, None)
+
+
+def make_config():
+    optimizers = VariantRegistry(
+        "optimizer",
+        {"adam": "heavy_adam_variant:AdamConfig", "sgd": "heavy_sgd_variant:SGDConfig"},
+    )
+
+    class Config(BaseConfig):
+        optimizer: optimizers.field_type = {"type": "adam"}
+        steps: int = 10
+
+    return Config
+
+
+def test_registry_imports_only_selected_variant(variant_modules):
+    Config = make_config()
+    assert "heavy_adam_variant" not in sys.modules
+
+    config = cli(Config, args=["--optimizer.type", "sgd", "--optimizer.momentum", "0.5"])
+    assert type(config.optimizer).__name__ == "SGDConfig"
+    assert config.optimizer.momentum == 0.5
+    assert "heavy_sgd_variant" in sys.modules
+    assert "heavy_adam_variant" not in sys.modules
+
+
+def test_registry_help_imports_nothing(variant_modules, capsys):
+    Config = make_config()
+    with pytest.raises(SystemExit):
+        cli(Config, args=["--help"])
+    assert "heavy_adam_variant" not in sys.modules
+    assert "heavy_sgd_variant" not in sys.modules
+
+
+def test_registry_default_variant(variant_modules):
+    config = cli(make_config(), args=["--steps", "3"])
+    assert type(config.optimizer).__name__ == "AdamConfig"
+    assert config.steps == 3
+
+
+def test_registry_default_type_injected_for_file(variant_modules, tmp_path):
+    config_file = str(tmp_path / "config.toml")
+    write_file(config_file, "[optimizer]\nlr = 0.5")
+    config = cli(make_config(), args=["@", config_file])
+    assert type(config.optimizer).__name__ == "AdamConfig"
+    assert config.optimizer.lr == 0.5
+
+
+def test_registry_validation_errors(variant_modules, tmp_path):
+    Config = make_config()
+    with pytest.raises(ValidationError, match="optimizer.lr"):
+        Config.model_validate({"optimizer": {"type": "adam", "lr": "fast"}})
+    with pytest.raises(ValidationError, match="unknown optimizer type 'rmsprop'"):
+        Config.model_validate({"optimizer": {"type": "rmsprop"}})
+
+    config_file = str(tmp_path / "config.toml")
+    write_file(config_file, '[optimizer]\ntype = "sgd"\nmomentum = "high"')
+    with pytest.raises(ConfigFileError, match="Failed to validate"):
+        cli(Config, args=["@", config_file])
+
+
+def test_registry_dump_round_trip(variant_modules):
+    Config = make_config()
+    config = Config.model_validate({"optimizer": {"type": "sgd"}})
+    dumped = config.model_dump()
+    assert dumped["optimizer"] == {"type": "sgd", "lr": 1e-2, "momentum": 0.9}
+    assert Config.model_validate_json(config.model_dump_json()) == config
+
+
+def test_registry_entry_points(variant_modules, monkeypatch):
+    def fake_entry_points(group=None):
+        assert group == "test.optimizers"
+        return [importlib.metadata.EntryPoint(name="sgd", value="heavy_sgd_variant:SGDConfig", group=group)]
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", fake_entry_points)
+    optimizers = VariantRegistry("optimizer", entry_point_group="test.optimizers")
+    assert optimizers.tags() == ["sgd"]
+    assert "heavy_sgd_variant" not in sys.modules
+    assert optimizers.load("sgd").__name__ == "SGDConfig"
+
+
+def test_plain_dict_default_with_type_key_not_injected():
+    class Config(BaseConfig):
+        meta: dict = {"type": "x"}
+
+    assert Config.model_validate({"meta": {"a": 1}}).meta == {"a": 1}
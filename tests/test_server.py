@@ -0,0 +1,135 @@
+"""Tests for the config server and the cli() client."""
+
+import os
+import threading
+
+import pytest
+from pydantic import Field, SecretStr, field_validator
+
+from pydantic_config import BaseConfig, ConfigFileError, cli
+from pydantic_config.server import ConfigServer
+
+
+def write_file(path: str, content: str):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class TrainConfig(BaseConfig):
+    lr: float = 1e-4
+    epochs: int = 1
+
+
+class ServeConfig(BaseConfig):
+    train: TrainConfig = TrainConfig()
+    name: str = "run"
+
+
+class SecretConfig(BaseConfig):
+    token: SecretStr = SecretStr("")
+    cache_dir: str = Field("cache", exclude=True)
+    batch: int = 1
+
+    @field_validator("batch")
+    @classmethod
+    def per_device(cls, value: int) -> int:
+        return value * 2
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    server = ConfigServer(str(tmp_path / "s.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("PYDANTIC_CONFIG_SOCKET", server.socket_path)
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_cli_resolves_through_server(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_file("run.toml", 'name = "served"\n[train]\nlr = 0.5')
+    config = cli(ServeConfig, args=["@", "run.toml", "--train.epochs", "3"])
+    assert config == ServeConfig(name="served", train=TrainConfig(lr=0.5, epochs=3))
+    assert server.requests_handled == 1
+
+
+def test_server_reparses_changed_files(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_file("run.toml", "[train]\nlr = 0.5")
+    assert cli(ServeConfig, args=["@", "run.toml"]).train.lr == 0.5
+    write_file("run.toml", "[train]\nlr = 0.25")
+    assert cli(ServeConfig, args=["@", "run.toml"]).train.lr == 0.25
+    assert server.requests_handled == 2
+
+
+def test_server_select_and_env(server, monkeypatch):
+    monkeypatch.setenv("APP__TRAIN__EPOCHS", "7")
+    config = cli(ServeConfig, args=["--train.lr", "0.1"], select="train", env_prefix="APP")
+    assert config == TrainConfig(lr=0.1, epochs=7)
+    assert server.requests_handled == 1
+
+
+def test_server_config_errors_raise(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_file("bad.toml", '[train]\nlr = "fast"')
+    with pytest.raises(ConfigFileError) as excinfo:
+        cli(ServeConfig, args=["@", "bad.toml"])
+    assert server.requests_handled == 1
+    # Validation errors are re-raised by the client with their structure
+    assert excinfo.value.model is ServeConfig
+    assert [error["loc"] for error in excinfo.value.errors] == [("train", "lr")]
+    with pytest.raises(ConfigFileError, match="missing.toml"):
+        cli(ServeConfig, args=["@", "missing.toml"])
+    assert server.requests_handled == 2
+
+
+def test_cli_falls_back_for_local_classes(server):
+    class LocalConfig(BaseConfig):
+        x: int = 1
+
+    assert cli(LocalConfig, args=["--x", "2"]).x == 2
+    assert server.requests_handled == 0
+
+
+def test_cli_falls_back_on_argument_errors(server):
+    with pytest.raises(SystemExit):
+        cli(ServeConfig, args=["--no-such-flag"])
+    assert server.requests_handled == 1
+
+
+def test_cli_without_server(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYDANTIC_CONFIG_SOCKET", str(tmp_path / "missing.sock"))
+    assert cli(ServeConfig, args=["--name", "local"]).name == "local"
+
+
+def test_server_result_is_not_revalidated(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_file("run.toml", 'token = "s3cret"\ncache_dir = "/scratch"')
+    config = cli(SecretConfig, args=["@", "run.toml", "--batch", "3"])
+    assert config.token.get_secret_value() == "s3cret"
+    assert config.cache_dir == "/scratch"
+    assert config.batch == 6
+    assert server.requests_handled == 1
+
+
+def test_server_env_prefix_is_normalized(server, monkeypatch):
+    monkeypatch.setenv("APP__TRAIN__EPOCHS", "7")
+    assert cli(ServeConfig, args=[], env_prefix="app").train.epochs == 7
+    assert server.requests_handled == 1
+
+
+def test_cli_ignores_sockets_of_other_users(server, monkeypatch):
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    assert cli(ServeConfig, args=["--name", "local"]).name == "local"
+    assert server.requests_handled == 0
+
+
+def test_cli_ignores_non_socket_path(tmp_path, monkeypatch):
+    path = tmp_path / "fake.sock"
+    path.write_text("")
+    monkeypatch.setenv("PYDANTIC_CONFIG_SOCKET", str(path))
+    assert cli(ServeConfig, args=["--name", "local"]).name == "local"
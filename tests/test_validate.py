@@ -0,0 +1,136 @@
+"""Tests for the validate module (batch validation CLI)."""
+
+import os
+
+from pydantic_config import BaseConfig
+from pydantic_config.__main__ import main
+from pydantic_config.validate import validate_files
+
+
+def write_file(path: str, content: str):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class TrainConfig(BaseConfig):
+    lr: float = 1e-4
+    epochs: int = 1
+
+
+class ExperimentConfig(BaseConfig):
+    train: TrainConfig = TrainConfig()
+    name: str
+
+
+def make_configs(tmp_path, n_valid: int = 3, n_invalid: int = 1):
+    configs_dir = tmp_path / "configs" / "sub"
+    configs_dir.mkdir(parents=True)
+    for i in range(n_valid):
+        write_file(str(configs_dir / f"ok_{i}.toml"), f'name = "run{i}"\n[train]\nlr = 0.{i + 1}')
+    for i in range(n_invalid):
+        write_file(str(configs_dir / f"bad_{i}.yaml"), "name: bad\ntrain:\n  lr: fast")
+    return str(tmp_path / "configs")
+
+
+def test_validate_files_reports_errors(tmp_path):
+    configs = make_configs(tmp_path)
+    report = validate_files(ExperimentConfig, [configs], jobs=1, cache_path=None)
+    assert report.checked == 4
+    assert list(report.errors) == [os.path.join(configs, "sub", "bad_0.yaml")]
+    assert "Failed to validate config" in next(iter(report.errors.values()))
+
+
+def test_validate_files_glob_pattern(tmp_path):
+    configs = make_configs(tmp_path)
+    report = validate_files(ExperimentConfig, [f"{configs}/**/*.toml"], jobs=1, cache_path=None)
+    assert report.checked == 3
+    assert report.ok
+
+
+def test_validate_files_process_pool(tmp_path):
+    configs = make_configs(tmp_path, n_valid=8, n_invalid=2)
+    report = validate_files(ExperimentConfig, [configs], jobs=2, cache_path=None)
+    assert report.checked == 10
+    assert len(report.errors) == 2
+
+
+def test_validate_files_cache_skips_unchanged(tmp_path):
+    configs = make_configs(tmp_path)
+    cache_path = str(tmp_path / "cache.json")
+
+    first = validate_files(ExperimentConfig, [configs], jobs=1, cache_path=cache_path)
+    assert first.cached == 0
+
+    second = validate_files(ExperimentConfig, [configs], jobs=1, cache_path=cache_path)
+    assert second.cached == 3
+    assert len(second.errors) == 1
+
+    write_file(os.path.join(configs, "sub", "ok_0.toml"), 'name = "changed"')
+    third = validate_files(ExperimentConfig, [configs], jobs=1, cache_path=cache_path)
+    assert third.cached == 2
+
+
+def test_validate_files_cache_invalidated_by_schema(tmp_path):
+    configs = make_configs(tmp_path, n_invalid=0)
+    cache_path = str(tmp_path / "cache.json")
+    validate_files(ExperimentConfig, [configs], jobs=1, cache_path=cache_path)
+
+    class OtherConfig(BaseConfig):
+        train: TrainConfig = TrainConfig()
+        name: str
+        seed: int = 0
+
+    report = validate_files(OtherConfig, [configs], jobs=1, cache_path=cache_path)
+    assert report.cached == 0
+
+
+def test_validate_main_exit_code(tmp_path, capsys):
+    configs = make_configs(tmp_path)
+    target = f"{__name__}:ExperimentConfig"
+    assert main(["validate", target, configs, "-j", "1", "--no-cache"]) == 1
+    err = capsys.readouterr().err
+    assert "Validated 4 files (0 cached, 1 failed)" in err
+
+    assert main(["validate", target, f"{configs}/**/*.toml", "-j", "1", "--no-cache"]) == 0
+
+
+def test_validate_main_bad_target(capsys):
+    assert main(["validate", "no_such_module:Config", "x.toml"]) == 1
+    assert "Cannot import config class" in capsys.readouterr().err
+
+
+def test_schema_fingerprint_independent_of_hash_seed(tmp_path):
+    import subprocess
+    import sys
+
+    write_file(
+        str(tmp_path / "seeded_config.py"),
+        "from pydantic import field_validator\n"
+        "from pydantic_config import BaseConfig\n\n"
+        "class SeededConfig(BaseConfig):\n"
+        '    mode: str = "a"\n'
+        '    tags: frozenset[str] = frozenset({"x", "y", "z", "w"})\n\n'
+        '    @field_validator("mode")\n'
+        "    @classmethod\n"
+        "    def check_mode(cls, v):\n"
+        '        if v not in {"a", "b", "c", "d"}:\n'
+        '            raise ValueError("bad mode")\n'
+        '        return [m for m in (v,) if m in {"a", "b"}][0] if v in {"a", "b"} else v\n',
+    )
+    script = (
+        "from seeded_config import SeededConfig\n"
+        "from pydantic_config.cli import _schema_fingerprint\n"
+        "print(_schema_fingerprint(SeededConfig))"
+    )
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=tmp_path,
+            env={**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": str(tmp_path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("0", "1", "2")
+    }
+    assert len(fingerprints) == 1
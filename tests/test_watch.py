@@ -0,0 +1,153 @@
+"""Tests for the watch module."""
+
+import os
+from typing import Any
+
+from pydantic_config import BaseConfig
+from pydantic_config.watch import ConfigWatcher
+
+
+def write_file(path: str, content: str, mtime_ns: int | None = None):
+    with open(path, "w") as f:
+        f.write(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TrainConfig(BaseConfig):
+    lr: float = 1e-4
+    epochs: int = 1
+
+
+class ModelConfig(BaseConfig):
+    hidden_size: int = 256
+
+
+class ServeConfig(BaseConfig):
+    train: TrainConfig = TrainConfig()
+    model: ModelConfig = ModelConfig()
+    name: str = "server"
+
+
+def test_watcher_records_files(tmp_path):
+    root = str(tmp_path / "root.toml")
+    model = str(tmp_path / "model.toml")
+    write_file(root, "[train]\nlr = 0.1")
+    write_file(model, "hidden_size = 512")
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root, "--model", "@", model])
+    assert sorted(watcher.files) == sorted([root, model])
+    assert watcher.config.train.lr == 0.1
+    assert watcher.config.model.hidden_size == 512
+
+
+def test_watcher_no_change_no_reload(tmp_path):
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[train]\nlr = 0.1")
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root])
+    assert watcher.check() is False
+
+
+def test_watcher_incremental_reload_shares_untouched(tmp_path):
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[train]\nlr = 0.1\n[model]\nhidden_size = 512", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root])
+    old = watcher.config
+    changes = []
+    watcher.on_change(lambda config, diff: changes.append(diff))
+
+    write_file(root, "[train]\nlr = 0.2\n[model]\nhidden_size = 512", mtime_ns=2_000_000_000)
+    assert watcher.check() is True
+
+    new = watcher.config
+    assert new.train.lr == 0.2
+    assert new.model is old.model
+    assert changes == [{"train.lr": (0.1, 0.2)}]
+
+
+def test_watcher_only_reparses_changed_file(tmp_path):
+    root = str(tmp_path / "root.toml")
+    model = str(tmp_path / "model.toml")
+    write_file(root, "[train]\nlr = 0.1", mtime_ns=1_000_000_000)
+    write_file(model, "hidden_size = 512", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root, "--model", "@", model])
+    parsed_model = watcher._parsed[model]
+
+    write_file(root, "[train]\nlr = 0.3", mtime_ns=2_000_000_000)
+    watcher.check()
+    assert watcher._parsed[model] is parsed_model
+    assert watcher.config.train.lr == 0.3
+
+
+def test_watcher_keeps_cli_overrides(tmp_path):
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[train]\nlr = 0.1\nepochs = 2", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root, "--train.lr", "0.5"])
+    assert watcher.config.train.lr == 0.5
+
+    write_file(root, "[train]\nlr = 0.9\nepochs = 3", mtime_ns=2_000_000_000)
+    watcher.check()
+    assert watcher.config.train.lr == 0.5
+    assert watcher.config.train.epochs == 3
+
+
+def test_watcher_removed_key_falls_back_to_full_resolve(tmp_path):
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[train]\nlr = 0.1\nepochs = 2\n", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root])
+    write_file(root, "[train]\nlr = 0.1\n", mtime_ns=2_000_000_000)
+    assert watcher.check() is True
+    assert watcher.config.train.epochs == 1
+
+
+def test_watcher_invalid_change_keeps_previous_config(tmp_path):
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[train]\nlr = 0.1", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root])
+    errors = []
+    watcher.on_error(errors.append)
+
+    write_file(root, '[train]\nlr = "fast"', mtime_ns=2_000_000_000)
+    assert watcher.check() is False
+    assert watcher.config.train.lr == 0.1
+    assert len(errors) == 1
+
+
+def test_watcher_reports_deleted_file_once(tmp_path):
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[train]\nlr = 0.1", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(ServeConfig, ["@", root])
+    errors = []
+    watcher.on_error(errors.append)
+
+    os.remove(root)
+    assert watcher.check() is False
+    assert watcher.check() is False
+    assert len(errors) == 1
+
+    write_file(root, "[train]\nlr = 0.2", mtime_ns=3_000_000_000)
+    assert watcher.check() is True
+    assert watcher.config.train.lr == 0.2
+
+
+def test_watcher_keeps_untouched_keys_of_dict_fields(tmp_path):
+    class KwargsModel(BaseConfig):
+        kwargs: dict[str, Any] = {}
+
+    class KwargsConfig(BaseConfig):
+        model: KwargsModel = KwargsModel()
+
+    root = str(tmp_path / "root.toml")
+    write_file(root, "[model.kwargs]\ndropout = 0.0\nheads = 8", mtime_ns=1_000_000_000)
+
+    watcher = ConfigWatcher(KwargsConfig, ["@", root])
+    write_file(root, "[model.kwargs]\ndropout = 0.1\nheads = 8", mtime_ns=2_000_000_000)
+    assert watcher.check() is True
+    assert watcher.config.model.kwargs == {"dropout": 0.1, "heads": 8}